@@ -0,0 +1,38 @@
+from dataclasses import dataclass
+
+from src.core.cast_member.application.create_cast_member import CreateCastMember
+from src.core.cast_member.domain.cast_member import CastMember
+from src.core.cast_member.domain.errors import InvalidCastMemberTypeError
+from src.core.shared.application.bulk import (
+    BulkCreateOutput,
+    BulkItemError,
+    validate_bulk_size,
+)
+from src.core.shared.application.unit_of_work import AbstractUnitOfWork
+
+
+class BulkCreateCastMembers:
+    @dataclass
+    class Input:
+        items: list[CreateCastMember.Input]
+
+    def __init__(self, unit_of_work: AbstractUnitOfWork):
+        self.unit_of_work = unit_of_work
+
+    def execute(self, input: Input) -> BulkCreateOutput:
+        validate_bulk_size(len(input.items))
+
+        output = BulkCreateOutput()
+
+        for index, item in enumerate(input.items):
+            try:
+                cast_member = CastMember(name=item.name, type=item.type)
+            except (ValueError, InvalidCastMemberTypeError) as exc:
+                output.errors.append(BulkItemError(index=index, error=str(exc)))
+            else:
+                self.unit_of_work.register_new(cast_member)
+                output.ids.append(cast_member.id)
+
+        self.unit_of_work.commit()
+
+        return output
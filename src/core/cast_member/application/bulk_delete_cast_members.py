@@ -0,0 +1,24 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+from src.core.cast_member.gateway.cast_member_gateway import (
+    AbstractCastMemberRepository,
+)
+from src.core.shared.application.bulk import BulkDeleteOutput, validate_bulk_size
+
+
+class BulkDeleteCastMembers:
+    @dataclass
+    class Input:
+        ids: list[UUID]
+
+    def __init__(self, repository: AbstractCastMemberRepository):
+        self.repository = repository
+
+    def execute(self, input: Input) -> BulkDeleteOutput:
+        ids = list(dict.fromkeys(input.ids))
+        validate_bulk_size(len(ids))
+
+        missing_ids = self.repository.delete_many(set(ids))
+
+        return BulkDeleteOutput(missing_ids=[id for id in ids if id in missing_ids])
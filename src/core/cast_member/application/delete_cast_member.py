@@ -16,9 +16,5 @@ class DeleteCastMember:
         self.repository = repository
 
     def execute(self, input: Input) -> None:
-        cast_member = self.repository.get_by_id(id=input.id)
-
-        if cast_member is None:
+        if not self.repository.delete(id=input.id):
             raise CastMemberNotFound()
-
-        self.repository.delete(id=cast_member.id)
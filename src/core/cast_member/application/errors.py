@@ -4,3 +4,7 @@ class InvalidCastMemberData(Exception):
 
 class CastMemberNotFound(Exception):
     pass
+
+
+class CastMemberVersionConflict(Exception):
+    pass
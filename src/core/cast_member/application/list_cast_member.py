@@ -13,6 +13,7 @@ class CastMemberOutput:
 
 
 class ListCastMembers(PaginatedListUseCase[CastMember, CastMemberOutput]):
+    output_class = CastMemberOutput
     default_order_by_field = "name"
     order_by_fields = [
         "name",
@@ -3,6 +3,7 @@ from uuid import UUID
 
 from src.core.cast_member.application.errors import (
     CastMemberNotFound,
+    CastMemberVersionConflict,
     InvalidCastMemberData,
 )
 from src.core.cast_member.domain.errors import InvalidCastMemberTypeError
@@ -17,12 +18,14 @@ class UpdateCastMember:
         id: UUID
         name: str | None = None
         type: str | None = None
+        version: int | None = None
 
     @dataclass
     class Output:
         id: UUID
         name: str
         type: str
+        version: int
 
     def __init__(self, repository: AbstractCastMemberRepository):
         self.repository = repository
@@ -33,6 +36,9 @@ class UpdateCastMember:
         if cast_member is None:
             raise CastMemberNotFound()
 
+        if input.version is not None and input.version != cast_member.version:
+            raise CastMemberVersionConflict()
+
         try:
             if input.name is not None:
                 cast_member.update_name(name=input.name)
@@ -45,10 +51,12 @@ class UpdateCastMember:
         except InvalidCastMemberTypeError as exc:
             raise InvalidCastMemberData(exc)
 
-        self.repository.update(cast_member=cast_member)
+        if not self.repository.update(cast_member=cast_member):
+            raise CastMemberVersionConflict()
 
         return UpdateCastMember.Output(
             id=cast_member.id,
             name=cast_member.name,
             type=cast_member.type,
+            version=cast_member.version,
         )
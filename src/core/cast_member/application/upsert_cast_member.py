@@ -0,0 +1,68 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+from src.core.cast_member.application.errors import (
+    CastMemberVersionConflict,
+    InvalidCastMemberData,
+)
+from src.core.cast_member.domain.cast_member import CastMember
+from src.core.cast_member.domain.errors import InvalidCastMemberTypeError
+from src.core.cast_member.gateway.cast_member_gateway import (
+    AbstractCastMemberRepository,
+)
+from src.core.shared.application.errors import StaleEntitiesError
+from src.core.shared.application.unit_of_work import AbstractUnitOfWork
+
+
+class UpsertCastMember:
+    @dataclass
+    class Input:
+        id: UUID
+        name: str
+        type: str
+        version: int | None = None
+
+    @dataclass
+    class Output:
+        id: UUID
+        name: str
+        type: str
+        version: int
+        created: bool
+
+    def __init__(
+        self,
+        repository: AbstractCastMemberRepository,
+        unit_of_work: AbstractUnitOfWork,
+    ):
+        self.repository = repository
+        self.unit_of_work = unit_of_work
+
+    def execute(self, input: Input) -> Output:
+        try:
+            cast_member = CastMember(
+                id=input.id,
+                name=input.name,
+                type=input.type,
+            )
+        except (ValueError, InvalidCastMemberTypeError) as exc:
+            raise InvalidCastMemberData(exc)
+
+        if input.version is None:
+            created = self.repository.upsert(cast_member=cast_member)
+        else:
+            cast_member.version = input.version
+            try:
+                with self.unit_of_work:
+                    self.unit_of_work.register_dirty(cast_member)
+            except StaleEntitiesError:
+                raise CastMemberVersionConflict()
+            created = False
+
+        return UpsertCastMember.Output(
+            id=cast_member.id,
+            name=cast_member.name,
+            type=cast_member.type,
+            version=cast_member.version,
+            created=created,
+        )
@@ -1,7 +1,10 @@
 from abc import ABC, abstractmethod
+from typing import Any
 from uuid import UUID
 
 from src.core.cast_member.domain.cast_member import CastMember
+from src.core.shared.application.count import TotalMode
+from src.core.shared.application.cursor import Cursor
 
 
 class AbstractCastMemberRepository(ABC):
@@ -9,26 +12,78 @@ class AbstractCastMemberRepository(ABC):
     def save(self, cast_member: CastMember) -> None:
         raise NotImplementedError()
 
+    @abstractmethod
+    def save_many(self, cast_members: list[CastMember]) -> None:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def update_many(self, cast_members: list[CastMember]) -> set[UUID]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def delete_many(self, ids: set[UUID]) -> set[UUID]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def upsert(self, cast_member: CastMember) -> bool:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def upsert_many(self, cast_members: list[CastMember]) -> set[UUID]:
+        raise NotImplementedError()
+
     @abstractmethod
     def get_by_id(self, id: UUID) -> CastMember | None:
         raise NotImplementedError()
 
+    @abstractmethod
+    def list_after(
+        self,
+        cursor: Cursor | None,
+        order_by: str,
+        limit: int,
+    ) -> list[CastMember]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def list_values_after(
+        self,
+        fields: list[str],
+        cursor: Cursor | None,
+        order_by: str,
+        limit: int,
+    ) -> list[dict[str, Any]]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def list_values(
+        self,
+        fields: list[str],
+        order_by: str | None = None,
+        page: int | None = None,
+        page_size: int | None = None,
+        with_total: bool = False,
+    ) -> list[dict[str, Any]]:
+        raise NotImplementedError()
+
     @abstractmethod
     def list(
         self,
         order_by: str | None = None,
         page: int | None = None,
+        page_size: int | None = None,
+        with_total: bool = False,
     ) -> list[CastMember]:
         raise NotImplementedError()
 
     @abstractmethod
-    def count(self) -> int:
+    def count(self, mode: TotalMode = TotalMode.EXACT) -> int:
         raise NotImplementedError
 
     @abstractmethod
-    def update(self, cast_member: CastMember) -> None:
+    def update(self, cast_member: CastMember) -> bool:
         raise NotImplementedError()
 
     @abstractmethod
-    def delete(self, id: UUID) -> None:
+    def delete(self, id: UUID) -> bool:
         raise NotImplementedError()
@@ -1,5 +1,6 @@
 from copy import deepcopy
 from math import ceil
+from typing import Any
 from uuid import UUID
 
 from src.core.cast_member.domain.cast_member import CastMember
@@ -7,7 +8,13 @@ from src.core.cast_member.gateway.cast_member_gateway import (
     AbstractCastMemberRepository,
 )
 from src.core.shared import settings
+from src.core.shared.application.count import TotalMode
+from src.core.shared.application.cursor import Cursor
 from src.core.shared.application.errors import InvalidPageRequested
+from src.core.shared.application.ordering import (
+    filter_rows_after_cursor,
+    sort_rows,
+)
 
 
 class InMemoryCastMemberRepository(AbstractCastMemberRepository):
@@ -17,6 +24,60 @@ class InMemoryCastMemberRepository(AbstractCastMemberRepository):
     def save(self, cast_member: CastMember) -> None:
         self.cast_members.append(cast_member)
 
+    def save_many(self, cast_members: list[CastMember]) -> None:
+        self.cast_members.extend(cast_members)
+
+    def update_many(self, cast_members: list[CastMember]) -> set[UUID]:
+        versions = {
+            cast_member.id: cast_member.version
+            for cast_member in self.cast_members
+        }
+        conflicted_ids = {
+            cast_member.id
+            for cast_member in cast_members
+            if versions.get(cast_member.id) != cast_member.version
+        }
+        self._replace_many([
+            cast_member
+            for cast_member in cast_members
+            if cast_member.id not in conflicted_ids
+        ])
+        return conflicted_ids
+
+    def _replace_many(self, cast_members: list[CastMember]) -> None:
+        cast_members_by_id = {
+            cast_member.id: cast_member
+            for cast_member in cast_members
+        }
+        for index, cast_member in enumerate(self.cast_members):
+            updated_cast_member = cast_members_by_id.get(cast_member.id)
+            if updated_cast_member is not None:
+                updated_cast_member.version = cast_member.version + 1
+                self.cast_members[index] = updated_cast_member
+
+    def delete_many(self, ids: set[UUID]) -> set[UUID]:
+        missing_ids = ids - {cast_member.id for cast_member in self.cast_members}
+        self.cast_members[:] = [
+            cast_member
+            for cast_member in self.cast_members
+            if cast_member.id not in ids
+        ]
+        return missing_ids
+
+    def upsert(self, cast_member: CastMember) -> bool:
+        return bool(self.upsert_many([cast_member]))
+
+    def upsert_many(self, cast_members: list[CastMember]) -> set[UUID]:
+        existing_ids = {cast_member.id for cast_member in self.cast_members}
+        new_cast_members = [
+            cast_member
+            for cast_member in cast_members
+            if cast_member.id not in existing_ids
+        ]
+        self._replace_many(cast_members)
+        self.save_many(new_cast_members)
+        return {cast_member.id for cast_member in new_cast_members}
+
     def get_by_id(self, id: UUID) -> CastMember | None:
         return next(
             (
@@ -27,29 +88,82 @@ class InMemoryCastMemberRepository(AbstractCastMemberRepository):
             None,
         )
 
-    def delete(self, id: UUID) -> None:
-        cast_member = self.get_by_id(id)
-        if cast_member:
-            self.cast_members.remove(cast_member)
+    def delete(self, id: UUID) -> bool:
+        return not self.delete_many({id})
+
+    def list_after(
+        self,
+        cursor: Cursor | None,
+        order_by: str,
+        limit: int,
+    ) -> list[CastMember]:
+        sorted_cast_members = sort_rows(
+            [
+                deepcopy(cast_member)
+                for cast_member in self.cast_members
+            ],
+            order_by=order_by,
+        )
+
+        if cursor is not None:
+            sorted_cast_members = filter_rows_after_cursor(
+                sorted_cast_members,
+                cursor=cursor,
+                order_by=order_by,
+            )
+
+        return sorted_cast_members[:limit]
+
+    def list_values_after(
+        self,
+        fields: list[str],
+        cursor: Cursor | None,
+        order_by: str,
+        limit: int,
+    ) -> list[dict[str, Any]]:
+        return [
+            {field: getattr(cast_member, field) for field in fields}
+            for cast_member in self.list_after(
+                cursor=cursor,
+                order_by=order_by,
+                limit=limit,
+            )
+        ]
+
+    def list_values(
+        self,
+        fields: list[str],
+        order_by: str | None = None,
+        page: int | None = None,
+        page_size: int | None = None,
+        with_total: bool = False,
+    ) -> list[dict[str, Any]]:
+        return [
+            {field: getattr(cast_member, field) for field in fields}
+            for cast_member in self.list(
+                order_by=order_by,
+                page=page,
+                page_size=page_size,
+            )
+        ]
 
     def list(
         self,
         order_by: str | None = None,
         page: int | None = None,
+        page_size: int | None = None,
+        with_total: bool = False,
     ) -> list[CastMember]:
         cast_members = [
             deepcopy(cast_member)
             for cast_member in self.cast_members
         ]
         if order_by is not None:
-            cast_members = sorted(
-                cast_members,
-                key=lambda cast_member: getattr(cast_member, order_by.strip("-")),
-                reverse=order_by.startswith("-"),
-            )
+            cast_members = sort_rows(cast_members, order_by=order_by)
 
         if page is not None:
-            page_size = settings.REPOSITORY["page_size"]
+            if page_size is None:
+                page_size = settings.REPOSITORY["page_size"]
             page_offset = (page - 1) * page_size
 
             num_elements = max(1, self.count())
@@ -60,11 +174,8 @@ class InMemoryCastMemberRepository(AbstractCastMemberRepository):
 
         return list(self.cast_members)
 
-    def count(self) -> int:
+    def count(self, mode: TotalMode = TotalMode.EXACT) -> int:
         return len(self.cast_members)
 
-    def update(self, cast_member: CastMember) -> None:
-        old_cast_member = self.get_by_id(cast_member.id)
-        if old_cast_member:
-            self.cast_members.remove(old_cast_member)
-            self.cast_members.append(cast_member)
+    def update(self, cast_member: CastMember) -> bool:
+        return not self.update_many([cast_member])
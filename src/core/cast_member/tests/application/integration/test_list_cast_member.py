@@ -93,6 +93,23 @@ class TestListCastMember:
                 page=page,
                 per_page=overriden_page_size,
                 total=5,
+                next_cursor=(
+                    ListCastMembers.get_cursor(
+                        entity=expected_cast_members_per_page[page][-1],
+                        order_by="name",
+                    )
+                    if page < 3
+                    else None
+                ),
+                prev_cursor=(
+                    ListCastMembers.get_cursor(
+                        entity=expected_cast_members_per_page[page][0],
+                        order_by="name",
+                        backward=True,
+                    )
+                    if page > 1
+                    else None
+                ),
             )
         )
 
@@ -6,6 +6,7 @@ import pytest
 
 from src.core.cast_member.application.errors import (
     CastMemberNotFound,
+    CastMemberVersionConflict,
     InvalidCastMemberData,
 )
 from src.core.cast_member.application.update_cast_member import UpdateCastMember
@@ -162,3 +163,29 @@ class TestUpdateCastMember:
 
         with pytest.raises(CastMemberNotFound):
             use_case.execute(input=input)
+
+    def test_update_cast_member_stale_version_error(
+        self,
+        actor_cast_member: CastMember,
+        cast_member_repository: AbstractCastMemberRepository,
+    ):
+        use_case = UpdateCastMember(repository=cast_member_repository)
+        output = use_case.execute(
+            input=UpdateCastMember.Input(id=actor_cast_member.id, name="Johnny"),
+        )
+
+        with pytest.raises(CastMemberVersionConflict):
+            use_case.execute(
+                input=UpdateCastMember.Input(
+                    id=actor_cast_member.id,
+                    name="Jack",
+                    version=1,
+                ),
+            )
+
+        updated_cast_member = cast_member_repository.get_by_id(
+            id=actor_cast_member.id,
+        )
+        assert output.version == 2
+        assert updated_cast_member is not None
+        assert updated_cast_member.name == "Johnny"
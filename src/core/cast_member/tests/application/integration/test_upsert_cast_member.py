@@ -0,0 +1,55 @@
+from uuid import uuid4
+
+import pytest
+
+from src.core.cast_member.application.errors import InvalidCastMemberData
+from src.core.cast_member.application.upsert_cast_member import UpsertCastMember
+from src.core.cast_member.domain.cast_member import CastMember, CastMemberType
+from src.core.cast_member.infra.in_memory_cast_member_repository import (
+    InMemoryCastMemberRepository,
+)
+from src.core.shared.infra.in_memory_unit_of_work import InMemoryUnitOfWork
+
+
+class TestUpsertCastMember:
+    def test_creates_then_replaces_cast_member(self):
+        repository = InMemoryCastMemberRepository()
+        use_case = UpsertCastMember(
+            repository=repository,
+            unit_of_work=InMemoryUnitOfWork(repositories={CastMember: repository}),
+        )
+        cast_member_id = uuid4()
+
+        created_output = use_case.execute(
+            input=UpsertCastMember.Input(
+                id=cast_member_id,
+                name="John",
+                type=CastMemberType.ACTOR,
+            ),
+        )
+        replaced_output = use_case.execute(
+            input=UpsertCastMember.Input(
+                id=cast_member_id,
+                name="John",
+                type=CastMemberType.DIRECTOR,
+            ),
+        )
+
+        assert created_output.created is True
+        assert replaced_output.created is False
+        assert repository.cast_members == [
+            CastMember(
+                id=cast_member_id,
+                name="John",
+                type=CastMemberType.DIRECTOR,
+            ),
+        ]
+
+    def test_when_type_is_invalid_then_raise_error(self):
+        with pytest.raises(InvalidCastMemberData):
+            UpsertCastMember(
+                repository=InMemoryCastMemberRepository(),
+                unit_of_work=InMemoryUnitOfWork(repositories={}),
+            ).execute(
+                input=UpsertCastMember.Input(id=uuid4(), name="John", type="SINGER"),
+            )
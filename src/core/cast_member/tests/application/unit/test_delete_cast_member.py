@@ -27,7 +27,7 @@ class TestDeleteCastMember:
         actor_cast_member: CastMember,
         mocked_cast_member_repository: MagicMock,
     ):
-        mocked_cast_member_repository.get_by_id.return_value = actor_cast_member
+        mocked_cast_member_repository.delete.return_value = True
 
         input = DeleteCastMember.Input(id=actor_cast_member.id)
 
@@ -35,10 +35,7 @@ class TestDeleteCastMember:
 
         use_case.execute(input=input)
 
-        mocked_cast_member_repository.get_by_id.assert_called_once_with(
-            id=actor_cast_member.id,
-        )
-
+        mocked_cast_member_repository.get_by_id.assert_not_called()
         mocked_cast_member_repository.delete.assert_called_once_with(
             id=actor_cast_member.id,
         )
@@ -48,7 +45,7 @@ class TestDeleteCastMember:
         mocked_cast_member_repository: MagicMock,
     ):
         does_not_exist_cast_member_id = uuid4()
-        mocked_cast_member_repository.get_by_id.return_value = None
+        mocked_cast_member_repository.delete.return_value = False
 
         input = DeleteCastMember.Input(id=does_not_exist_cast_member_id)
 
@@ -57,8 +54,6 @@ class TestDeleteCastMember:
         with pytest.raises(CastMemberNotFound):
             use_case.execute(input=input)
 
-        mocked_cast_member_repository.get_by_id.assert_called_once_with(
+        mocked_cast_member_repository.delete.assert_called_once_with(
             id=does_not_exist_cast_member_id,
         )
-
-        mocked_cast_member_repository.delete.assert_not_called()
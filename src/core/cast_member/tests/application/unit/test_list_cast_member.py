@@ -7,6 +7,7 @@ from src.core.cast_member.domain.cast_member import CastMember
 from src.core.cast_member.gateway.cast_member_gateway import (
     AbstractCastMemberRepository,
 )
+from src.core.shared import settings
 
 
 @pytest.fixture
@@ -26,6 +27,7 @@ class TestListCastMember:
         mocked_cast_member_repository: MagicMock,
     ):
         mocked_cast_member_repository.list.return_value = [actor_cast_member]
+        mocked_cast_member_repository.count.return_value = 1
 
         input = ListCastMembers.Input()
 
@@ -36,6 +38,8 @@ class TestListCastMember:
         mocked_cast_member_repository.list.assert_called_once_with(
             order_by=ListCastMembers.default_order_by_field,
             page=1,
+            page_size=settings.REPOSITORY["page_size"],
+            with_total=True,
         )
 
         assert len(output.data) == 1
@@ -0,0 +1,42 @@
+from dataclasses import dataclass
+
+from src.core.category.application.create_category import CreateCategoryInput
+from src.core.category.domain.category import Category
+from src.core.shared.application.bulk import (
+    BulkCreateOutput,
+    BulkItemError,
+    validate_bulk_size,
+)
+from src.core.shared.application.unit_of_work import AbstractUnitOfWork
+
+
+@dataclass
+class BulkCreateCategoriesInput:
+    items: list[CreateCategoryInput]
+
+
+class BulkCreateCategories:
+    def __init__(self, unit_of_work: AbstractUnitOfWork) -> None:
+        self.unit_of_work = unit_of_work
+
+    def execute(self, input: BulkCreateCategoriesInput) -> BulkCreateOutput:
+        validate_bulk_size(len(input.items))
+
+        output = BulkCreateOutput()
+
+        for index, item in enumerate(input.items):
+            try:
+                category = Category(
+                    name=item.name,
+                    description=item.description,
+                    is_active=item.is_active,
+                )
+            except ValueError as err:
+                output.errors.append(BulkItemError(index=index, error=str(err)))
+            else:
+                self.unit_of_work.register_new(category)
+                output.ids.append(category.id)
+
+        self.unit_of_work.commit()
+
+        return output
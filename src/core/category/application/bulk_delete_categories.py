@@ -0,0 +1,23 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+from src.core.category.gateway.category_gateway import AbstractCategoryRepository
+from src.core.shared.application.bulk import BulkDeleteOutput, validate_bulk_size
+
+
+@dataclass
+class BulkDeleteCategoriesInput:
+    ids: list[UUID]
+
+
+class BulkDeleteCategories:
+    def __init__(self, repository: AbstractCategoryRepository) -> None:
+        self.repository = repository
+
+    def execute(self, input: BulkDeleteCategoriesInput) -> BulkDeleteOutput:
+        ids = list(dict.fromkeys(input.ids))
+        validate_bulk_size(len(ids))
+
+        missing_ids = self.repository.delete_many(set(ids))
+
+        return BulkDeleteOutput(missing_ids=[id for id in ids if id in missing_ids])
@@ -14,9 +14,5 @@ class DeleteCategory:
         self.repository = repository
 
     def execute(self, input: DeleteCategoryInput) -> None:
-        category = self.repository.get_by_id(id=input.id)
-
-        if category is None:
+        if not self.repository.delete(id=input.id):
             raise CategoryNotFound()
-
-        self.repository.delete(id=input.id)
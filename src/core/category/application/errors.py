@@ -4,3 +4,7 @@ class InvalidCategoryData(Exception):
 
 class CategoryNotFound(Exception):
     pass
+
+
+class CategoryVersionConflict(Exception):
+    pass
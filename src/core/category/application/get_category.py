@@ -3,11 +3,16 @@ from uuid import UUID
 from src.core.category.application.errors import CategoryNotFound
 
 from src.core.category.gateway.category_gateway import AbstractCategoryRepository
+from src.core.shared.application.fields import (
+    get_reduced_output,
+    get_validated_fields,
+)
 
 
 @dataclass
 class GetCategoryInput:
     id: UUID
+    fields: str | list[str] | None = None
 
 
 @dataclass
@@ -16,6 +21,8 @@ class GetCategoryOutput:
     name: str
     description: str
     is_active: bool
+    genre_count: int
+    version: int
 
 
 class GetCategory:
@@ -23,6 +30,23 @@ class GetCategory:
         self.repository: AbstractCategoryRepository = repository
 
     def execute(self, input: GetCategoryInput) -> GetCategoryOutput | None:
+        fields = get_validated_fields(
+            fields=input.fields,
+            output_class=GetCategoryOutput,
+        )
+
+        if fields is not None:
+            values = self.repository.get_values_by_id(id=input.id, fields=fields)
+
+            if values is None:
+                raise CategoryNotFound()
+
+            return get_reduced_output(
+                output_class=GetCategoryOutput,
+                fields=fields,
+                values=values,
+            )
+
         category = self.repository.get_by_id(id=input.id)
 
         if category is None:
@@ -33,4 +57,6 @@ class GetCategory:
             name=category.name,
             description=category.description,
             is_active=category.is_active,
+            genre_count=category.genre_count,
+            version=category.version,
         )
@@ -11,15 +11,19 @@ class CategoryOutput:
     name: str
     description: str
     is_active: bool
+    genre_count: int
 
 
 class ListCategories(PaginatedListUseCase[Category, CategoryOutput]):
+    output_class = CategoryOutput
     default_order_by_field = "name"
     order_by_fields = [
         "name",
         "-name",
         "description",
         "-description",
+        "genre_count",
+        "-genre_count",
     ]
 
     @staticmethod
@@ -30,6 +34,7 @@ class ListCategories(PaginatedListUseCase[Category, CategoryOutput]):
                 name=category.name,
                 description=category.description,
                 is_active=category.is_active,
+                genre_count=category.genre_count,
             )
             for category in entities
         ]
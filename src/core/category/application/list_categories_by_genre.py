@@ -0,0 +1,114 @@
+from typing import Any
+from uuid import UUID
+
+from src.core.category.application.list_categories import (
+    CategoryOutput,
+    ListCategories,
+)
+from src.core.category.domain.category import Category
+from src.core.category.gateway.category_gateway import AbstractCategoryRepository
+from src.core.genre.application.errors import GenreNotFound
+from src.core.genre.gateway.genre_gateway import AbstractGenreRepository
+from src.core.shared.application.count import TotalMode
+from src.core.shared.application.cursor import Cursor
+from src.core.shared.application.list import PaginatedListUseCase
+
+
+class GenreCategoriesRepository:
+    def __init__(self, repository: AbstractCategoryRepository, genre_id: UUID):
+        self.repository = repository
+        self.genre_id = genre_id
+
+    def list_after(
+        self,
+        cursor: Cursor | None,
+        order_by: str,
+        limit: int,
+    ) -> list[Category]:
+        return self.repository.list_by_genre_after(
+            genre_id=self.genre_id,
+            cursor=cursor,
+            order_by=order_by,
+            limit=limit,
+        )
+
+    def list_values_after(
+        self,
+        fields: list[str],
+        cursor: Cursor | None,
+        order_by: str,
+        limit: int,
+    ) -> list[dict[str, Any]]:
+        return self.repository.list_values_by_genre_after(
+            genre_id=self.genre_id,
+            fields=fields,
+            cursor=cursor,
+            order_by=order_by,
+            limit=limit,
+        )
+
+    def list_values(
+        self,
+        fields: list[str],
+        order_by: str | None,
+        page: int,
+        page_size: int | None = None,
+        with_total: bool = False,
+    ) -> list[dict[str, Any]]:
+        return self.repository.list_values_by_genre(
+            genre_id=self.genre_id,
+            fields=fields,
+            order_by=order_by,
+            page=page,
+            page_size=page_size,
+            with_total=with_total,
+        )
+
+    def list(
+        self,
+        order_by: str | None,
+        page: int,
+        page_size: int | None = None,
+        with_total: bool = False,
+    ) -> list[Category]:
+        return self.repository.list_by_genre(
+            genre_id=self.genre_id,
+            order_by=order_by,
+            page=page,
+            page_size=page_size,
+            with_total=with_total,
+        )
+
+    def count(self, mode: TotalMode = TotalMode.EXACT) -> int:
+        return self.repository.count_by_genre(genre_id=self.genre_id)
+
+
+class ListCategoriesByGenre(ListCategories):
+    order_by_fields = [
+        "name",
+        "-name",
+    ]
+
+    def __init__(
+        self,
+        repository: AbstractCategoryRepository,
+        genre_repository: AbstractGenreRepository,
+        genre_id: UUID,
+    ):
+        super().__init__(
+            repository=GenreCategoriesRepository(
+                repository=repository,
+                genre_id=genre_id,
+            ),
+        )
+        self.genre_repository = genre_repository
+        self.genre_id = genre_id
+
+    def execute(
+        self,
+        input: PaginatedListUseCase.Input,
+    ) -> PaginatedListUseCase.Output[CategoryOutput]:
+        if self.genre_repository.get_missing_ids(ids={self.genre_id}):
+            raise GenreNotFound()
+
+        return super().execute(input=input)
@@ -1,7 +1,11 @@
 from dataclasses import dataclass
 from uuid import UUID
 
-from src.core.category.application.errors import CategoryNotFound, InvalidCategoryData
+from src.core.category.application.errors import (
+    CategoryNotFound,
+    CategoryVersionConflict,
+    InvalidCategoryData,
+)
 from src.core.category.gateway.category_gateway import AbstractCategoryRepository
 
 
@@ -11,12 +15,14 @@ class UpdateCategoryInput:
     name: str | None = None
     description: str | None = None
     is_active: bool | None = None
+    version: int | None = None
 
 
 @dataclass
 class UpdateCategoryOutput:
     id: UUID
     is_active: bool
+    version: int
     name: str | None = None
     description: str | None = None
 
@@ -32,6 +38,9 @@ class UpdateCategory:
         if category is None:
             raise CategoryNotFound()
 
+        if input.version is not None and input.version != category.version:
+            raise CategoryVersionConflict()
+
         name = category.name
         description = category.description
 
@@ -58,11 +67,13 @@ class UpdateCategory:
                 except ValueError as err:
                     raise InvalidCategoryData(err)
 
-        self.repository.update(category=category)
+        if not self.repository.update(category=category):
+            raise CategoryVersionConflict()
 
         return UpdateCategoryOutput(
             id=category.id,
             name=category.name,
             description=category.description,
             is_active=category.is_active,
+            version=category.version,
         )
@@ -0,0 +1,71 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+from src.core.category.application.errors import (
+    CategoryVersionConflict,
+    InvalidCategoryData,
+)
+from src.core.category.domain.category import Category
+from src.core.category.gateway.category_gateway import AbstractCategoryRepository
+from src.core.shared.application.errors import StaleEntitiesError
+from src.core.shared.application.unit_of_work import AbstractUnitOfWork
+
+
+@dataclass
+class UpsertCategoryInput:
+    id: UUID
+    name: str
+    description: str = ""
+    is_active: bool = True
+    version: int | None = None
+
+
+@dataclass
+class UpsertCategoryOutput:
+    id: UUID
+    name: str
+    description: str
+    is_active: bool
+    version: int
+    created: bool
+
+
+class UpsertCategory:
+    def __init__(
+        self,
+        repository: AbstractCategoryRepository,
+        unit_of_work: AbstractUnitOfWork,
+    ):
+        self.repository = repository
+        self.unit_of_work = unit_of_work
+
+    def execute(self, input: UpsertCategoryInput) -> UpsertCategoryOutput:
+        try:
+            category = Category(
+                id=input.id,
+                name=input.name,
+                description=input.description,
+                is_active=input.is_active,
+            )
+        except ValueError as err:
+            raise InvalidCategoryData(err)
+
+        if input.version is None:
+            created = self.repository.upsert(category=category)
+        else:
+            category.version = input.version
+            try:
+                with self.unit_of_work:
+                    self.unit_of_work.register_dirty(category)
+            except StaleEntitiesError:
+                raise CategoryVersionConflict()
+            created = False
+
+        return UpsertCategoryOutput(
+            id=category.id,
+            name=category.name,
+            description=category.description,
+            is_active=category.is_active,
+            version=category.version,
+            created=created,
+        )
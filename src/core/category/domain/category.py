@@ -13,6 +13,7 @@ class Category(Entity):
     name: str
     description: str = field(default=DEFAULT_CATEGORY_DESCRIPTION)
     is_active: bool = field(default=DEFAULT_CATEGORY_IS_ACTIVE)
+    genre_count: int = field(default=0)
 
     def activate(self) -> None:
         self.is_active = True
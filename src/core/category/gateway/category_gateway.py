@@ -1,7 +1,10 @@
 from abc import ABC, abstractmethod
+from typing import Any
 from uuid import UUID
 
 from src.core.category.domain.category import Category
+from src.core.shared.application.count import TotalMode
+from src.core.shared.application.cursor import Cursor
 
 
 class AbstractCategoryRepository(ABC):
@@ -9,25 +12,141 @@ class AbstractCategoryRepository(ABC):
     def save(self, category: Category) -> None:
         raise NotImplementedError
 
+    @abstractmethod
+    def save_many(self, categories: list[Category]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def update_many(self, categories: list[Category]) -> set[UUID]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete_many(self, ids: set[UUID]) -> set[UUID]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def upsert(self, category: Category) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    def upsert_many(self, categories: list[Category]) -> set[UUID]:
+        raise NotImplementedError
+
     @abstractmethod
     def get_by_id(self, id: UUID) -> Category | None:
         raise NotImplementedError
 
+    @abstractmethod
+    def get_missing_ids(self, ids: set[UUID]) -> set[UUID]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_values_by_id(self, id: UUID, fields: list[str]) -> dict[str, Any] | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def list_values_by_ids(
+        self,
+        ids: set[UUID],
+        fields: list[str],
+    ) -> list[dict[str, Any]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def list_after(
+        self,
+        cursor: Cursor | None,
+        order_by: str,
+        limit: int,
+    ) -> list[Category]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def list_values_after(
+        self,
+        fields: list[str],
+        cursor: Cursor | None,
+        order_by: str,
+        limit: int,
+    ) -> list[dict[str, Any]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def list_values(
+        self,
+        fields: list[str],
+        order_by: str | None = None,
+        page: int | None = None,
+        page_size: int | None = None,
+        with_total: bool = False,
+    ) -> list[dict[str, Any]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def list_by_genre_after(
+        self,
+        genre_id: UUID,
+        cursor: Cursor | None,
+        order_by: str,
+        limit: int,
+    ) -> list[Category]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def list_by_genre(
+        self,
+        genre_id: UUID,
+        order_by: str | None = None,
+        page: int | None = None,
+        page_size: int | None = None,
+        with_total: bool = False,
+    ) -> list[Category]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def list_values_by_genre_after(
+        self,
+        genre_id: UUID,
+        fields: list[str],
+        cursor: Cursor | None,
+        order_by: str,
+        limit: int,
+    ) -> list[dict[str, Any]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def list_values_by_genre(
+        self,
+        genre_id: UUID,
+        fields: list[str],
+        order_by: str | None = None,
+        page: int | None = None,
+        page_size: int | None = None,
+        with_total: bool = False,
+    ) -> list[dict[str, Any]]:
+        raise NotImplementedError
+
     def list(
         self,
         order_by: str | None = None,
         page: int | None = None,
+        page_size: int | None = None,
+        with_total: bool = False,
     ) -> list[Category]:
         raise NotImplementedError
 
     @abstractmethod
-    def count(self) -> int:
+    def count(self, mode: TotalMode = TotalMode.EXACT) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    def count_by_genre(self, genre_id: UUID) -> int:
         raise NotImplementedError
 
     @abstractmethod
-    def delete(self, id: UUID) -> None:
+    def delete(self, id: UUID) -> bool:
         raise NotImplementedError
 
     @abstractmethod
-    def update(self, category: Category) -> None:
+    def update(self, category: Category) -> bool:
         raise NotImplementedError
@@ -1,23 +1,84 @@
 from copy import deepcopy
 from math import ceil
+from typing import Any
 from uuid import UUID
 
 from src.core.category.domain.category import Category
 from src.core.category.gateway.category_gateway import AbstractCategoryRepository
+from src.core.genre.gateway.genre_gateway import AbstractGenreRepository
 from src.core.shared import settings as core_settings
+from src.core.shared.application.count import TotalMode
+from src.core.shared.application.cursor import Cursor
 from src.core.shared.application.errors import InvalidPageRequested
+from src.core.shared.application.ordering import (
+    filter_rows_after_cursor,
+    sort_rows,
+)
 
 
 class InMemoryCategoryRepository(AbstractCategoryRepository):
-    def __init__(self, categories: list[Category] | None = None) -> None:
+    def __init__(
+        self,
+        categories: list[Category] | None = None,
+        genre_repository: AbstractGenreRepository | None = None,
+    ) -> None:
         if categories is None:
             self.categories = []
         else:
             self.categories = categories
+        self.genre_repository = genre_repository
 
     def save(self, category: Category) -> None:
         self.categories.append(category)
 
+    def save_many(self, categories: list[Category]) -> None:
+        self.categories.extend(categories)
+
+    def update_many(self, categories: list[Category]) -> set[UUID]:
+        versions = {category.id: category.version for category in self.categories}
+        conflicted_ids = {
+            category.id
+            for category in categories
+            if versions.get(category.id) != category.version
+        }
+        self._replace_many([
+            category
+            for category in categories
+            if category.id not in conflicted_ids
+        ])
+        return conflicted_ids
+
+    def _replace_many(self, categories: list[Category]) -> None:
+        categories_by_id = {category.id: category for category in categories}
+        for index, category in enumerate(self.categories):
+            updated_category = categories_by_id.get(category.id)
+            if updated_category is not None:
+                updated_category.version = category.version + 1
+                self.categories[index] = updated_category
+
+    def delete_many(self, ids: set[UUID]) -> set[UUID]:
+        missing_ids = ids - {category.id for category in self.categories}
+        self.categories[:] = [
+            category
+            for category in self.categories
+            if category.id not in ids
+        ]
+        return missing_ids
+
+    def upsert(self, category: Category) -> bool:
+        return bool(self.upsert_many([category]))
+
+    def upsert_many(self, categories: list[Category]) -> set[UUID]:
+        existing_ids = {category.id for category in self.categories}
+        new_categories = [
+            category
+            for category in categories
+            if category.id not in existing_ids
+        ]
+        self._replace_many(categories)
+        self.save_many(new_categories)
+        return {category.id for category in new_categories}
+
     def get_by_id(self, id: UUID) -> Category | None:
         return next(
             (
@@ -28,10 +89,147 @@ class InMemoryCategoryRepository(AbstractCategoryRepository):
             None,
         )
 
+    def get_missing_ids(self, ids: set[UUID]) -> set[UUID]:
+        return ids - {category.id for category in self.categories}
+
+    def get_values_by_id(self, id: UUID, fields: list[str]) -> dict[str, Any] | None:
+        category = self.get_by_id(id)
+        if category is None:
+            return None
+
+        return {field: getattr(category, field) for field in fields}
+
+    def list_values_by_ids(
+        self,
+        ids: set[UUID],
+        fields: list[str],
+    ) -> list[dict[str, Any]]:
+        return [
+            {field: getattr(category, field) for field in fields}
+            for category in self.categories
+            if category.id in ids
+        ]
+
+    def list_after(
+        self,
+        cursor: Cursor | None,
+        order_by: str,
+        limit: int,
+    ) -> list[Category]:
+        sorted_categories = sort_rows(
+            [
+                deepcopy(category)
+                for category in self.categories
+            ],
+            order_by=order_by,
+        )
+
+        if cursor is not None:
+            sorted_categories = filter_rows_after_cursor(
+                sorted_categories,
+                cursor=cursor,
+                order_by=order_by,
+            )
+
+        return sorted_categories[:limit]
+
+    def list_values_after(
+        self,
+        fields: list[str],
+        cursor: Cursor | None,
+        order_by: str,
+        limit: int,
+    ) -> list[dict[str, Any]]:
+        return [
+            {field: getattr(category, field) for field in fields}
+            for category in self.list_after(
+                cursor=cursor,
+                order_by=order_by,
+                limit=limit,
+            )
+        ]
+
+    def list_values(
+        self,
+        fields: list[str],
+        order_by: str | None = None,
+        page: int | None = None,
+        page_size: int | None = None,
+        with_total: bool = False,
+    ) -> list[dict[str, Any]]:
+        return [
+            {field: getattr(category, field) for field in fields}
+            for category in self.list(
+                order_by=order_by,
+                page=page,
+                page_size=page_size,
+            )
+        ]
+
+    def list_by_genre_after(
+        self,
+        genre_id: UUID,
+        cursor: Cursor | None,
+        order_by: str,
+        limit: int,
+    ) -> list[Category]:
+        return self._get_genre_repository(genre_id).list_after(
+            cursor=cursor,
+            order_by=order_by,
+            limit=limit,
+        )
+
+    def list_by_genre(
+        self,
+        genre_id: UUID,
+        order_by: str | None = None,
+        page: int | None = None,
+        page_size: int | None = None,
+        with_total: bool = False,
+    ) -> list[Category]:
+        return self._get_genre_repository(genre_id).list(
+            order_by=order_by,
+            page=page,
+            page_size=page_size,
+        )
+
+    def list_values_by_genre_after(
+        self,
+        genre_id: UUID,
+        fields: list[str],
+        cursor: Cursor | None,
+        order_by: str,
+        limit: int,
+    ) -> list[dict[str, Any]]:
+        return self._get_genre_repository(genre_id).list_values_after(
+            fields=fields,
+            cursor=cursor,
+            order_by=order_by,
+            limit=limit,
+        )
+
+    def list_values_by_genre(
+        self,
+        genre_id: UUID,
+        fields: list[str],
+        order_by: str | None = None,
+        page: int | None = None,
+        page_size: int | None = None,
+        with_total: bool = False,
+    ) -> list[dict[str, Any]]:
+        return self._get_genre_repository(genre_id).list_values(
+            fields=fields,
+            order_by=order_by,
+            page=page,
+            page_size=page_size,
+        )
+
     def list(
         self,
         order_by: str | None = None,
         page: int | None = None,
+        page_size: int | None = None,
+        with_total: bool = False,
     ) -> list[Category]:
         sorted_categories = [
             deepcopy(category)
@@ -39,14 +237,11 @@ class InMemoryCategoryRepository(AbstractCategoryRepository):
         ]
 
         if order_by is not None:
-            sorted_categories = sorted(
-                sorted_categories,
-                key=lambda category: getattr(category, order_by.strip("-")),
-                reverse=order_by.startswith("-"),
-            )
+            sorted_categories = sort_rows(sorted_categories, order_by=order_by)
 
         if page is not None:
-            page_size = core_settings.REPOSITORY["page_size"]
+            if page_size is None:
+                page_size = core_settings.REPOSITORY["page_size"]
             page_offset = (page - 1) * page_size
 
             num_elements = max(1, self.count())
@@ -57,16 +252,28 @@ class InMemoryCategoryRepository(AbstractCategoryRepository):
 
         return list(sorted_categories)
 
-    def count(self) -> int:
+    def count(self, mode: TotalMode = TotalMode.EXACT) -> int:
         return len(self.categories)
 
-    def delete(self, id: UUID) -> None:
-        category = self.get_by_id(id)
-        if category:
-            self.categories.remove(category)
-
-    def update(self, category: Category) -> None:
-        old_category = self.get_by_id(category.id)
-        if old_category:
-            self.categories.remove(old_category)
-            self.categories.append(category)
+    def count_by_genre(self, genre_id: UUID) -> int:
+        return self._get_genre_repository(genre_id).count()
+
+    def _get_genre_repository(self, genre_id: UUID) -> "InMemoryCategoryRepository":
+        genre = None
+        if self.genre_repository is not None:
+            genre = self.genre_repository.get_by_id(genre_id)
+        category_ids = set() if genre is None else set(genre.categories)
+
+        return InMemoryCategoryRepository(
+            [
+                category
+                for category in self.categories
+                if category.id in category_ids
+            ]
+        )
+
+    def delete(self, id: UUID) -> bool:
+        return not self.delete_many({id})
+
+    def update(self, category: Category) -> bool:
+        return not self.update_many([category])
@@ -0,0 +1,46 @@
+from uuid import uuid4
+
+import pytest
+
+from src.core.category.application.bulk_delete_categories import (
+    BulkDeleteCategories,
+    BulkDeleteCategoriesInput,
+)
+from src.core.category.domain.category import Category
+from src.core.category.infra.in_memory_category_repository import (
+    InMemoryCategoryRepository,
+)
+from src.core.shared import settings as core_settings
+from src.core.shared.application.errors import InvalidBulkSizeRequested
+
+
+class TestBulkDeleteCategories:
+    def test_deletes_existing_and_reports_missing_in_input_order(self):
+        movie_category = Category(name="Movie")
+        serie_category = Category(name="Serie")
+        repository = InMemoryCategoryRepository(
+            categories=[movie_category, serie_category],
+        )
+        first_missing_id, second_missing_id = uuid4(), uuid4()
+
+        output = BulkDeleteCategories(repository=repository).execute(
+            input=BulkDeleteCategoriesInput(
+                ids=[
+                    second_missing_id,
+                    movie_category.id,
+                    first_missing_id,
+                    second_missing_id,
+                ],
+            ),
+        )
+
+        assert output.missing_ids == [second_missing_id, first_missing_id]
+        assert repository.categories == [serie_category]
+
+    def test_when_too_many_ids_then_raise_error(self, monkeypatch):
+        monkeypatch.setitem(core_settings.REPOSITORY, "max_bulk_size", 1)
+
+        with pytest.raises(InvalidBulkSizeRequested):
+            BulkDeleteCategories(repository=InMemoryCategoryRepository()).execute(
+                input=BulkDeleteCategoriesInput(ids=[uuid4(), uuid4()]),
+            )
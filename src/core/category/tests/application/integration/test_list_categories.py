@@ -1,3 +1,4 @@
+from dataclasses import asdict
 from unittest.mock import patch
 
 import pytest
@@ -8,9 +9,13 @@ from src.core.category.infra.in_memory_category_repository import (
     InMemoryCategoryRepository,
 )
 from src.core.shared import settings as core_settings
+from src.core.shared.application.count import TotalMode
 from src.core.shared.application.errors import (
+    InvalidCursorRequested,
+    InvalidFieldsRequested,
     InvalidOrderByRequested,
     InvalidPageRequested,
+    InvalidPerPageRequested,
 )
 
 
@@ -70,6 +75,7 @@ class TestListCategory:
                     name=category.name,
                     description=category.description,
                     is_active=category.is_active,
+                    genre_count=category.genre_count,
                 )
                 for category in expected_categories
             ],
@@ -118,6 +124,7 @@ class TestListCategory:
                     name=category.name,
                     description=category.description,
                     is_active=category.is_active,
+                    genre_count=category.genre_count,
                 )
                 for category in expected_categories
             ],
@@ -208,6 +215,7 @@ class TestListCategory:
                     name=category.name,
                     description=category.description,
                     is_active=category.is_active,
+                    genre_count=category.genre_count,
                 )
                 for category in expected_output_by_page[page]
             ],
@@ -221,6 +229,23 @@ class TestListCategory:
                         for category in categories
                     ]
                 ),
+                next_cursor=(
+                    ListCategories.get_cursor(
+                        entity=expected_output_by_page[page][-1],
+                        order_by=order_by,
+                    )
+                    if page < 3
+                    else None
+                ),
+                prev_cursor=(
+                    ListCategories.get_cursor(
+                        entity=expected_output_by_page[page][0],
+                        order_by=order_by,
+                        backward=True,
+                    )
+                    if page > 1
+                    else None
+                ),
             )
         )
 
@@ -248,3 +273,264 @@ class TestListCategory:
             ),
         ):
             use_case.execute(input=input)
+
+    def test_list_categories_walk_pages_with_cursor_success(
+        self,
+        movie_category: Category,
+        serie_category: Category,
+        documentary_category: Category,
+        music_clip_category: Category,
+        lecture_category: Category,
+        category_repository: InMemoryCategoryRepository,
+    ):
+        category_repository.save(category=movie_category)
+        category_repository.save(category=serie_category)
+        category_repository.save(category=documentary_category)
+        category_repository.save(category=music_clip_category)
+        category_repository.save(category=lecture_category)
+
+        use_case = ListCategories(repository=category_repository)
+
+        overriden_page_size = 2
+        with patch.dict(
+            core_settings.REPOSITORY,
+            {"page_size": overriden_page_size},
+        ):
+            first_page = use_case.execute(
+                input=ListCategories.Input(order_by="-description"),
+            )
+            second_page = use_case.execute(
+                input=ListCategories.Input(cursor=first_page.meta.next_cursor),
+            )
+            third_page = use_case.execute(
+                input=ListCategories.Input(cursor=second_page.meta.next_cursor),
+            )
+            back_to_second_page = use_case.execute(
+                input=ListCategories.Input(cursor=third_page.meta.prev_cursor),
+            )
+
+        assert [category.id for category in first_page.data] == [
+            serie_category.id,
+            music_clip_category.id,
+        ]
+        assert [category.id for category in second_page.data] == [
+            movie_category.id,
+            lecture_category.id,
+        ]
+        assert [category.id for category in third_page.data] == [
+            documentary_category.id,
+        ]
+        assert third_page.meta.next_cursor is None
+        assert third_page.meta.page is None
+        assert third_page.meta.total == 5
+
+        assert back_to_second_page.data == second_page.data
+        assert back_to_second_page.meta.next_cursor == second_page.meta.next_cursor
+
+    def test_list_categories_walk_pages_with_composite_order_by_success(
+        self,
+        category_repository: InMemoryCategoryRepository,
+    ):
+        categories = [
+            Category(name="Movie", description=f"Movie {index}")
+            for index in range(3)
+        ]
+        for category in categories:
+            category_repository.save(category=category)
+
+        use_case = ListCategories(repository=category_repository)
+
+        first_page = use_case.execute(
+            input=ListCategories.Input(order_by="name,-id", per_page=2),
+        )
+        second_page = use_case.execute(
+            input=ListCategories.Input(
+                order_by="name,-id",
+                per_page=2,
+                cursor=first_page.meta.next_cursor,
+            ),
+        )
+
+        assert [
+            category.id
+            for category in [*first_page.data, *second_page.data]
+        ] == sorted((category.id for category in categories), reverse=True)
+        assert second_page.meta.next_cursor is None
+
+    @pytest.mark.parametrize(
+        "order_by",
+        ["name,potato", ",", "name,is_active"],
+    )
+    def test_list_categories_invalid_composite_order_by_error(
+        self,
+        order_by: str,
+        category_repository: InMemoryCategoryRepository,
+    ):
+        use_case = ListCategories(repository=category_repository)
+
+        with pytest.raises(InvalidOrderByRequested):
+            use_case.execute(input=ListCategories.Input(order_by=order_by))
+
+    @pytest.mark.parametrize(
+        "cursor",
+        ["potato", ""],
+    )
+    def test_list_categories_invalid_cursor_error(
+        self,
+        cursor: str,
+        category_repository: InMemoryCategoryRepository,
+    ):
+        input = ListCategories.Input(cursor=cursor)
+        use_case = ListCategories(repository=category_repository)
+
+        with pytest.raises(
+            InvalidCursorRequested,
+            match=f"Provided cursor {repr(cursor)} is not valid",
+        ):
+            use_case.execute(input=input)
+
+    def test_list_categories_without_total_success(
+        self,
+        movie_category: Category,
+        category_repository: InMemoryCategoryRepository,
+    ):
+        category_repository.save(category=movie_category)
+
+        use_case = ListCategories(repository=category_repository)
+
+        with patch.dict(
+            core_settings.REPOSITORY,
+            {"total_mode": "none"},
+        ):
+            output = use_case.execute(input=ListCategories.Input())
+
+        assert output.meta.total is None
+        assert output.meta.next_cursor is None
+        assert len(output.data) == 1
+
+    def test_list_categories_total_mode_overrides_settings(
+        self,
+        category_repository: InMemoryCategoryRepository,
+    ):
+        class ListCategoriesWithoutTotal(ListCategories):
+            total_mode = TotalMode.NONE
+
+        use_case = ListCategoriesWithoutTotal(repository=category_repository)
+
+        output = use_case.execute(input=ListCategories.Input())
+
+        assert output.meta.total is None
+
+    def test_list_categories_with_per_page_success(
+        self,
+        movie_category: Category,
+        serie_category: Category,
+        documentary_category: Category,
+        category_repository: InMemoryCategoryRepository,
+    ):
+        category_repository.save(category=movie_category)
+        category_repository.save(category=serie_category)
+        category_repository.save(category=documentary_category)
+
+        use_case = ListCategories(repository=category_repository)
+
+        output = use_case.execute(
+            input=ListCategories.Input(order_by="name", page=2, per_page="2"),
+        )
+
+        assert output.data == [
+            CategoryOutput(
+                id=serie_category.id,
+                name=serie_category.name,
+                description=serie_category.description,
+                is_active=serie_category.is_active,
+                genre_count=serie_category.genre_count,
+            ),
+        ]
+        assert output.meta.per_page == 2
+        assert output.meta.total == 3
+
+    @pytest.mark.parametrize(
+        "per_page",
+        [-1, 0, "potato", 1.5, 1_001],
+    )
+    def test_list_categories_invalid_per_page_error(
+        self,
+        per_page: int,
+        category_repository: InMemoryCategoryRepository,
+    ):
+        input = ListCategories.Input(per_page=per_page)
+        use_case = ListCategories(repository=category_repository)
+
+        with pytest.raises(
+            InvalidPerPageRequested,
+            match=(
+                f"Provided per_page {repr(per_page)} is not valid. "
+                "It must be between 1 and 1000"
+            ),
+        ):
+            use_case.execute(input=input)
+
+    def test_list_categories_with_fields_success(
+        self,
+        movie_category: Category,
+        serie_category: Category,
+        category_repository: InMemoryCategoryRepository,
+    ):
+        category_repository.save(category=movie_category)
+        category_repository.save(category=serie_category)
+
+        use_case = ListCategories(repository=category_repository)
+
+        output = use_case.execute(
+            input=ListCategories.Input(order_by="-name", fields="name"),
+        )
+
+        assert [asdict(category) for category in output.data] == [
+            {"id": serie_category.id, "name": serie_category.name},
+            {"id": movie_category.id, "name": movie_category.name},
+        ]
+        assert output.meta.total == 2
+
+    def test_list_categories_with_fields_and_cursor_success(
+        self,
+        movie_category: Category,
+        serie_category: Category,
+        category_repository: InMemoryCategoryRepository,
+    ):
+        category_repository.save(category=movie_category)
+        category_repository.save(category=serie_category)
+
+        use_case = ListCategories(repository=category_repository)
+
+        first_page = use_case.execute(
+            input=ListCategories.Input(order_by="name", per_page=1, fields="id"),
+        )
+        second_page = use_case.execute(
+            input=ListCategories.Input(
+                order_by="name",
+                per_page=1,
+                fields="id",
+                cursor=first_page.meta.next_cursor,
+            ),
+        )
+
+        assert [asdict(category) for category in first_page.data] == [
+            {"id": movie_category.id},
+        ]
+        assert [asdict(category) for category in second_page.data] == [
+            {"id": serie_category.id},
+        ]
+
+    def test_list_categories_invalid_fields_error(
+        self,
+        category_repository: InMemoryCategoryRepository,
+    ):
+        input = ListCategories.Input(fields="name,potato")
+        use_case = ListCategories(repository=category_repository)
+
+        with pytest.raises(
+            InvalidFieldsRequested,
+            match=r"Provided fields 'potato' are not in: 'id', 'name'",
+        ):
+            use_case.execute(input=input)
@@ -0,0 +1,82 @@
+from uuid import uuid4
+
+import pytest
+
+from src.core.category.application.list_categories_by_genre import (
+    ListCategoriesByGenre,
+)
+from src.core.category.domain.category import Category
+from src.core.category.infra.in_memory_category_repository import (
+    InMemoryCategoryRepository,
+)
+from src.core.genre.application.errors import GenreNotFound
+from src.core.genre.domain.genre import Genre
+from src.core.genre.infra.in_memory_genre_repository import InMemoryGenreRepository
+
+
+@pytest.fixture
+def romance_genre(
+    movie_category: Category,
+    documentary_category: Category,
+) -> Genre:
+    return Genre(
+        name="Romance",
+        categories=[movie_category.id, documentary_category.id],
+    )
+
+
+@pytest.fixture
+def genre_repository(romance_genre: Genre) -> InMemoryGenreRepository:
+    return InMemoryGenreRepository(genres=[romance_genre])
+
+
+@pytest.fixture
+def category_repository(
+    movie_category: Category,
+    serie_category: Category,
+    documentary_category: Category,
+    genre_repository: InMemoryGenreRepository,
+) -> InMemoryCategoryRepository:
+    return InMemoryCategoryRepository(
+        categories=[movie_category, serie_category, documentary_category],
+        genre_repository=genre_repository,
+    )
+
+
+class TestListCategoriesByGenre:
+    def test_pages_categories_of_genre_by_name(
+        self,
+        romance_genre: Genre,
+        genre_repository: InMemoryGenreRepository,
+        category_repository: InMemoryCategoryRepository,
+    ) -> None:
+        use_case = ListCategoriesByGenre(
+            repository=category_repository,
+            genre_repository=genre_repository,
+            genre_id=romance_genre.id,
+        )
+
+        first_page = use_case.execute(
+            input=ListCategoriesByGenre.Input(per_page=1),
+        )
+        second_page = use_case.execute(
+            input=ListCategoriesByGenre.Input(cursor=first_page.meta.next_cursor),
+        )
+
+        assert [category.name for category in first_page.data] == ["Documentary"]
+        assert [category.name for category in second_page.data] == ["Movie"]
+        assert first_page.meta.total == 2
+
+    def test_when_genre_does_not_exist_then_raise_error(
+        self,
+        genre_repository: InMemoryGenreRepository,
+        category_repository: InMemoryCategoryRepository,
+    ) -> None:
+        use_case = ListCategoriesByGenre(
+            repository=category_repository,
+            genre_repository=genre_repository,
+            genre_id=uuid4(),
+        )
+
+        with pytest.raises(GenreNotFound):
+            use_case.execute(input=ListCategoriesByGenre.Input())
@@ -1,3 +1,6 @@
+import pytest
+
+from src.core.category.application.errors import CategoryVersionConflict
 from src.core.category.application.update_category import (
     UpdateCategory,
     UpdateCategoryInput,
@@ -87,3 +90,24 @@ class TestUpdateCategoryIntegration:
         assert updated_category.name == original_category_attrs["name"]
         assert updated_category.description == original_category_attrs["description"]
         assert updated_category.is_active == update_category_input.is_active
+
+    def test_update_category_bumps_version(self):
+        category = Category(name="Movie", description="Movie description")
+        repository = InMemoryCategoryRepository(categories=[category])
+        update_category = UpdateCategory(repository=repository)
+
+        output = update_category.execute(
+            input=UpdateCategoryInput(id=category.id, name="Serie", version=1),
+        )
+
+        assert output.version == 2
+        with pytest.raises(CategoryVersionConflict):
+            update_category.execute(
+                input=UpdateCategoryInput(id=category.id, name="Film", version=1),
+            )
+
+        updated_category = repository.get_by_id(id=category.id)
+
+        assert updated_category is not None
+        assert updated_category.name == "Serie"
+        assert updated_category.version == 2
@@ -0,0 +1,86 @@
+from uuid import uuid4
+
+import pytest
+
+from src.core.category.application.errors import (
+    CategoryVersionConflict,
+    InvalidCategoryData,
+)
+from src.core.category.application.upsert_category import (
+    UpsertCategory,
+    UpsertCategoryInput,
+)
+from src.core.category.domain.category import Category
+from src.core.category.infra.in_memory_category_repository import (
+    InMemoryCategoryRepository,
+)
+from src.core.shared.infra.in_memory_unit_of_work import InMemoryUnitOfWork
+
+
+class TestUpsertCategory:
+    def test_creates_category_with_given_id(self):
+        repository = InMemoryCategoryRepository()
+        category_id = uuid4()
+
+        output = UpsertCategory(
+            repository=repository,
+            unit_of_work=InMemoryUnitOfWork(repositories={Category: repository}),
+        ).execute(
+            input=UpsertCategoryInput(id=category_id, name="Movie"),
+        )
+
+        assert output.created is True
+        assert repository.get_by_id(id=category_id) == Category(
+            id=category_id,
+            name="Movie",
+        )
+
+    def test_replaces_existing_category(self):
+        category = Category(name="Movie", description="Movie description")
+        repository = InMemoryCategoryRepository(categories=[category])
+
+        output = UpsertCategory(
+            repository=repository,
+            unit_of_work=InMemoryUnitOfWork(repositories={Category: repository}),
+        ).execute(
+            input=UpsertCategoryInput(id=category.id, name="Film", is_active=False),
+        )
+
+        assert output.created is False
+        assert len(repository.categories) == 1
+        replaced_category = repository.get_by_id(id=category.id)
+        assert replaced_category is not None
+        assert replaced_category.name == "Film"
+        assert replaced_category.description == ""
+        assert replaced_category.is_active is False
+
+    def test_when_data_is_invalid_then_raise_error(self):
+        repository = InMemoryCategoryRepository()
+
+        with pytest.raises(InvalidCategoryData):
+            UpsertCategory(
+                repository=repository,
+                unit_of_work=InMemoryUnitOfWork(repositories={Category: repository}),
+            ).execute(
+                input=UpsertCategoryInput(id=uuid4(), name=""),
+            )
+
+        assert repository.categories == []
+
+    def test_stale_version_raises_conflict(self):
+        category = Category(name="Movie")
+        repository = InMemoryCategoryRepository(categories=[category])
+
+        with pytest.raises(CategoryVersionConflict):
+            UpsertCategory(
+                repository=repository,
+                unit_of_work=InMemoryUnitOfWork(repositories={Category: repository}),
+            ).execute(
+                input=UpsertCategoryInput(
+                    id=category.id,
+                    name="Film",
+                    version=category.version + 1,
+                ),
+            )
+
+        assert repository.categories[0].name == "Movie"
@@ -21,20 +21,20 @@ class TestDeleteCategory:
         )
 
         mocked_repository = create_autospec(AbstractCategoryRepository)
-        mocked_repository.get_by_id.return_value = category
+        mocked_repository.delete.return_value = True
 
         delete_category = DeleteCategory(repository=mocked_repository)
 
         input = DeleteCategoryInput(id=category.id)
         delete_category.execute(input=input)
 
-        assert mocked_repository.get_by_id.call_args_list == [call(id=category.id)]
+        assert mocked_repository.get_by_id.call_args_list == []
         assert mocked_repository.delete.call_args_list == [call(id=category.id)]
 
     def test_delete_category_does_not_exist_error(self):
 
         mocked_repository = create_autospec(AbstractCategoryRepository)
-        mocked_repository.get_by_id.return_value = None
+        mocked_repository.delete.return_value = False
 
         delete_category = DeleteCategory(repository=mocked_repository)
 
@@ -43,7 +43,6 @@ class TestDeleteCategory:
         with pytest.raises(CategoryNotFound):
             delete_category.execute(input=input)
 
-        assert mocked_repository.get_by_id.call_args_list == [
+        assert mocked_repository.delete.call_args_list == [
             call(id=does_not_exist_id)
         ]
-        assert mocked_repository.delete.call_args_list == []
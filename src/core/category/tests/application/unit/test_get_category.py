@@ -37,6 +37,8 @@ class TestGetCategoryIntegration:
             name=movie_category.name,
             description=movie_category.description,
             is_active=movie_category.is_active,
+            genre_count=movie_category.genre_count,
+            version=movie_category.version,
         )
 
     def test_get_category_by_id_does_not_exist_error(self) -> None:
@@ -3,6 +3,7 @@ from unittest.mock import call, create_autospec
 from src.core.category.application.list_categories import ListCategories
 from src.core.category.domain.category import Category
 from src.core.category.gateway.category_gateway import AbstractCategoryRepository
+from src.core.shared import settings as core_settings
 
 
 class TestListCategoryIntegration:
@@ -10,6 +11,7 @@ class TestListCategoryIntegration:
     def test_list_categories_empty_success(self) -> None:
         repository = create_autospec(AbstractCategoryRepository)
         repository.list.return_value = []
+        repository.count.return_value = 0
 
         list_categories = ListCategories(repository=repository)
 
@@ -20,6 +22,8 @@ class TestListCategoryIntegration:
             call(
                 order_by=ListCategories.default_order_by_field,
                 page=1,
+                page_size=core_settings.REPOSITORY["page_size"],
+                with_total=True,
             ),
         ]
 
@@ -38,6 +42,7 @@ class TestListCategoryIntegration:
         )
         repository = create_autospec(AbstractCategoryRepository)
         repository.list.return_value = [movie_category, serie_category]
+        repository.count.return_value = 2
 
         list_categories = ListCategories(repository=repository)
 
@@ -48,6 +53,8 @@ class TestListCategoryIntegration:
             call(
                 order_by=ListCategories.default_order_by_field,
                 page=1,
+                page_size=core_settings.REPOSITORY["page_size"],
+                with_total=True,
             ),
         ]
 
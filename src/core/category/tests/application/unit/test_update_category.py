@@ -2,7 +2,10 @@ from unittest.mock import call, create_autospec
 
 import pytest
 
-from src.core.category.application.errors import InvalidCategoryData
+from src.core.category.application.errors import (
+    CategoryVersionConflict,
+    InvalidCategoryData,
+)
 from src.core.category.application.update_category import (
     UpdateCategory,
     UpdateCategoryInput,
@@ -123,3 +126,32 @@ class TestUpdateCategory:
         assert category.name == original_category_attrs["name"]
         assert category.description == original_category_attrs["description"]
         assert category.is_active == update_category_input.is_active
+
+    def test_update_category_concurrent_write_error(self):
+        category = Category(name="Movie", description="Movie description")
+
+        mocked_repository = create_autospec(AbstractCategoryRepository)
+        mocked_repository.get_by_id.return_value = category
+        mocked_repository.update.return_value = False
+
+        update_category = UpdateCategory(repository=mocked_repository)
+
+        with pytest.raises(CategoryVersionConflict):
+            update_category.execute(
+                input=UpdateCategoryInput(id=category.id, name="Serie"),
+            )
+
+    def test_update_category_stale_version_error(self):
+        category = Category(name="Movie", description="Movie description")
+
+        mocked_repository = create_autospec(AbstractCategoryRepository)
+        mocked_repository.get_by_id.return_value = category
+
+        update_category = UpdateCategory(repository=mocked_repository)
+
+        with pytest.raises(CategoryVersionConflict):
+            update_category.execute(
+                input=UpdateCategoryInput(id=category.id, name="Serie", version=2),
+            )
+
+        assert mocked_repository.update.call_args_list == []
@@ -1,3 +1,5 @@
+from uuid import uuid4
+
 from src.core.category.domain.category import Category
 from src.core.category.infra.in_memory_category_repository import (
     InMemoryCategoryRepository,
@@ -45,6 +47,16 @@ class TestGetByIdInMemoryCategoryRepository:
         assert movie_category == found_category
 
 
+class TestGetMissingIdsInMemoryCategoryRepository:
+    def test_returns_only_unknown_ids(self):
+        category = Category(name="Movie", description="Movie description")
+        unknown_id = uuid4()
+
+        repository = InMemoryCategoryRepository(categories=[category])
+
+        assert repository.get_missing_ids({category.id, unknown_id}) == {unknown_id}
+
+
 class TestCanListCategoriesRepository:
     def test_can_empty_list_category(self):
 
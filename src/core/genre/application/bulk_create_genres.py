@@ -0,0 +1,67 @@
+from dataclasses import dataclass
+
+from src.core.category.gateway.category_gateway import AbstractCategoryRepository
+from src.core.genre.application.create_genre import CreateGenre
+from src.core.genre.domain.genre import Genre
+from src.core.shared.application.bulk import (
+    BulkCreateOutput,
+    BulkItemError,
+    validate_bulk_size,
+)
+from src.core.shared.application.unit_of_work import AbstractUnitOfWork
+
+
+class BulkCreateGenres:
+    @dataclass
+    class Input:
+        items: list[CreateGenre.Input]
+
+    def __init__(
+        self,
+        category_repository: AbstractCategoryRepository,
+        unit_of_work: AbstractUnitOfWork,
+    ) -> None:
+        self.category_repository = category_repository
+        self.unit_of_work = unit_of_work
+
+    def execute(self, input: Input) -> BulkCreateOutput:
+        validate_bulk_size(len(input.items))
+
+        missing_category_ids = self.category_repository.get_missing_ids(
+            ids={
+                category_id
+                for item in input.items
+                for category_id in item.categories
+            },
+        )
+
+        output = BulkCreateOutput()
+
+        for index, item in enumerate(input.items):
+            item_missing_category_ids = missing_category_ids.intersection(
+                item.categories,
+            )
+            if item_missing_category_ids:
+                output.errors.append(
+                    BulkItemError(
+                        index=index,
+                        error=f"Categories not found: {item_missing_category_ids}",
+                    )
+                )
+                continue
+
+            try:
+                genre = Genre(
+                    name=item.name,
+                    is_active=item.is_active,
+                    categories=item.categories,
+                )
+            except ValueError as err:
+                output.errors.append(BulkItemError(index=index, error=str(err)))
+            else:
+                self.unit_of_work.register_new(genre)
+                output.ids.append(genre.id)
+
+        self.unit_of_work.commit()
+
+        return output
@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+from src.core.genre.gateway.genre_gateway import AbstractGenreRepository
+from src.core.shared.application.bulk import BulkDeleteOutput, validate_bulk_size
+
+
+class BulkDeleteGenres:
+    @dataclass
+    class Input:
+        ids: list[UUID]
+
+    def __init__(self, repository: AbstractGenreRepository) -> None:
+        self.repository = repository
+
+    def execute(self, input: Input) -> BulkDeleteOutput:
+        ids = list(dict.fromkeys(input.ids))
+        validate_bulk_size(len(ids))
+
+        missing_ids = self.repository.delete_many(set(ids))
+
+        return BulkDeleteOutput(missing_ids=[id for id in ids if id in missing_ids])
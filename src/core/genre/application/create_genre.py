@@ -30,16 +30,13 @@ class CreateGenre:
         self.category_repository: AbstractCategoryRepository = category_repository
 
     def execute(self, input: Input) -> Output:
-        existing_category_ids = {
-            category.id
-            for category in self.category_repository.list()
-        }
+        missing_category_ids = self.category_repository.get_missing_ids(
+            ids=set(input.categories),
+        )
 
-        input_categories_set = set(input.categories)
-
-        if not input_categories_set.issubset(existing_category_ids):
+        if missing_category_ids:
             raise RelatedCategoriesNotFound(
-                f"Categories not found: {input_categories_set - existing_category_ids}"
+                f"Categories not found: {missing_category_ids}"
             )
 
         try:
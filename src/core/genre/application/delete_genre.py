@@ -13,9 +13,5 @@ class DeleteGenre:
         self.repository = repository
 
     def execute(self, input: Input) -> None:
-        genre = self.repository.get_by_id(id=input.id)
-
-        if genre is None:
+        if not self.repository.delete(id=input.id):
             raise GenreNotFound()
-
-        self.repository.delete(id=genre.id)
@@ -1,3 +1,6 @@
+from typing import Any
+
+
 class RelatedCategoriesNotFound(Exception):
     pass
 
@@ -8,3 +11,22 @@ class InvalidGenreData(Exception):
 
 class GenreNotFound(Exception):
     pass
+
+
+class GenreVersionConflict(Exception):
+    pass
+
+
+class InvalidCategoriesLimitRequested(Exception):
+    message_template = (
+        "Provided categories limit {categories_limit} is not valid"
+    )
+
+    def __init__(
+        self,
+        categories_limit: Any,
+    ) -> None:
+        message = self.message_template.format(
+            categories_limit=repr(categories_limit),
+        )
+        super().__init__(message)
@@ -0,0 +1,34 @@
+from dataclasses import dataclass
+from dataclasses import fields as dataclass_fields
+from typing import Any
+from uuid import UUID
+
+from src.core.category.gateway.category_gateway import AbstractCategoryRepository
+
+EXPANDABLE_GENRE_FIELDS = ["categories"]
+
+
+@dataclass
+class CategorySummaryOutput:
+    id: UUID
+    name: str
+    is_active: bool
+
+
+def get_category_summaries(
+    category_repository: AbstractCategoryRepository,
+    genres: list[Any],
+) -> dict[UUID, CategorySummaryOutput]:
+    category_ids = {
+        category_id
+        for genre in genres
+        for category_id in getattr(genre, "categories", [])
+    }
+
+    return {
+        values["id"]: CategorySummaryOutput(**values)
+        for values in category_repository.list_values_by_ids(
+            ids=category_ids,
+            fields=[field.name for field in dataclass_fields(CategorySummaryOutput)],
+        )
+    }
@@ -1,36 +1,58 @@
-# from dataclasses import dataclass
-# from uuid import UUID
-# from src.core.genre.application.errors import GenreNotFound
-
-# from src.core.genre.gateway.genre_gateway import AbstractGenreRepository
-
-
-# @dataclass
-# class GetGenreInput:
-#     id: UUID
-
-
-# @dataclass
-# class GetGenreOutput:
-#     id: UUID
-#     name: str
-#     description: str
-#     is_active: bool
-
-
-# class GetGenre:
-#     def __init__(self, repository: AbstractGenreRepository) -> None:
-#         self.repository: AbstractGenreRepository = repository
-
-#     def execute(self, input: GetGenreInput) -> GetGenreOutput | None:
-#         genre = self.repository.get_by_id(id=input.id)
-
-#         if genre is None:
-#             raise GenreNotFound()
-
-#         return GetGenreOutput(
-#             id=genre.id,
-#             name=genre.name,
-#             description=genre.description,
-#             is_active=genre.is_active,
-#         )
+from dataclasses import dataclass
+from uuid import UUID
+
+from src.core.genre.application.errors import GenreNotFound
+from src.core.genre.application.inline_categories import (
+    get_validated_categories_limit,
+)
+from src.core.genre.gateway.genre_gateway import AbstractGenreRepository
+from src.core.shared.application.fields import (
+    get_output_fields,
+    get_reduced_output,
+    get_validated_fields,
+)
+
+
+class GetGenre:
+    @dataclass
+    class Input:
+        id: UUID
+        categories_limit: int | str | None = None
+        fields: str | list[str] | None = None
+
+    @dataclass
+    class Output:
+        id: UUID
+        name: str
+        is_active: bool
+        categories: list[UUID]
+        categories_count: int
+        version: int
+
+    def __init__(self, repository: AbstractGenreRepository):
+        self.repository = repository
+
+    def execute(self, input: Input) -> Output:
+        categories_limit = get_validated_categories_limit(input.categories_limit)
+        fields = get_validated_fields(
+            fields=input.fields,
+            output_class=GetGenre.Output,
+        )
+
+        values = self.repository.get_values_by_id(
+            id=input.id,
+            fields=fields or get_output_fields(GetGenre.Output),
+            categories_limit=categories_limit,
+        )
+
+        if values is None:
+            raise GenreNotFound()
+
+        if fields is not None:
+            return get_reduced_output(
+                output_class=GetGenre.Output,
+                fields=fields,
+                values=values,
+            )
+
+        return GetGenre.Output(**values)
@@ -0,0 +1,31 @@
+from collections.abc import Sequence
+from typing import Any
+from uuid import UUID
+
+from src.core.genre.application.errors import InvalidCategoriesLimitRequested
+
+
+def get_validated_categories_limit(categories_limit: Any) -> int | None:
+    if categories_limit is None:
+        return None
+
+    try:
+        if isinstance(categories_limit, float) and not categories_limit.is_integer():
+            raise ValueError
+        validated_limit = int(categories_limit)
+    except (TypeError, ValueError):
+        raise InvalidCategoriesLimitRequested(categories_limit=categories_limit)
+
+    if validated_limit < 0:
+        raise InvalidCategoriesLimitRequested(categories_limit=categories_limit)
+
+    return validated_limit
+
+
+def get_inline_categories(
+    categories: Sequence[UUID],
+    categories_limit: int | None,
+) -> list[UUID]:
+    if categories_limit is None:
+        return list(categories)
+    return list(categories[:categories_limit])
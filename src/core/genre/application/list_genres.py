@@ -1,8 +1,15 @@
+from collections.abc import Sequence
 from dataclasses import dataclass
+from typing import Any
 from uuid import UUID
 
+from src.core.genre.application.inline_categories import (
+    get_inline_categories,
+    get_validated_categories_limit,
+)
 from src.core.genre.domain.genre import Genre
 from src.core.shared.application.list import PaginatedListUseCase
+from src.core.shared.application.ordering import get_row_value
 
 
 @dataclass
@@ -10,24 +17,53 @@ class GenreOutput:
     id: UUID
     name: str
     categories: list[UUID]
+    categories_count: int
     is_active: bool
 
 
 class ListGenres(PaginatedListUseCase[Genre, GenreOutput]):
+    output_class = GenreOutput
     default_order_by_field = "name"
     order_by_fields = [
         "name",
         "-name",
     ]
 
+    @dataclass
+    class Input(PaginatedListUseCase.Input):
+        categories_limit: int | str | None = None
+
+    def execute(
+        self,
+        input: PaginatedListUseCase.Input,
+    ) -> PaginatedListUseCase.Output[GenreOutput]:
+        categories_limit = get_validated_categories_limit(
+            getattr(input, "categories_limit", None),
+        )
+
+        output = super().execute(input=input)
+
+        if categories_limit is not None:
+            for genre in output.data:
+                if hasattr(genre, "categories"):
+                    genre.categories = get_inline_categories(
+                        genre.categories,
+                        categories_limit=categories_limit,
+                    )
+
+        return output
+
     @staticmethod
-    def get_output_data_from_entities(entities: list[Genre]) -> list[GenreOutput]:
+    def get_output_data_from_entities(
+        entities: Sequence[Genre | dict[str, Any]],
+    ) -> list[GenreOutput]:
         return [
             GenreOutput(
-                id=genre.id,
-                name=genre.name,
-                is_active=genre.is_active,
-                categories=genre.categories,
+                id=get_row_value(genre, "id"),
+                name=get_row_value(genre, "name"),
+                is_active=get_row_value(genre, "is_active"),
+                categories=get_row_value(genre, "categories"),
+                categories_count=get_row_value(genre, "categories_count"),
             )
             for genre in entities
         ]
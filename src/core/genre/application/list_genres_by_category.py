@@ -0,0 +1,106 @@
+from typing import Any
+from uuid import UUID
+
+from src.core.category.application.errors import CategoryNotFound
+from src.core.category.gateway.category_gateway import AbstractCategoryRepository
+from src.core.genre.application.list_genres import GenreOutput, ListGenres
+from src.core.genre.domain.genre import Genre
+from src.core.genre.gateway.genre_gateway import AbstractGenreRepository
+from src.core.shared.application.count import TotalMode
+from src.core.shared.application.cursor import Cursor
+from src.core.shared.application.list import PaginatedListUseCase
+
+
+class CategoryGenresRepository:
+    def __init__(self, repository: AbstractGenreRepository, category_id: UUID):
+        self.repository = repository
+        self.category_id = category_id
+
+    def list_after(
+        self,
+        cursor: Cursor | None,
+        order_by: str,
+        limit: int,
+    ) -> list[Genre]:
+        return self.repository.list_by_category_after(
+            category_id=self.category_id,
+            cursor=cursor,
+            order_by=order_by,
+            limit=limit,
+        )
+
+    def list_values_after(
+        self,
+        fields: list[str],
+        cursor: Cursor | None,
+        order_by: str,
+        limit: int,
+    ) -> list[dict[str, Any]]:
+        return self.repository.list_values_by_category_after(
+            category_id=self.category_id,
+            fields=fields,
+            cursor=cursor,
+            order_by=order_by,
+            limit=limit,
+        )
+
+    def list_values(
+        self,
+        fields: list[str],
+        order_by: str | None,
+        page: int,
+        page_size: int | None = None,
+        with_total: bool = False,
+    ) -> list[dict[str, Any]]:
+        return self.repository.list_values_by_category(
+            category_id=self.category_id,
+            fields=fields,
+            order_by=order_by,
+            page=page,
+            page_size=page_size,
+            with_total=with_total,
+        )
+
+    def list(
+        self,
+        order_by: str | None,
+        page: int,
+        page_size: int | None = None,
+        with_total: bool = False,
+    ) -> list[Genre]:
+        return self.repository.list_by_category(
+            category_id=self.category_id,
+            order_by=order_by,
+            page=page,
+            page_size=page_size,
+            with_total=with_total,
+        )
+
+    def count(self, mode: TotalMode = TotalMode.EXACT) -> int:
+        return self.repository.count_by_category(category_id=self.category_id)
+
+
+class ListGenresByCategory(ListGenres):
+    def __init__(
+        self,
+        repository: AbstractGenreRepository,
+        category_repository: AbstractCategoryRepository,
+        category_id: UUID,
+    ):
+        super().__init__(
+            repository=CategoryGenresRepository(
+                repository=repository,
+                category_id=category_id,
+            ),
+        )
+        self.category_repository = category_repository
+        self.category_id = category_id
+
+    def execute(
+        self,
+        input: PaginatedListUseCase.Input,
+    ) -> PaginatedListUseCase.Output[GenreOutput]:
+        if self.category_repository.get_missing_ids(ids={self.category_id}):
+            raise CategoryNotFound()
+
+        return super().execute(input=input)
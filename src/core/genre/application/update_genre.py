@@ -4,10 +4,14 @@ from uuid import UUID
 from src.core.category.gateway.category_gateway import AbstractCategoryRepository
 from src.core.genre.application.errors import (
     GenreNotFound,
+    GenreVersionConflict,
     InvalidGenreData,
     RelatedCategoriesNotFound,
 )
-from src.core.genre.gateway.genre_gateway import AbstractGenreRepository
+from src.core.genre.gateway.genre_gateway import (
+    AbstractGenreRepository,
+    GenreChanges,
+)
 
 
 class UpdateGenre:
@@ -18,6 +22,7 @@ class UpdateGenre:
         name: str | None = None
         is_active: bool | None = None
         categories: list[UUID] | None = None
+        version: int | None = None
 
     @dataclass
     class Output:
@@ -25,6 +30,7 @@ class UpdateGenre:
         is_active: bool
         name: str
         categories: list[UUID]
+        version: int
 
     def __init__(
         self,
@@ -41,35 +47,43 @@ class UpdateGenre:
         if genre is None:
             raise GenreNotFound()
 
+        if input.version is not None and input.version != genre.version:
+            raise GenreVersionConflict()
+
+        changes = GenreChanges()
+
         if input.categories is not None:
             input_categories_set = set(input.categories)
             genre_categories_set = set(genre.categories)
 
-            existing_category_ids = {
-                category.id
-                for category in self.category_repository.list()
-            }
+            missing_category_ids = self.category_repository.get_missing_ids(
+                ids=input_categories_set,
+            )
 
-            if not set(input.categories).issubset(existing_category_ids):
+            if missing_category_ids:
                 raise RelatedCategoriesNotFound(
-                    f"Categories not found: "
-                    f"{input_categories_set - existing_category_ids}"
+                    f"Categories not found: {missing_category_ids}"
                 )
 
             category_ids_to_remove = genre_categories_set - input_categories_set
             category_ids_to_add = input_categories_set - genre_categories_set
 
-            for category_id in category_ids_to_remove:
-                genre.remove_category(category_id)
+            genre.remove_categories(category_ids_to_remove)
+            genre.add_categories(
+                category_id
+                for category_id in input.categories
+                if category_id in category_ids_to_add
+            )
 
-            for category_id in category_ids_to_add:
-                genre.add_category(category_id)
+            changes.category_ids_to_remove = category_ids_to_remove
+            changes.category_ids_to_add = category_ids_to_add
 
-        if input.name is not None:
+        if input.name is not None and input.name != genre.name:
             try:
                 genre.update_name(name=input.name)
             except ValueError as err:
                 raise InvalidGenreData(err)
+            changes.fields["name"] = genre.name
 
         if input.is_active is not None:
             if not genre.is_active:
@@ -82,12 +96,15 @@ class UpdateGenre:
                     genre.deactivate()
                 except ValueError as err:
                     raise InvalidGenreData(err)
+            changes.fields["is_active"] = genre.is_active
 
-        self.repository.update(genre=genre)
+        if not self.repository.update(genre=genre, changes=changes):
+            raise GenreVersionConflict()
 
         return UpdateGenre.Output(
             id=genre.id,
             name=genre.name,
             is_active=genre.is_active,
-            categories=genre.categories,
+            categories=list(genre.categories),
+            version=genre.version,
         )
@@ -0,0 +1,82 @@
+from dataclasses import dataclass, field
+from uuid import UUID
+
+from src.core.category.gateway.category_gateway import AbstractCategoryRepository
+from src.core.genre.application.errors import (
+    GenreVersionConflict,
+    InvalidGenreData,
+    RelatedCategoriesNotFound,
+)
+from src.core.genre.domain.genre import Genre
+from src.core.genre.gateway.genre_gateway import AbstractGenreRepository
+from src.core.shared.application.errors import StaleEntitiesError
+from src.core.shared.application.unit_of_work import AbstractUnitOfWork
+
+
+class UpsertGenre:
+    @dataclass
+    class Input:
+        id: UUID
+        name: str
+        categories: list[UUID] = field(default_factory=list)
+        is_active: bool = True
+        version: int | None = None
+
+    @dataclass
+    class Output:
+        id: UUID
+        name: str
+        is_active: bool
+        categories: list[UUID]
+        version: int
+        created: bool
+
+    def __init__(
+        self,
+        repository: AbstractGenreRepository,
+        category_repository: AbstractCategoryRepository,
+        unit_of_work: AbstractUnitOfWork,
+    ) -> None:
+        self.repository = repository
+        self.category_repository = category_repository
+        self.unit_of_work = unit_of_work
+
+    def execute(self, input: Input) -> Output:
+        missing_category_ids = self.category_repository.get_missing_ids(
+            ids=set(input.categories),
+        )
+
+        if missing_category_ids:
+            raise RelatedCategoriesNotFound(
+                f"Categories not found: {missing_category_ids}"
+            )
+
+        try:
+            genre = Genre(
+                id=input.id,
+                name=input.name,
+                is_active=input.is_active,
+                categories=input.categories,
+            )
+        except ValueError as err:
+            raise InvalidGenreData(err)
+
+        if input.version is None:
+            created = self.repository.upsert(genre=genre)
+        else:
+            genre.version = input.version
+            try:
+                with self.unit_of_work:
+                    self.unit_of_work.register_dirty(genre)
+            except StaleEntitiesError:
+                raise GenreVersionConflict()
+            created = False
+
+        return UpsertGenre.Output(
+            id=genre.id,
+            name=genre.name,
+            is_active=genre.is_active,
+            categories=list(genre.categories),
+            version=genre.version,
+            created=created,
+        )
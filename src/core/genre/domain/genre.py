@@ -1,7 +1,9 @@
+from collections.abc import Iterable, MutableSequence
 from dataclasses import dataclass, field
 from uuid import UUID
 
 from src.core.shared.domain.entity import Entity
+from src.core.shared.domain.ordered_set import OrderedSet
 
 MAX_GENRE_NAME_NUM_CARACTERS = 255
 DEFAULT_GENRE_IS_ACTIVE = True
@@ -11,7 +13,15 @@ DEFAULT_GENRE_IS_ACTIVE = True
 class Genre(Entity):
     name: str
     is_active: bool = field(default=DEFAULT_GENRE_IS_ACTIVE)
-    categories: list[UUID] = field(default_factory=list)
+    categories: MutableSequence[UUID] = field(default_factory=OrderedSet)
+
+    def __post_init__(self):
+        self.categories = OrderedSet(self.categories)
+        super().__post_init__()
+
+    @property
+    def categories_count(self) -> int:
+        return len(self.categories)
 
     def activate(self) -> None:
         self.is_active = True
@@ -37,6 +47,17 @@ class Genre(Entity):
         self.categories.remove(id)
         self.validate()
 
+    def add_categories(self, ids: Iterable[UUID]) -> None:
+        self.categories.extend(ids)
+        self.validate()
+
+    def remove_categories(self, ids: Iterable[UUID]) -> None:
+        categories = OrderedSet(self.categories)
+        for id in ids:
+            categories.discard(id)
+        self.categories = categories
+        self.validate()
+
     def validate(self) -> None:
         if len(self.name) > MAX_GENRE_NAME_NUM_CARACTERS:
             self.notification.add_error(
@@ -1,7 +1,25 @@
 from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Any
 from uuid import UUID
 
 from src.core.genre.domain.genre import Genre
+from src.core.shared.application.count import TotalMode
+from src.core.shared.application.cursor import Cursor
+
+
+@dataclass
+class GenreChanges:
+    fields: dict[str, Any] = field(default_factory=dict)
+    category_ids_to_add: set[UUID] = field(default_factory=set)
+    category_ids_to_remove: set[UUID] = field(default_factory=set)
+
+    def __bool__(self) -> bool:
+        return bool(
+            self.fields
+            or self.category_ids_to_add
+            or self.category_ids_to_remove
+        )
 
 
 class AbstractGenreRepository(ABC):
@@ -9,26 +27,139 @@ class AbstractGenreRepository(ABC):
     def save(self, genre: Genre) -> None:
         raise NotImplementedError
 
+    @abstractmethod
+    def save_many(self, genres: list[Genre]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def update_many(self, genres: list[Genre]) -> set[UUID]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete_many(self, ids: set[UUID]) -> set[UUID]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def upsert(self, genre: Genre) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    def upsert_many(self, genres: list[Genre]) -> set[UUID]:
+        raise NotImplementedError
+
     @abstractmethod
     def get_by_id(self, id: UUID) -> Genre | None:
         raise NotImplementedError
 
+    @abstractmethod
+    def get_missing_ids(self, ids: set[UUID]) -> set[UUID]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_values_by_id(
+        self,
+        id: UUID,
+        fields: list[str],
+        categories_limit: int | None = None,
+    ) -> dict[str, Any] | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def list_after(
+        self,
+        cursor: Cursor | None,
+        order_by: str,
+        limit: int,
+    ) -> list[Genre]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def list_values_after(
+        self,
+        fields: list[str],
+        cursor: Cursor | None,
+        order_by: str,
+        limit: int,
+    ) -> list[dict[str, Any]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def list_values(
+        self,
+        fields: list[str],
+        order_by: str | None = None,
+        page: int = 1,
+        page_size: int | None = None,
+        with_total: bool = False,
+    ) -> list[dict[str, Any]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def list_by_category_after(
+        self,
+        category_id: UUID,
+        cursor: Cursor | None,
+        order_by: str,
+        limit: int,
+    ) -> list[Genre]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def list_by_category(
+        self,
+        category_id: UUID,
+        order_by: str | None = None,
+        page: int = 1,
+        page_size: int | None = None,
+        with_total: bool = False,
+    ) -> list[Genre]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def list_values_by_category_after(
+        self,
+        category_id: UUID,
+        fields: list[str],
+        cursor: Cursor | None,
+        order_by: str,
+        limit: int,
+    ) -> list[dict[str, Any]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def list_values_by_category(
+        self,
+        category_id: UUID,
+        fields: list[str],
+        order_by: str | None = None,
+        page: int = 1,
+        page_size: int | None = None,
+        with_total: bool = False,
+    ) -> list[dict[str, Any]]:
+        raise NotImplementedError
+
     @abstractmethod
     def list(
         self,
         order_by: str | None,
         page: int,
+        page_size: int | None = None,
+        with_total: bool = False,
     ) -> list[Genre]:
         raise NotImplementedError
 
     @abstractmethod
-    def count(self) -> int:
+    def count(self, mode: TotalMode = TotalMode.EXACT) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    def count_by_category(self, category_id: UUID) -> int:
         raise NotImplementedError
 
     @abstractmethod
-    def delete(self, id: UUID) -> None:
+    def delete(self, id: UUID) -> bool:
         raise NotImplementedError
 
     @abstractmethod
-    def update(self, genre: Genre) -> None:
+    def update(self, genre: Genre, changes: GenreChanges | None = None) -> bool:
         raise NotImplementedError
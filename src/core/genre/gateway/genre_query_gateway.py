@@ -0,0 +1,53 @@
+from abc import ABC, abstractmethod
+from typing import Any
+
+from src.core.shared.application.count import TotalMode
+from src.core.shared.application.cursor import Cursor
+
+
+class AbstractGenreQueryGateway(ABC):
+    """Read-only access to the denormalized genre list, returned as rows."""
+
+    @abstractmethod
+    def list_after(
+        self,
+        cursor: Cursor | None,
+        order_by: str,
+        limit: int,
+    ) -> list[dict[str, Any]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def list_values_after(
+        self,
+        fields: list[str],
+        cursor: Cursor | None,
+        order_by: str,
+        limit: int,
+    ) -> list[dict[str, Any]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def list_values(
+        self,
+        fields: list[str],
+        order_by: str | None = None,
+        page: int = 1,
+        page_size: int | None = None,
+        with_total: bool = False,
+    ) -> list[dict[str, Any]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def list(
+        self,
+        order_by: str | None = None,
+        page: int = 1,
+        page_size: int | None = None,
+        with_total: bool = False,
+    ) -> list[dict[str, Any]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def count(self, mode: TotalMode = TotalMode.EXACT) -> int:
+        raise NotImplementedError
@@ -1,11 +1,21 @@
 from copy import deepcopy
 from math import ceil
+from typing import Any
 from uuid import UUID
 
 from src.core.genre.domain.genre import Genre
-from src.core.genre.gateway.genre_gateway import AbstractGenreRepository
+from src.core.genre.gateway.genre_gateway import (
+    AbstractGenreRepository,
+    GenreChanges,
+)
 from src.core.shared import settings
+from src.core.shared.application.count import TotalMode
+from src.core.shared.application.cursor import Cursor
 from src.core.shared.application.errors import InvalidPageRequested
+from src.core.shared.application.ordering import (
+    filter_rows_after_cursor,
+    sort_rows,
+)
 
 
 class InMemoryGenreRepository(AbstractGenreRepository):
@@ -18,6 +28,54 @@ class InMemoryGenreRepository(AbstractGenreRepository):
     def save(self, genre: Genre) -> None:
         self.genres.append(genre)
 
+    def save_many(self, genres: list[Genre]) -> None:
+        self.genres.extend(genres)
+
+    def update_many(self, genres: list[Genre]) -> set[UUID]:
+        versions = {genre.id: genre.version for genre in self.genres}
+        conflicted_ids = {
+            genre.id
+            for genre in genres
+            if versions.get(genre.id) != genre.version
+        }
+        self._replace_many([
+            genre
+            for genre in genres
+            if genre.id not in conflicted_ids
+        ])
+        return conflicted_ids
+
+    def _replace_many(self, genres: list[Genre]) -> None:
+        genres_by_id = {genre.id: genre for genre in genres}
+        for index, genre in enumerate(self.genres):
+            updated_genre = genres_by_id.get(genre.id)
+            if updated_genre is not None:
+                updated_genre.version = genre.version + 1
+                self.genres[index] = updated_genre
+
+    def delete_many(self, ids: set[UUID]) -> set[UUID]:
+        missing_ids = ids - {genre.id for genre in self.genres}
+        self.genres[:] = [
+            genre
+            for genre in self.genres
+            if genre.id not in ids
+        ]
+        return missing_ids
+
+    def upsert(self, genre: Genre) -> bool:
+        return bool(self.upsert_many([genre]))
+
+    def upsert_many(self, genres: list[Genre]) -> set[UUID]:
+        existing_ids = {genre.id for genre in self.genres}
+        new_genres = [
+            genre
+            for genre in genres
+            if genre.id not in existing_ids
+        ]
+        self._replace_many(genres)
+        self.save_many(new_genres)
+        return {genre.id for genre in new_genres}
+
     def get_by_id(self, id: UUID) -> Genre | None:
         return next(
             (
@@ -28,15 +86,147 @@ class InMemoryGenreRepository(AbstractGenreRepository):
             None,
         )
 
-    def delete(self, id: UUID) -> None:
+    def get_missing_ids(self, ids: set[UUID]) -> set[UUID]:
+        return ids - {genre.id for genre in self.genres}
+
+    def delete(self, id: UUID) -> bool:
+        return not self.delete_many({id})
+
+    def list_after(
+        self,
+        cursor: Cursor | None,
+        order_by: str,
+        limit: int,
+    ) -> list[Genre]:
+        sorted_genres = sort_rows(
+            [
+                deepcopy(genre)
+                for genre in self.genres
+            ],
+            order_by=order_by,
+        )
+
+        if cursor is not None:
+            sorted_genres = filter_rows_after_cursor(
+                sorted_genres,
+                cursor=cursor,
+                order_by=order_by,
+            )
+
+        return sorted_genres[:limit]
+
+    def get_values_by_id(
+        self,
+        id: UUID,
+        fields: list[str],
+        categories_limit: int | None = None,
+    ) -> dict[str, Any] | None:
         genre = self.get_by_id(id)
-        if genre:
-            self.genres.remove(genre)
+        if genre is None:
+            return None
+
+        values = {field: getattr(genre, field) for field in fields}
+        if "categories" in values:
+            values["categories"] = list(genre.categories[:categories_limit])
+        return values
+
+    def list_values_after(
+        self,
+        fields: list[str],
+        cursor: Cursor | None,
+        order_by: str,
+        limit: int,
+    ) -> list[dict[str, Any]]:
+        return [
+            {field: getattr(genre, field) for field in fields}
+            for genre in self.list_after(
+                cursor=cursor,
+                order_by=order_by,
+                limit=limit,
+            )
+        ]
+
+    def list_values(
+        self,
+        fields: list[str],
+        order_by: str | None = None,
+        page: int | None = None,
+        page_size: int | None = None,
+        with_total: bool = False,
+    ) -> list[dict[str, Any]]:
+        return [
+            {field: getattr(genre, field) for field in fields}
+            for genre in self.list(
+                order_by=order_by,
+                page=page,
+                page_size=page_size,
+            )
+        ]
+
+    def list_by_category_after(
+        self,
+        category_id: UUID,
+        cursor: Cursor | None,
+        order_by: str,
+        limit: int,
+    ) -> list[Genre]:
+        return self._get_category_repository(category_id).list_after(
+            cursor=cursor,
+            order_by=order_by,
+            limit=limit,
+        )
+
+    def list_by_category(
+        self,
+        category_id: UUID,
+        order_by: str | None = None,
+        page: int | None = None,
+        page_size: int | None = None,
+        with_total: bool = False,
+    ) -> list[Genre]:
+        return self._get_category_repository(category_id).list(
+            order_by=order_by,
+            page=page,
+            page_size=page_size,
+        )
+
+    def list_values_by_category_after(
+        self,
+        category_id: UUID,
+        fields: list[str],
+        cursor: Cursor | None,
+        order_by: str,
+        limit: int,
+    ) -> list[dict[str, Any]]:
+        return self._get_category_repository(category_id).list_values_after(
+            fields=fields,
+            cursor=cursor,
+            order_by=order_by,
+            limit=limit,
+        )
+
+    def list_values_by_category(
+        self,
+        category_id: UUID,
+        fields: list[str],
+        order_by: str | None = None,
+        page: int | None = None,
+        page_size: int | None = None,
+        with_total: bool = False,
+    ) -> list[dict[str, Any]]:
+        return self._get_category_repository(category_id).list_values(
+            fields=fields,
+            order_by=order_by,
+            page=page,
+            page_size=page_size,
+        )
 
     def list(
         self,
         order_by: str | None = None,
         page: int | None = None,
+        page_size: int | None = None,
+        with_total: bool = False,
     ) -> list[Genre]:
         genres = [
             deepcopy(genre)
@@ -44,29 +234,38 @@ class InMemoryGenreRepository(AbstractGenreRepository):
         ]
 
         if order_by is not None:
-            sorted_genres = sorted(
-                genres,
-                key=lambda genre: getattr(genre, order_by.strip("-")),
-                reverse=order_by.startswith("-"),
-            )
+            genres = sort_rows(genres, order_by=order_by)
 
         if page is not None:
-            page_size = settings.REPOSITORY["page_size"]
+            if page_size is None:
+                page_size = settings.REPOSITORY["page_size"]
             page_offset = (page - 1) * page_size
 
             num_elements = max(1, self.count())
             if page > ceil(num_elements / page_size):
                 raise InvalidPageRequested(page=page)
 
-            return sorted_genres[page_offset:page_offset + page_size]
+            return genres[page_offset:page_offset + page_size]
 
         return list(genres)
 
-    def count(self) -> int:
+    def count(self, mode: TotalMode = TotalMode.EXACT) -> int:
         return len(self.genres)
 
-    def update(self, genre: Genre) -> None:
-        old_genre = self.get_by_id(genre.id)
-        if old_genre:
-            self.genres.remove(old_genre)
-            self.genres.append(genre)
+    def count_by_category(self, category_id: UUID) -> int:
+        return self._get_category_repository(category_id).count()
+
+    def _get_category_repository(
+        self,
+        category_id: UUID,
+    ) -> "InMemoryGenreRepository":
+        return InMemoryGenreRepository(
+            [
+                genre
+                for genre in self.genres
+                if category_id in genre.categories
+            ]
+        )
+
+    def update(self, genre: Genre, changes: GenreChanges | None = None) -> bool:
+        return not self.update_many([genre])
@@ -0,0 +1,79 @@
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+
+from src.core.category.domain.category import Category
+from src.core.category.infra.in_memory_category_repository import (
+    InMemoryCategoryRepository,
+)
+from src.core.genre.application.bulk_create_genres import BulkCreateGenres
+from src.core.genre.application.create_genre import CreateGenre
+from src.core.genre.domain.genre import Genre
+from src.core.genre.infra.in_memory_genre_repository import InMemoryGenreRepository
+from src.core.shared import settings as core_settings
+from src.core.shared.application.errors import InvalidBulkSizeRequested
+from src.core.shared.infra.in_memory_unit_of_work import InMemoryUnitOfWork
+
+
+@pytest.fixture
+def category_repository(movie_category: Category) -> InMemoryCategoryRepository:
+    return InMemoryCategoryRepository(categories=[movie_category])
+
+
+class TestBulkCreateGenres:
+    def test_saves_valid_genres_and_reports_errors_by_index(
+        self,
+        movie_category: Category,
+        genre_repository: InMemoryGenreRepository,
+        category_repository: InMemoryCategoryRepository,
+    ) -> None:
+        use_case = BulkCreateGenres(
+            category_repository=category_repository,
+            unit_of_work=InMemoryUnitOfWork(
+                repositories={Genre: genre_repository},
+            ),
+        )
+
+        output = use_case.execute(
+            input=BulkCreateGenres.Input(
+                items=[
+                    CreateGenre.Input(name="Romance", categories=[movie_category.id]),
+                    CreateGenre.Input(name="Drama", categories=[uuid4()]),
+                    CreateGenre.Input(name=""),
+                    CreateGenre.Input(name="Horror"),
+                ],
+            ),
+        )
+
+        assert [genre.id for genre in genre_repository.genres] == output.ids
+        assert [genre.name for genre in genre_repository.genres] == [
+            "Romance",
+            "Horror",
+        ]
+        assert [error.index for error in output.errors] == [1, 2]
+
+    def test_rejects_too_many_items(
+        self,
+        genre_repository: InMemoryGenreRepository,
+        category_repository: InMemoryCategoryRepository,
+    ) -> None:
+        use_case = BulkCreateGenres(
+            category_repository=category_repository,
+            unit_of_work=InMemoryUnitOfWork(
+                repositories={Genre: genre_repository},
+            ),
+        )
+
+        with patch.dict(core_settings.REPOSITORY, {"max_bulk_size": 1}):
+            with pytest.raises(InvalidBulkSizeRequested):
+                use_case.execute(
+                    input=BulkCreateGenres.Input(
+                        items=[
+                            CreateGenre.Input(name="Romance"),
+                            CreateGenre.Input(name="Drama"),
+                        ],
+                    ),
+                )
+
+        assert genre_repository.genres == []
@@ -0,0 +1,39 @@
+from uuid import uuid4
+
+import pytest
+
+from src.core.genre.application.errors import GenreNotFound
+from src.core.genre.application.get_genre import GetGenre
+from src.core.genre.domain.genre import Genre
+from src.core.genre.infra.in_memory_genre_repository import InMemoryGenreRepository
+
+
+class TestGetGenre:
+    def test_get_genre_success(
+        self,
+        romance_genre: Genre,
+        genre_repository: InMemoryGenreRepository,
+    ) -> None:
+        genre_repository.save(romance_genre)
+
+        output = GetGenre(repository=genre_repository).execute(
+            input=GetGenre.Input(id=romance_genre.id),
+        )
+
+        assert output == GetGenre.Output(
+            id=romance_genre.id,
+            name=romance_genre.name,
+            is_active=romance_genre.is_active,
+            categories=list(romance_genre.categories),
+            categories_count=romance_genre.categories_count,
+            version=romance_genre.version,
+        )
+
+    def test_get_genre_does_not_exist_error(
+        self,
+        genre_repository: InMemoryGenreRepository,
+    ) -> None:
+        with pytest.raises(GenreNotFound):
+            GetGenre(repository=genre_repository).execute(
+                input=GetGenre.Input(id=uuid4()),
+            )
@@ -66,7 +66,8 @@ class TestListGenre:
                 GenreOutput(
                     id=genre.id,
                     name=genre.name,
-                    categories=genre.categories,
+                    categories=list(genre.categories),
+                    categories_count=genre.categories_count,
                     is_active=genre.is_active,
                 )
                 for genre in expected_genres
@@ -114,7 +115,8 @@ class TestListGenre:
                 GenreOutput(
                     id=genre.id,
                     name=genre.name,
-                    categories=genre.categories,
+                    categories=list(genre.categories),
+                    categories_count=genre.categories_count,
                     is_active=genre.is_active,
                 )
                 for genre in expected_genres
@@ -205,7 +207,8 @@ class TestListGenre:
                 GenreOutput(
                     id=genre.id,
                     name=genre.name,
-                    categories=genre.categories,
+                    categories=list(genre.categories),
+                    categories_count=genre.categories_count,
                     is_active=genre.is_active,
                 )
                 for genre in expected_output_by_page[page]
@@ -220,6 +223,23 @@ class TestListGenre:
                         for genre in genres
                     ]
                 ),
+                next_cursor=(
+                    ListGenres.get_cursor(
+                        entity=expected_output_by_page[page][-1],
+                        order_by=order_by,
+                    )
+                    if page < 3
+                    else None
+                ),
+                prev_cursor=(
+                    ListGenres.get_cursor(
+                        entity=expected_output_by_page[page][0],
+                        order_by=order_by,
+                        backward=True,
+                    )
+                    if page > 1
+                    else None
+                ),
             )
         )
 
@@ -0,0 +1,99 @@
+from uuid import uuid4
+
+import pytest
+
+from src.core.category.application.errors import CategoryNotFound
+from src.core.category.domain.category import Category
+from src.core.category.infra.in_memory_category_repository import (
+    InMemoryCategoryRepository,
+)
+from src.core.genre.application.list_genres import GenreOutput
+from src.core.genre.application.list_genres_by_category import ListGenresByCategory
+from src.core.genre.domain.genre import Genre
+from src.core.genre.infra.in_memory_genre_repository import InMemoryGenreRepository
+
+
+@pytest.fixture
+def category_repository(
+    movie_category: Category,
+    documentary_category: Category,
+) -> InMemoryCategoryRepository:
+    return InMemoryCategoryRepository(
+        categories=[movie_category, documentary_category],
+    )
+
+
+class TestListGenresByCategory:
+    def test_lists_only_genres_linked_to_category(
+        self,
+        romance_genre: Genre,
+        drama_genre: Genre,
+        horror_genre: Genre,
+        documentary_category: Category,
+        genre_repository: InMemoryGenreRepository,
+        category_repository: InMemoryCategoryRepository,
+    ) -> None:
+        genre_repository.save(romance_genre)
+        genre_repository.save(drama_genre)
+        genre_repository.save(horror_genre)
+
+        use_case = ListGenresByCategory(
+            repository=genre_repository,
+            category_repository=category_repository,
+            category_id=documentary_category.id,
+        )
+
+        output = use_case.execute(input=ListGenresByCategory.Input())
+
+        assert output.data == [
+            GenreOutput(
+                id=romance_genre.id,
+                name=romance_genre.name,
+                categories=list(romance_genre.categories),
+                categories_count=romance_genre.categories_count,
+                is_active=romance_genre.is_active,
+            ),
+        ]
+        assert output.meta.total == 1
+
+    def test_pages_genres_of_category(
+        self,
+        romance_genre: Genre,
+        drama_genre: Genre,
+        movie_category: Category,
+        genre_repository: InMemoryGenreRepository,
+        category_repository: InMemoryCategoryRepository,
+    ) -> None:
+        genre_repository.save(romance_genre)
+        genre_repository.save(drama_genre)
+
+        use_case = ListGenresByCategory(
+            repository=genre_repository,
+            category_repository=category_repository,
+            category_id=movie_category.id,
+        )
+
+        first_page = use_case.execute(
+            input=ListGenresByCategory.Input(order_by="-name", per_page=1),
+        )
+        second_page = use_case.execute(
+            input=ListGenresByCategory.Input(cursor=first_page.meta.next_cursor),
+        )
+
+        assert [genre.name for genre in first_page.data] == ["Romance"]
+        assert [genre.name for genre in second_page.data] == ["Drama"]
+        assert first_page.meta.total == 2
+
+    def test_when_category_does_not_exist_then_raise_error(
+        self,
+        genre_repository: InMemoryGenreRepository,
+        category_repository: InMemoryCategoryRepository,
+    ) -> None:
+        use_case = ListGenresByCategory(
+            repository=genre_repository,
+            category_repository=category_repository,
+            category_id=uuid4(),
+        )
+
+        with pytest.raises(CategoryNotFound):
+            use_case.execute(input=ListGenresByCategory.Input())
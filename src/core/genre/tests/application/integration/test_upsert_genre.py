@@ -0,0 +1,73 @@
+from uuid import uuid4
+
+import pytest
+
+from src.core.category.domain.category import Category
+from src.core.category.infra.in_memory_category_repository import (
+    InMemoryCategoryRepository,
+)
+from src.core.genre.application.errors import RelatedCategoriesNotFound
+from src.core.genre.application.upsert_genre import UpsertGenre
+from src.core.genre.domain.genre import Genre
+from src.core.genre.infra.in_memory_genre_repository import InMemoryGenreRepository
+from src.core.shared.infra.in_memory_unit_of_work import InMemoryUnitOfWork
+
+
+class TestUpsertGenre:
+    def test_creates_then_replaces_genre(
+        self,
+        movie_category: Category,
+        documentary_category: Category,
+    ) -> None:
+        genre_repository = InMemoryGenreRepository()
+        use_case = UpsertGenre(
+            repository=genre_repository,
+            category_repository=InMemoryCategoryRepository(
+                categories=[movie_category, documentary_category],
+            ),
+            unit_of_work=InMemoryUnitOfWork(
+                repositories={Genre: genre_repository},
+            ),
+        )
+        genre_id = uuid4()
+
+        created_output = use_case.execute(
+            input=UpsertGenre.Input(
+                id=genre_id,
+                name="Romance",
+                categories=[movie_category.id],
+            ),
+        )
+        replaced_output = use_case.execute(
+            input=UpsertGenre.Input(
+                id=genre_id,
+                name="Love",
+                categories=[documentary_category.id],
+            ),
+        )
+
+        assert created_output.created is True
+        assert replaced_output.created is False
+        assert genre_repository.genres == [Genre(id=genre_id, name="Love")]
+        assert genre_repository.genres[0].categories == [documentary_category.id]
+
+    def test_when_categories_do_not_exist_then_raise_error(self) -> None:
+        genre_repository = InMemoryGenreRepository()
+        use_case = UpsertGenre(
+            repository=genre_repository,
+            category_repository=InMemoryCategoryRepository(),
+            unit_of_work=InMemoryUnitOfWork(
+                repositories={Genre: genre_repository},
+            ),
+        )
+
+        with pytest.raises(RelatedCategoriesNotFound):
+            use_case.execute(
+                input=UpsertGenre.Input(
+                    id=uuid4(),
+                    name="Romance",
+                    categories=[uuid4()],
+                ),
+            )
+
+        assert genre_repository.genres == []
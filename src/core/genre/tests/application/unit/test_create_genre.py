@@ -35,14 +35,14 @@ def mocked_category_repository_with_categories(
     documentary_category,
 ) -> AbstractCategoryRepository:
     repository = create_autospec(AbstractCategoryRepository)
-    repository.list.return_value = [movie_category, documentary_category]
+    repository.get_missing_ids.return_value = set()
     return repository
 
 
 @pytest.fixture
 def mocked_empty_category_repository() -> AbstractCategoryRepository:
     repository = create_autospec(AbstractCategoryRepository)
-    repository.list.return_value = []
+    repository.get_missing_ids.side_effect = lambda ids: set(ids)
     return repository
 
 
@@ -68,7 +68,9 @@ class TestCreateGenre:
                 )
             )
 
-        mocked_empty_category_repository.list.assert_called_once_with()
+        mocked_empty_category_repository.get_missing_ids.assert_called_once_with(
+            ids={category_id},
+        )
         mocked_genre_repository.save.assert_not_called()
         assert str(category_id) in str(exc.value)
 
@@ -92,7 +94,9 @@ class TestCreateGenre:
                 )
             )
 
-        mocked_category_repository_with_categories.list.assert_called_with()
+        mocked_category_repository_with_categories.get_missing_ids.assert_called_with(
+            ids={documentary_category.id, movie_category.id},
+        )
         mocked_genre_repository.save.assert_not_called()
 
     def test_when_created_genre_is_valid_and_categories_exist_then_save_genre(
@@ -115,7 +119,9 @@ class TestCreateGenre:
         )
 
         assert output == CreateGenre.Output(id=output.id)
-        mocked_category_repository_with_categories.list.assert_called_with()
+        mocked_category_repository_with_categories.get_missing_ids.assert_called_with(
+            ids={documentary_category.id, movie_category.id},
+        )
         mocked_genre_repository.save.assert_called_once_with(
             Genre(
                 id=output.id,
@@ -141,7 +147,9 @@ class TestCreateGenre:
             )
         )
 
-        mocked_category_repository_with_categories.list.assert_called_with()
+        mocked_category_repository_with_categories.get_missing_ids.assert_called_with(
+            ids=set(),
+        )
 
         assert output == CreateGenre.Output(id=output.id)
         mocked_genre_repository.save.assert_called_once_with(
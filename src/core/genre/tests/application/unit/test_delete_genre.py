@@ -53,21 +53,21 @@ class TestDeleteGenre:
         romance_genre: Genre,
         mocked_genre_repository: MagicMock,
     ):
-        mocked_genre_repository.get_by_id.return_value = romance_genre
+        mocked_genre_repository.delete.return_value = True
 
         input = DeleteGenre.Input(id=romance_genre.id)
         delete_genre = DeleteGenre(repository=mocked_genre_repository)
 
         delete_genre.execute(input=input)
 
-        mocked_genre_repository.get_by_id.assert_called_once_with(id=romance_genre.id)
+        mocked_genre_repository.get_by_id.assert_not_called()
         mocked_genre_repository.delete.assert_called_once_with(id=romance_genre.id)
 
     def test_delete_genre_does_not_exist_error(
         self,
     ):
         mocked_genre_repository = create_autospec(InMemoryGenreRepository)
-        mocked_genre_repository.get_by_id.return_value = None
+        mocked_genre_repository.delete.return_value = False
 
         non_existing_id = uuid4()
         input = DeleteGenre.Input(id=non_existing_id)
@@ -76,5 +76,4 @@ class TestDeleteGenre:
         with pytest.raises(GenreNotFound):
             delete_genre.execute(input=input)
 
-        mocked_genre_repository.get_by_id.assert_called_once_with(id=non_existing_id)
-        mocked_genre_repository.delete.assert_not_called()
+        mocked_genre_repository.delete.assert_called_once_with(id=non_existing_id)
@@ -15,6 +15,7 @@ from src.core.genre.application.errors import (
 )
 from src.core.genre.application.update_genre import UpdateGenre
 from src.core.genre.domain.genre import Genre
+from src.core.genre.gateway.genre_gateway import GenreChanges
 from src.core.genre.infra.in_memory_genre_repository import InMemoryGenreRepository
 
 
@@ -50,10 +51,10 @@ def mocked_category_repository(
     documentary_category: Category,
 ) -> MagicMock:
     mocked_repository = create_autospec(InMemoryCategoryRepository)
-    mocked_repository.list.return_value = [
-        movie_category,
-        documentary_category,
-    ]
+    mocked_repository.get_missing_ids.side_effect = lambda ids: ids - {
+        movie_category.id,
+        documentary_category.id,
+    }
     return mocked_repository
 
 
@@ -107,7 +108,9 @@ class TestUpdateGenre:
             update_genre.execute(input=input)
 
         mocked_genre_repository.get_by_id.assert_called_with(id=sci_fi_genre.id)
-        mocked_category_repository.list.assert_called_once_with()
+        mocked_category_repository.get_missing_ids.assert_called_once_with(
+            ids={non_existing_category_id},
+        )
         mocked_genre_repository.update.assert_not_called()
 
         assert str(non_existing_category_id) in str(exc_info.value)
@@ -141,6 +144,7 @@ class TestUpdateGenre:
         self,
         sci_fi_genre: Genre,
         movie_category: Category,
+        documentary_category: Category,
         mocked_genre_repository: MagicMock,
         mocked_category_repository: MagicMock,
     ):
@@ -161,7 +165,13 @@ class TestUpdateGenre:
         update_genre.execute(input=input)
 
         mocked_genre_repository.get_by_id.assert_called_with(id=sci_fi_genre.id)
-        mocked_category_repository.list.assert_called_with()
+        mocked_category_repository.get_missing_ids.assert_called_with(
+            ids={movie_category.id},
+        )
         mocked_genre_repository.update.assert_called_once_with(
-            genre=Genre(**asdict(input))
+            genre=Genre(**asdict(input)),
+            changes=GenreChanges(
+                fields={"name": "Science Fiction", "is_active": False},
+                category_ids_to_remove={documentary_category.id},
+            ),
         )
@@ -1,3 +1,5 @@
+import json
+import pickle
 import uuid
 from uuid import UUID
 
@@ -161,6 +163,62 @@ class TestGenreCategories:
 
         assert genre.categories == list()
 
+    def test_create_genre_drops_duplicated_categories(self):
+        category_id_1 = uuid.uuid4()
+        category_id_2 = uuid.uuid4()
+        genre = Genre(
+            name="Romance",
+            categories=[category_id_1, category_id_2, category_id_1],
+        )
+
+        assert genre.categories == [category_id_1, category_id_2]
+
+    def test_add_categories_keeps_insertion_order(self):
+        category_id_1 = uuid.uuid4()
+        category_id_2 = uuid.uuid4()
+        category_id_3 = uuid.uuid4()
+        genre = Genre(name="Romance", categories=[category_id_1])
+        genre.add_categories([category_id_3, category_id_1, category_id_2])
+
+        assert genre.categories == [category_id_1, category_id_3, category_id_2]
+
+    def test_remove_categories(self):
+        category_id_1 = uuid.uuid4()
+        category_id_2 = uuid.uuid4()
+        category_id_3 = uuid.uuid4()
+        genre = Genre(
+            name="Romance",
+            categories=[category_id_1, category_id_2, category_id_3],
+        )
+        genre.remove_categories({category_id_1, category_id_3, uuid.uuid4()})
+
+        assert genre.categories == [category_id_2]
+        assert category_id_1 not in genre.categories
+        assert category_id_2 in genre.categories
+
+    def test_categories_cannot_be_repeated(self):
+        category_id = uuid.uuid4()
+        genre = Genre(name="Romance", categories=[category_id])
+
+        with pytest.raises(TypeError):
+            genre.categories *= 2  # type: ignore[operator]
+        genre.categories += [category_id]
+
+        assert genre.categories == [category_id]
+
+    def test_categories_pickle_and_serialize_as_a_list(self):
+        category_id_1 = uuid.uuid4()
+        category_id_2 = uuid.uuid4()
+        genre = Genre(name="Romance", categories=[category_id_1, category_id_2])
+
+        restored = pickle.loads(pickle.dumps(genre.categories))
+
+        assert restored == [category_id_1, category_id_2]
+        assert category_id_2 in restored
+        assert json.dumps(list(genre.categories), default=str) == json.dumps(
+            [str(category_id_1), str(category_id_2)]
+        )
+
 
 class TestGenreEquality:
     def test_when_categories_have_same_id_they_are_equal(self):
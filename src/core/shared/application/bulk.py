@@ -0,0 +1,30 @@
+from dataclasses import dataclass, field
+from typing import Any
+from uuid import UUID
+
+from src.core.shared import settings as core_settings
+from src.core.shared.application.errors import InvalidBulkSizeRequested
+
+
+@dataclass
+class BulkItemError:
+    index: int
+    error: Any
+
+
+@dataclass
+class BulkCreateOutput:
+    ids: list[UUID] = field(default_factory=list)
+    errors: list[BulkItemError] = field(default_factory=list)
+
+
+@dataclass
+class BulkDeleteOutput:
+    missing_ids: list[UUID] = field(default_factory=list)
+
+
+def validate_bulk_size(size: int) -> None:
+    max_bulk_size = core_settings.REPOSITORY["max_bulk_size"]
+
+    if not 1 <= size <= max_bulk_size:
+        raise InvalidBulkSizeRequested(size=size, max_bulk_size=max_bulk_size)
@@ -0,0 +1,11 @@
+from enum import Enum
+
+
+class TotalMode(str, Enum):
+    EXACT = "exact"
+    MAINTAINED = "maintained"
+    ESTIMATED = "estimated"
+    NONE = "none"
+
+    def __str__(self) -> str:
+        return self.value
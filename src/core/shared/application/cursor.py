@@ -0,0 +1,47 @@
+import binascii
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from dataclasses import dataclass
+from typing import Any
+from uuid import UUID
+
+from src.core.shared.application.errors import InvalidCursorRequested
+
+
+@dataclass(frozen=True)
+class Cursor:
+    order_by: str
+    value: Any
+    id: UUID
+    backward: bool = False
+
+    def encode(self) -> str:
+        payload = json.dumps(
+            [self.order_by, self.value, str(self.id), self.backward],
+            separators=(",", ":"),
+        )
+        return urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "Cursor":
+        try:
+            padded_token = token + "=" * (-len(token) % 4)
+            payload = json.loads(urlsafe_b64decode(padded_token.encode()))
+        except (TypeError, ValueError, binascii.Error):
+            raise InvalidCursorRequested(cursor=token)
+
+        if not isinstance(payload, list) or len(payload) != 4:
+            raise InvalidCursorRequested(cursor=token)
+
+        order_by, value, id, backward = payload
+        if not (
+            isinstance(order_by, str)
+            and isinstance(id, str)
+            and isinstance(backward, bool)
+        ):
+            raise InvalidCursorRequested(cursor=token)
+
+        try:
+            return cls(order_by=order_by, value=value, id=UUID(id), backward=backward)
+        except ValueError:
+            raise InvalidCursorRequested(cursor=token)
@@ -32,3 +32,119 @@ class InvalidPageRequested(Exception):
             page=repr(page),
         )
         super().__init__(message)
+
+
+class InvalidCursorRequested(Exception):
+    message_template = (
+        "Provided cursor {cursor} is not valid"
+    )
+
+    def __init__(
+        self,
+        cursor: str,
+    ) -> None:
+        message = self.message_template.format(
+            cursor=repr(cursor),
+        )
+        super().__init__(message)
+
+
+class InvalidPerPageRequested(Exception):
+    message_template = (
+        "Provided per_page {per_page} is not valid. "
+        "It must be between 1 and {max_per_page}"
+    )
+
+    def __init__(
+        self,
+        per_page: int,
+        max_per_page: int,
+    ) -> None:
+        message = self.message_template.format(
+            per_page=repr(per_page),
+            max_per_page=max_per_page,
+        )
+        super().__init__(message)
+
+
+class InvalidFieldsRequested(Exception):
+    message_template = (
+        "Provided fields {fields} are not in: {valid_fields}"
+    )
+
+    def __init__(
+        self,
+        fields: list[str],
+        valid_fields: list[str],
+    ) -> None:
+        fields_str = ", ".join(
+            repr(field)
+            for field in fields
+        )
+        valid_fields_str = ", ".join(
+            repr(field)
+            for field in valid_fields
+        )
+        message = self.message_template.format(
+            fields=fields_str,
+            valid_fields=valid_fields_str,
+        )
+        super().__init__(message)
+
+
+class InvalidExpandRequested(Exception):
+    message_template = (
+        "Provided expand {expand} is not in: {valid_expand}"
+    )
+
+    def __init__(
+        self,
+        expand: list[str],
+        valid_expand: list[str],
+    ) -> None:
+        expand_str = ", ".join(
+            repr(field)
+            for field in expand
+        )
+        valid_expand_str = ", ".join(
+            repr(field)
+            for field in valid_expand
+        )
+        message = self.message_template.format(
+            expand=expand_str,
+            valid_expand=valid_expand_str,
+        )
+        super().__init__(message)
+
+
+class InvalidBulkSizeRequested(Exception):
+    message_template = (
+        "Provided {size} items. It must be between 1 and {max_bulk_size}"
+    )
+
+    def __init__(
+        self,
+        size: int,
+        max_bulk_size: int,
+    ) -> None:
+        message = self.message_template.format(
+            size=size,
+            max_bulk_size=max_bulk_size,
+        )
+        super().__init__(message)
+
+
+class StaleEntitiesError(Exception):
+    message_template = (
+        "Entities {ids} were changed by another request"
+    )
+
+    def __init__(
+        self,
+        ids: set,
+    ) -> None:
+        self.ids = ids
+        message = self.message_template.format(
+            ids=", ".join(sorted(str(id) for id in ids)),
+        )
+        super().__init__(message)
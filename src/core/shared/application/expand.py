@@ -0,0 +1,38 @@
+from src.core.shared.application.errors import InvalidExpandRequested
+
+
+def parse_expand(expand: str | list[str] | None) -> list[str]:
+    if expand is None:
+        return []
+
+    if isinstance(expand, str):
+        expand = expand.split(",")
+
+    parsed_expand: list[str] = []
+    for field in expand:
+        field = field.strip()
+        if field and field not in parsed_expand:
+            parsed_expand.append(field)
+
+    return parsed_expand
+
+
+def get_validated_expand(
+    expand: str | list[str] | None,
+    valid_expand: list[str],
+) -> list[str]:
+    parsed_expand = parse_expand(expand=expand)
+
+    invalid_expand = [
+        field
+        for field in parsed_expand
+        if field not in valid_expand
+    ]
+
+    if invalid_expand:
+        raise InvalidExpandRequested(
+            expand=invalid_expand,
+            valid_expand=valid_expand,
+        )
+
+    return parsed_expand
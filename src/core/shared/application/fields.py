@@ -0,0 +1,82 @@
+from dataclasses import fields as dataclass_fields
+from dataclasses import make_dataclass
+from functools import lru_cache
+from typing import Any
+
+from src.core.shared.application.errors import InvalidFieldsRequested
+
+ALWAYS_INCLUDED_FIELDS = ["id"]
+
+
+def parse_fields(fields: str | list[str] | None) -> list[str] | None:
+    if fields is None:
+        return None
+
+    if isinstance(fields, str):
+        fields = fields.split(",")
+
+    parsed_fields = list(ALWAYS_INCLUDED_FIELDS)
+    for field in fields:
+        field = field.strip()
+        if field and field not in parsed_fields:
+            parsed_fields.append(field)
+
+    return parsed_fields
+
+
+def get_validated_fields(
+    fields: str | list[str] | None,
+    output_class: type | None,
+) -> list[str] | None:
+    parsed_fields = parse_fields(fields=fields)
+
+    if parsed_fields is None:
+        return None
+
+    valid_fields = [] if output_class is None else get_output_fields(output_class)
+    invalid_fields = [
+        field
+        for field in parsed_fields
+        if field not in valid_fields
+    ]
+
+    if invalid_fields:
+        raise InvalidFieldsRequested(
+            fields=invalid_fields,
+            valid_fields=valid_fields,
+        )
+
+    return parsed_fields
+
+
+def get_output_fields(output_class: type) -> list[str]:
+    return [
+        field.name
+        for field in dataclass_fields(output_class)
+    ]
+
+
+@lru_cache
+def get_reduced_output_class(output_class: type, fields: tuple[str, ...]) -> type:
+    return make_dataclass(
+        output_class.__name__,
+        [
+            (field.name, field.type)
+            for field in dataclass_fields(output_class)
+            if field.name in fields
+        ],
+    )
+
+
+def get_reduced_output(
+    output_class: type,
+    fields: list[str],
+    values: dict[str, Any],
+) -> Any:
+    reduced_output_class = get_reduced_output_class(output_class, tuple(fields))
+    return reduced_output_class(
+        **{
+            field: values[field]
+            for field in fields
+        }
+    )
@@ -3,9 +3,27 @@ from dataclasses import dataclass
 from typing import Any, Generic, TypeVar
 
 from src.core.shared import settings as core_settings
+from src.core.shared.application.count import TotalMode
+from src.core.shared.application.cursor import Cursor
 from src.core.shared.application.errors import (
+    InvalidCursorRequested,
     InvalidOrderByRequested,
     InvalidPageRequested,
+    InvalidPerPageRequested,
+)
+from src.core.shared.application.fields import (
+    get_reduced_output,
+    get_validated_fields,
+)
+from src.core.shared.application.ordering import (
+    ORDER_BY_SEPARATOR,
+    TIE_BREAKER_FIELD,
+    get_cursor_value,
+    get_field_name,
+    get_ordering_field_names,
+    get_reversed_order_by,
+    get_row_value,
+    split_order_by,
 )
 from src.core.shared.domain.entity import Entity
 from src.django_project.shared.repository.mapper import ListableRepository
@@ -46,11 +64,16 @@ ENTITY = TypeVar("ENTITY", bound=Entity)
 class PaginatedListUseCase(ABC, Generic[ENTITY, ENTITY_OUTPUT_DATA]):
     default_order_by_field = "id"
     order_by_fields = ["id"]
+    total_mode: TotalMode | None = None
+    output_class: type | None = None
 
     @dataclass
     class Input:
         order_by: str | None = None
         page: int | str | None = None
+        per_page: int | str | None = None
+        cursor: str | None = None
+        fields: str | list[str] | None = None
 
     @dataclass
     class Output(Generic[ENTITY_OUTPUT_DATA2]):
@@ -59,9 +82,11 @@ class PaginatedListUseCase(ABC, Generic[ENTITY, ENTITY_OUTPUT_DATA]):
 
     @dataclass
     class Meta:
-        page: int
+        page: int | None
         per_page: int
-        total: int
+        total: int | None
+        next_cursor: str | None = None
+        prev_cursor: str | None = None
 
     def __init__(self, repository: ListableRepository):
         self.repository = repository
@@ -70,22 +95,134 @@ class PaginatedListUseCase(ABC, Generic[ENTITY, ENTITY_OUTPUT_DATA]):
         self,
         input: Input,
     ) -> "PaginatedListUseCase.Output[ENTITY_OUTPUT_DATA]":
+        if input.cursor is not None:
+            return self.execute_with_cursor(input=input)
+
         page = self.get_validated_page(page=input.page)
         order_by = self.get_validated_order_by(order_by=input.order_by)
+        page_size = self.get_validated_per_page(per_page=input.per_page)
+        total_mode = self.get_total_mode()
 
-        entities = self.repository.list(
-            order_by=order_by,
+        fields = self.get_validated_fields(fields=input.fields)
+
+        entities: list[Any]
+        if fields is None:
+            entities = self.repository.list(
+                order_by=order_by,
+                page=page,
+                page_size=page_size,
+                with_total=total_mode == TotalMode.EXACT,
+            )
+        else:
+            entities = self.repository.list_values(
+                fields=self.get_fetched_fields(fields=fields, order_by=order_by),
+                order_by=order_by,
+                page=page,
+                page_size=page_size,
+                with_total=total_mode == TotalMode.EXACT,
+            )
+
+        total = self.get_total(total_mode=total_mode)
+
+        data = self.get_output_data(entities=entities, fields=fields)
+
+        if total is None:
+            has_next_page = len(entities) == page_size
+        else:
+            has_next_page = page * page_size < total
+
+        next_cursor = None
+        prev_cursor = None
+        if entities and has_next_page:
+            next_cursor = self.get_cursor(entity=entities[-1], order_by=order_by)
+        if entities and page > 1:
+            prev_cursor = self.get_cursor(
+                entity=entities[0],
+                order_by=order_by,
+                backward=True,
+            )
+
+        meta = PaginatedListUseCase.Meta(
             page=page,
+            per_page=page_size,
+            total=total,
+            next_cursor=next_cursor,
+            prev_cursor=prev_cursor,
         )
 
-        total = self.repository.count()
+        return PaginatedListUseCase.Output(
+            data=data,
+            meta=meta,
+        )
+
+    def execute_with_cursor(
+        self,
+        input: Input,
+    ) -> "PaginatedListUseCase.Output[ENTITY_OUTPUT_DATA]":
+        cursor = self.get_validated_cursor(
+            cursor=input.cursor,
+            order_by=input.order_by,
+        )
+        order_by = cursor.order_by
+        page_size = self.get_validated_per_page(per_page=input.per_page)
+
+        if cursor.backward:
+            seek_order_by = get_reversed_order_by(order_by=order_by)
+        else:
+            seek_order_by = order_by
+
+        fields = self.get_validated_fields(fields=input.fields)
+
+        entities: list[Any]
+        if fields is None:
+            entities = self.repository.list_after(
+                cursor=cursor,
+                order_by=seek_order_by,
+                limit=page_size + 1,
+            )
+        else:
+            entities = self.repository.list_values_after(
+                fields=self.get_fetched_fields(fields=fields, order_by=order_by),
+                cursor=cursor,
+                order_by=seek_order_by,
+                limit=page_size + 1,
+            )
+
+        has_more = len(entities) > page_size
+        entities = entities[:page_size]
+
+        next_cursor = None
+        prev_cursor = None
+        if cursor.backward:
+            entities.reverse()
+            if entities and has_more:
+                prev_cursor = self.get_cursor(
+                    entity=entities[0],
+                    order_by=order_by,
+                    backward=True,
+                )
+            if entities:
+                next_cursor = self.get_cursor(entity=entities[-1], order_by=order_by)
+        else:
+            if entities and has_more:
+                next_cursor = self.get_cursor(entity=entities[-1], order_by=order_by)
+            if entities:
+                prev_cursor = self.get_cursor(
+                    entity=entities[0],
+                    order_by=order_by,
+                    backward=True,
+                )
+
+        total = self.get_total(total_mode=self.get_total_mode())
 
-        data = self.get_output_data_from_entities(entities=entities)
+        data = self.get_output_data(entities=entities, fields=fields)
 
         meta = PaginatedListUseCase.Meta(
-            page=page,
-            per_page=core_settings.REPOSITORY["page_size"],
+            page=None,
+            per_page=page_size,
             total=total,
+            next_cursor=next_cursor,
+            prev_cursor=prev_cursor,
         )
 
         return PaginatedListUseCase.Output(
@@ -100,6 +237,46 @@ class PaginatedListUseCase(ABC, Generic[ENTITY, ENTITY_OUTPUT_DATA]):
     ) -> list[ENTITY_OUTPUT_DATA]:
         pass
 
+    def get_output_data(
+        self,
+        entities: list[Any],
+        fields: list[str] | None,
+    ) -> list[Any]:
+        if fields is None or self.output_class is None:
+            return self.get_output_data_from_entities(entities=entities)
+
+        return [
+            get_reduced_output(
+                output_class=self.output_class,
+                fields=fields,
+                values=values,
+            )
+            for values in entities
+        ]
+
+    def get_validated_fields(self, fields: Any) -> list[str] | None:
+        return get_validated_fields(fields=fields, output_class=self.output_class)
+
+    @staticmethod
+    def get_fetched_fields(fields: list[str], order_by: str) -> list[str]:
+        missing_fields = [
+            field_name
+            for field_name in get_ordering_field_names(order_by)
+            if field_name not in fields
+        ]
+        return [*fields, *missing_fields]
+
+    def get_total_mode(self) -> TotalMode:
+        if self.total_mode is not None:
+            return self.total_mode
+        return TotalMode(core_settings.REPOSITORY["total_mode"])
+
+    def get_total(self, total_mode: TotalMode) -> int | None:
+        if total_mode == TotalMode.NONE:
+            return None
+
+        return self.repository.count(mode=total_mode)
+
     def get_validated_page(self, page: Any) -> int:
         if page is None:
             return 1
@@ -116,16 +293,81 @@ class PaginatedListUseCase(ABC, Generic[ENTITY, ENTITY_OUTPUT_DATA]):
 
         return page
 
+    def get_validated_per_page(self, per_page: Any) -> int:
+        if per_page is None:
+            return core_settings.REPOSITORY["page_size"]
+
+        max_per_page = core_settings.REPOSITORY["max_page_size"]
+
+        try:
+            if isinstance(per_page, float) and not per_page.is_integer():
+                raise ValueError
+            per_page = int(per_page)
+        except (TypeError, ValueError):
+            raise InvalidPerPageRequested(
+                per_page=per_page,
+                max_per_page=max_per_page,
+            )
+
+        if not 1 <= per_page <= max_per_page:
+            raise InvalidPerPageRequested(
+                per_page=per_page,
+                max_per_page=max_per_page,
+            )
+
+        return per_page
+
     def get_validated_order_by(self, order_by: str | None) -> str:
         if order_by is None:
             order_by = self.default_order_by_field
 
         valid_order_by_fields = getattr(self, "order_by_fields")
+        keys = split_order_by(order_by)
 
-        if order_by not in valid_order_by_fields:
+        if not keys or any(
+            key not in valid_order_by_fields
+            and get_field_name(key) != TIE_BREAKER_FIELD
+            for key in keys
+        ):
             raise InvalidOrderByRequested(
                 order_by=order_by,
                 valid_order_by_attributes=valid_order_by_fields,
             )
 
-        return order_by
+        return ORDER_BY_SEPARATOR.join(keys)
+
+    def get_validated_cursor(self, cursor: Any, order_by: str | None) -> Cursor:
+        decoded_cursor = Cursor.decode(token=str(cursor))
+
+        if (
+            order_by is not None
+            and split_order_by(order_by) != split_order_by(decoded_cursor.order_by)
+        ):
+            raise InvalidCursorRequested(cursor=cursor)
+
+        try:
+            self.get_validated_order_by(order_by=decoded_cursor.order_by)
+        except InvalidOrderByRequested:
+            raise InvalidCursorRequested(cursor=cursor)
+
+        field_count = len(get_ordering_field_names(decoded_cursor.order_by))
+        if field_count != 1 and not (
+            isinstance(decoded_cursor.value, list)
+            and len(decoded_cursor.value) == field_count
+        ):
+            raise InvalidCursorRequested(cursor=cursor)
+
+        return decoded_cursor
+
+    @staticmethod
+    def get_cursor(
+        entity: Entity | dict[str, Any],
+        order_by: str,
+        backward: bool = False,
+    ) -> str:
+        return Cursor(
+            order_by=order_by,
+            value=get_cursor_value(entity, order_by),
+            id=get_row_value(entity, TIE_BREAKER_FIELD),
+            backward=backward,
+        ).encode()
@@ -0,0 +1,124 @@
+from functools import cmp_to_key
+from typing import Any
+
+from src.core.shared.application.cursor import Cursor
+
+ORDER_BY_SEPARATOR = ","
+TIE_BREAKER_FIELD = "id"
+
+
+def split_order_by(order_by: str) -> list[str]:
+    return [
+        key.strip()
+        for key in order_by.split(ORDER_BY_SEPARATOR)
+        if key.strip()
+    ]
+
+
+def get_field_name(key: str) -> str:
+    return key.lstrip("-")
+
+
+def is_descending(key: str) -> bool:
+    return key.startswith("-")
+
+
+def get_ordering(order_by: str) -> list[str]:
+    keys = split_order_by(order_by)
+
+    if all(get_field_name(key) != TIE_BREAKER_FIELD for key in keys):
+        tie_breaker = TIE_BREAKER_FIELD
+        if is_descending(keys[0]):
+            tie_breaker = f"-{TIE_BREAKER_FIELD}"
+        keys.append(tie_breaker)
+
+    return keys
+
+
+def get_ordering_field_names(order_by: str) -> list[str]:
+    return [
+        get_field_name(key)
+        for key in split_order_by(order_by)
+        if get_field_name(key) != TIE_BREAKER_FIELD
+    ]
+
+
+def get_reversed_order_by(order_by: str) -> str:
+    return ORDER_BY_SEPARATOR.join(
+        get_field_name(key) if is_descending(key) else f"-{key}"
+        for key in split_order_by(order_by)
+    )
+
+
+def get_row_value(row: Any, field_name: str) -> Any:
+    if isinstance(row, dict):
+        return row[field_name]
+    return getattr(row, field_name)
+
+
+def get_cursor_value(row: Any, order_by: str) -> Any:
+    values = [
+        get_row_value(row, field_name)
+        for field_name in get_ordering_field_names(order_by)
+    ]
+
+    if len(values) == 1:
+        return values[0]
+    return values
+
+
+def get_cursor_values(cursor: Cursor, order_by: str) -> list[Any]:
+    if len(get_ordering_field_names(order_by)) == 1:
+        values = iter([cursor.value])
+    else:
+        values = iter(cursor.value)
+
+    return [
+        cursor.id if get_field_name(key) == TIE_BREAKER_FIELD else next(values)
+        for key in get_ordering(order_by)
+    ]
+
+
+def compare_values(left: list[Any], right: list[Any], order_by: str) -> int:
+    for key, left_value, right_value in zip(get_ordering(order_by), left, right):
+        if left_value == right_value:
+            continue
+
+        comparison = 1 if left_value > right_value else -1
+        return -comparison if is_descending(key) else comparison
+
+    return 0
+
+
+def get_sort_values(row: Any, order_by: str) -> list[Any]:
+    return [
+        get_row_value(row, get_field_name(key))
+        for key in get_ordering(order_by)
+    ]
+
+
+def sort_rows(rows: list[Any], order_by: str) -> list[Any]:
+    return sorted(
+        rows,
+        key=cmp_to_key(
+            lambda left, right: compare_values(
+                get_sort_values(left, order_by),
+                get_sort_values(right, order_by),
+                order_by,
+            )
+        ),
+    )
+
+
+def filter_rows_after_cursor(
+    rows: list[Any],
+    cursor: Cursor,
+    order_by: str,
+) -> list[Any]:
+    cursor_values = get_cursor_values(cursor, order_by)
+
+    return [
+        row
+        for row in rows
+        if compare_values(get_sort_values(row, order_by), cursor_values, order_by) > 0
+    ]
@@ -0,0 +1,116 @@
+from abc import ABC, abstractmethod
+from collections.abc import Mapping
+from contextlib import AbstractContextManager
+from types import TracebackType
+from typing import Any, Protocol, Self
+from uuid import UUID
+
+from src.core.shared.application.errors import StaleEntitiesError
+from src.core.shared.domain.entity import Entity
+
+
+class BatchRepository(Protocol):
+    def save_many(self, entities: list[Any], /) -> None:
+        ...
+
+    def update_many(self, entities: list[Any], /) -> set[UUID]:
+        ...
+
+    def delete_many(self, ids: set[UUID], /) -> set[UUID]:
+        ...
+
+
+class AbstractUnitOfWork(ABC):
+    """Collects entity changes and flushes them in one transaction on commit.
+
+    Changes are grouped by entity type and written with one batch call per
+    type and operation. Inserts and updates follow the order of
+    ``repositories`` and deletes the reverse, so referenced types go first.
+    A dirty entity whose stored version moved on aborts the whole commit.
+    """
+
+    def __init__(self, repositories: Mapping[type[Entity], BatchRepository]):
+        self.repositories = repositories
+        self._new: dict[type[Entity], dict[UUID, Entity]] = {}
+        self._dirty: dict[type[Entity], dict[UUID, Entity]] = {}
+        self._removed: dict[type[Entity], set[UUID]] = {}
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
+
+    def register_new(self, entity: Entity) -> None:
+        self._get_repository(entity)
+        removed = self._removed.get(type(entity), set())
+        if entity.id in removed:
+            removed.discard(entity.id)
+            self._dirty.setdefault(type(entity), {})[entity.id] = entity
+            return None
+
+        self._new.setdefault(type(entity), {})[entity.id] = entity
+
+    def register_dirty(self, entity: Entity) -> None:
+        self._get_repository(entity)
+        new = self._new.get(type(entity), {})
+        if entity.id in new:
+            new[entity.id] = entity
+            return None
+
+        self._dirty.setdefault(type(entity), {})[entity.id] = entity
+
+    def register_removed(self, entity: Entity) -> None:
+        self._get_repository(entity)
+        if self._new.get(type(entity), {}).pop(entity.id, None) is not None:
+            return None
+
+        self._dirty.get(type(entity), {}).pop(entity.id, None)
+        self._removed.setdefault(type(entity), set()).add(entity.id)
+
+    def commit(self) -> None:
+        entity_types = list(self.repositories)
+
+        with self._atomic():
+            for entity_type in entity_types:
+                if new := self._new.get(entity_type):
+                    self.repositories[entity_type].save_many(list(new.values()))
+            for entity_type in entity_types:
+                if dirty := self._dirty.get(entity_type):
+                    conflicted_ids = self.repositories[entity_type].update_many(
+                        list(dirty.values()),
+                    )
+                    if conflicted_ids:
+                        raise StaleEntitiesError(ids=conflicted_ids)
+            for entity_type in reversed(entity_types):
+                if ids := self._removed.get(entity_type):
+                    self.repositories[entity_type].delete_many(ids)
+        self._clear()
+
+    def rollback(self) -> None:
+        self._clear()
+
+    def _clear(self) -> None:
+        self._new.clear()
+        self._dirty.clear()
+        self._removed.clear()
+
+    def _get_repository(self, entity: Entity) -> BatchRepository:
+        try:
+            return self.repositories[type(entity)]
+        except KeyError:
+            raise TypeError(
+                f"No repository registered for {type(entity).__name__}"
+            ) from None
+
+    @abstractmethod
+    def _atomic(self) -> AbstractContextManager[Any]:
+        raise NotImplementedError
@@ -8,6 +8,7 @@ from src.core.shared.notification import Notification
 @dataclass(kw_only=True)
 class Entity(ABC):
     id: UUID = field(default_factory=uuid4)
+    version: int = 1
     notification: Notification = field(default_factory=Notification)
 
     def __eq__(self, other) -> bool:
@@ -0,0 +1,125 @@
+from collections.abc import Hashable, Iterable, Iterator, MutableSequence
+from itertools import islice
+from typing import Any, SupportsIndex, TypeVar, overload
+
+T = TypeVar("T", bound=Hashable)
+
+
+class OrderedSet(MutableSequence[T]):
+    """Insertion-ordered sequence without duplicates, backed by a dict.
+
+    Membership, append and remove are O(1); positional access is O(n).
+    """
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __init__(self, items: Iterable[T] = ()):
+        self._items: dict[T, None] = dict.fromkeys(items)
+
+    def __contains__(self, item: object) -> bool:
+        return item in self._items
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._items)
+
+    def __reversed__(self) -> Iterator[T]:
+        return reversed(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (OrderedSet, list, tuple)):
+            return len(self) == len(other) and all(
+                item == other_item
+                for item, other_item in zip(self, other)
+            )
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self)!r})"
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return self.__class__, (list(self),)
+
+    @overload
+    def __getitem__(self, index: int) -> T:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[T]:
+        ...
+
+    def __getitem__(self, index: int | slice) -> T | list[T]:
+        if isinstance(index, slice):
+            if index.step is None and (index.start or 0) >= 0 and (
+                index.stop is None or index.stop >= 0
+            ):
+                return list(islice(self._items, index.start, index.stop))
+            return list(self)[index]
+
+        return list(self)[index]
+
+    @overload
+    def __setitem__(self, index: int, value: T) -> None:
+        ...
+
+    @overload
+    def __setitem__(self, index: slice, value: Iterable[T]) -> None:
+        ...
+
+    def __setitem__(self, index: int | slice, value: Any) -> None:
+        items = list(self)
+        items[index] = value
+        self._items = dict.fromkeys(items)
+
+    def __delitem__(self, index: int | slice) -> None:
+        items = list(self)
+        del items[index]
+        self._items = dict.fromkeys(items)
+
+    def __iadd__(self, items: Iterable[T]) -> "OrderedSet[T]":
+        self.extend(items)
+        return self
+
+    def insert(self, index: int, item: T) -> None:
+        if item in self._items:
+            return
+        items = list(self)
+        items.insert(index, item)
+        self._items = dict.fromkeys(items)
+
+    def append(self, item: T) -> None:
+        self._items[item] = None
+
+    def extend(self, items: Iterable[T]) -> None:
+        self._items.update(dict.fromkeys(items))
+
+    def remove(self, item: T) -> None:
+        try:
+            del self._items[item]
+        except KeyError:
+            raise ValueError(f"{item!r} not in OrderedSet") from None
+
+    def discard(self, item: T) -> None:
+        self._items.pop(item, None)
+
+    def pop(self, index: SupportsIndex = -1) -> T:
+        if index == -1:
+            try:
+                return self._items.popitem()[0]
+            except KeyError:
+                raise IndexError("pop from empty OrderedSet") from None
+
+        item = self[int(index)]
+        del self._items[item]
+        return item
+
+    def reverse(self) -> None:
+        self._items = dict.fromkeys(reversed(self._items))
+
+    def clear(self) -> None:
+        self._items.clear()
+
+    def copy(self) -> "OrderedSet[T]":
+        return self.__class__(self)
@@ -0,0 +1,9 @@
+from contextlib import AbstractContextManager, nullcontext
+from typing import Any
+
+from src.core.shared.application.unit_of_work import AbstractUnitOfWork
+
+
+class InMemoryUnitOfWork(AbstractUnitOfWork):
+    def _atomic(self) -> AbstractContextManager[Any]:
+        return nullcontext()
@@ -1,3 +1,12 @@
-REPOSITORY = {
+from typing import Any
+
+REPOSITORY: dict[str, Any] = {
     "page_size": 10,
+    "max_page_size": 1000,
+    "total_mode": "exact",
+    # Opt-in; clear the page_boundary table before enabling it on live data.
+    "page_boundary_interval": None,
+    "delete_chunk_size": 500,
+    "max_bulk_size": 1000,
+    "bulk_create_batch_size": 500,
 }
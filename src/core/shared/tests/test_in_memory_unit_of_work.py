@@ -0,0 +1,152 @@
+from unittest.mock import create_autospec
+
+import pytest
+
+from src.core.category.domain.category import Category
+from src.core.category.gateway.category_gateway import AbstractCategoryRepository
+from src.core.category.infra.in_memory_category_repository import (
+    InMemoryCategoryRepository,
+)
+from src.core.genre.domain.genre import Genre
+from src.core.genre.infra.in_memory_genre_repository import InMemoryGenreRepository
+from src.core.shared.application.errors import StaleEntitiesError
+from src.core.shared.infra.in_memory_unit_of_work import InMemoryUnitOfWork
+
+
+@pytest.fixture
+def movie_category() -> Category:
+    return Category(name="Movie")
+
+
+@pytest.fixture
+def documentary_category() -> Category:
+    return Category(name="Documentary")
+
+
+class TestCommit:
+    def test_flushes_one_batch_per_entity_type_and_operation(
+        self,
+        movie_category: Category,
+        documentary_category: Category,
+    ) -> None:
+        repository = create_autospec(AbstractCategoryRepository)
+        repository.update_many.return_value = set()
+        unit_of_work = InMemoryUnitOfWork(repositories={Category: repository})
+        series_category = Category(name="Series")
+
+        unit_of_work.register_new(movie_category)
+        unit_of_work.register_new(documentary_category)
+        unit_of_work.register_dirty(series_category)
+        unit_of_work.register_removed(Category(name="Anime"))
+        unit_of_work.commit()
+
+        repository.save_many.assert_called_once_with(
+            [movie_category, documentary_category],
+        )
+        repository.update_many.assert_called_once_with([series_category])
+        repository.delete_many.assert_called_once()
+
+    def test_writes_changes_to_repositories(
+        self,
+        movie_category: Category,
+        documentary_category: Category,
+    ) -> None:
+        category_repository = InMemoryCategoryRepository(
+            categories=[documentary_category],
+        )
+        genre_repository = InMemoryGenreRepository()
+        genre = Genre(name="Romance", categories=[movie_category.id])
+
+        with InMemoryUnitOfWork(
+            repositories={
+                Category: category_repository,
+                Genre: genre_repository,
+            },
+        ) as unit_of_work:
+            unit_of_work.register_new(movie_category)
+            unit_of_work.register_new(genre)
+            unit_of_work.register_removed(documentary_category)
+
+        assert category_repository.categories == [movie_category]
+        assert genre_repository.genres == [genre]
+
+    def test_clears_pending_changes(self, movie_category: Category) -> None:
+        repository = InMemoryCategoryRepository()
+        unit_of_work = InMemoryUnitOfWork(repositories={Category: repository})
+
+        unit_of_work.register_new(movie_category)
+        unit_of_work.commit()
+        unit_of_work.commit()
+
+        assert repository.categories == [movie_category]
+
+    def test_stale_dirty_entity_aborts_commit(
+        self,
+        movie_category: Category,
+    ) -> None:
+        repository = InMemoryCategoryRepository(categories=[movie_category])
+        stale_category = Category(
+            id=movie_category.id,
+            name="Film",
+            version=movie_category.version - 1,
+        )
+        unit_of_work = InMemoryUnitOfWork(repositories={Category: repository})
+
+        unit_of_work.register_dirty(stale_category)
+        with pytest.raises(StaleEntitiesError):
+            unit_of_work.commit()
+
+        assert repository.categories[0].name == "Movie"
+
+
+class TestRegister:
+    def test_dirty_after_new_is_inserted_once(
+        self,
+        movie_category: Category,
+    ) -> None:
+        repository = create_autospec(AbstractCategoryRepository)
+        unit_of_work = InMemoryUnitOfWork(repositories={Category: repository})
+
+        unit_of_work.register_new(movie_category)
+        unit_of_work.register_dirty(movie_category)
+        unit_of_work.commit()
+
+        repository.save_many.assert_called_once_with([movie_category])
+        repository.update_many.assert_not_called()
+
+    def test_removed_after_new_is_never_written(
+        self,
+        movie_category: Category,
+    ) -> None:
+        repository = create_autospec(AbstractCategoryRepository)
+        unit_of_work = InMemoryUnitOfWork(repositories={Category: repository})
+
+        unit_of_work.register_new(movie_category)
+        unit_of_work.register_removed(movie_category)
+        unit_of_work.commit()
+
+        repository.save_many.assert_not_called()
+        repository.delete_many.assert_not_called()
+
+    def test_unknown_entity_type_raises_error(self) -> None:
+        unit_of_work = InMemoryUnitOfWork(repositories={})
+
+        with pytest.raises(TypeError, match="Category"):
+            unit_of_work.register_new(Category(name="Movie"))
+
+
+class TestRollback:
+    def test_exception_discards_pending_changes(
+        self,
+        movie_category: Category,
+    ) -> None:
+        repository = InMemoryCategoryRepository()
+
+        with pytest.raises(RuntimeError):
+            with InMemoryUnitOfWork(
+                repositories={Category: repository},
+            ) as unit_of_work:
+                unit_of_work.register_new(movie_category)
+                raise RuntimeError
+
+        assert repository.categories == []
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.2 on 2026-10-18 12:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cast_member_app', '0002_add_name_id_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='castmember',
+            name='version',
+            field=models.PositiveIntegerField(default=1),
+        ),
+    ]
@@ -17,10 +17,14 @@ class CastMember(models.Model):
         app_label = "cast_member_app"
         db_table = "cast_member"
         verbose_name_plural = "cast_members"
+        indexes = [
+            models.Index(fields=["name", "id"], name="cast_member_name_id_idx"),
+        ]
 
     id = models.UUIDField(primary_key=True, default=uuid4)
     name = models.CharField(max_length=255)
     type = models.CharField(max_length=255, choices=cast_member_choices)
+    version = models.PositiveIntegerField(default=1)
 
     def __str__(self) -> str:
         return self.name
@@ -1,6 +1,9 @@
+from functools import partial
+from typing import Any
 from uuid import UUID
 
-from django.core.paginator import Paginator
+from django.db import transaction
+from django.db.models import F
 from django.db.models.query import QuerySet
 
 from src.core.cast_member.domain.cast_member import CastMember
@@ -8,8 +11,37 @@ from src.core.cast_member.gateway.cast_member_gateway import (
     AbstractCastMemberRepository,
 )
 from src.core.shared import settings as core_settings
+from src.core.shared.application.count import TotalMode
+from src.core.shared.application.cursor import Cursor
+from src.core.shared.application.ordering import get_ordering
 from src.django_project.cast_member_app.models import CastMember as CastMemberModel
+from src.django_project.counter_app.counters import (
+    get_estimated_row_count,
+    get_row_count,
+    increment_row_count,
+)
+from src.django_project.page_boundary_app.boundaries import (
+    get_page_boundary,
+    truncate_page_boundaries,
+)
+from src.django_project.shared.repository.list_cache import (
+    invalidate_list_cache_on_commit,
+)
 from src.django_project.shared.repository.mapper import BaseORMMapper
+from src.django_project.shared.repository.pagination import (
+    get_keyset_page,
+    get_offset_page,
+)
+from src.django_project.shared.repository.upsert import upsert_versioned_entities
+from src.django_project.shared.repository.writes import (
+    delete_existing_rows,
+    delete_rows_in_chunks,
+    finish_rows_write,
+    start_rows_write,
+    update_versioned_rows,
+)
+
+CAST_MEMBER_UPDATE_FIELDS = ["name", "type"]
 
 
 class CastMemberMapper(BaseORMMapper[CastMember, CastMemberModel]):
@@ -19,6 +51,7 @@ class CastMemberMapper(BaseORMMapper[CastMember, CastMemberModel]):
             id=entity.id,
             name=entity.name,
             type=entity.type,
+            version=entity.version,
         )
         if save:
             instance.save()
@@ -30,6 +63,7 @@ class CastMemberMapper(BaseORMMapper[CastMember, CastMemberModel]):
             id=model.id,
             name=model.name,
             type=model.type,
+            version=model.version,
         )
 
 
@@ -43,7 +77,78 @@ class DjangoORMCastMemberRepository(AbstractCastMemberRepository):
         return self.cast_member_model.objects.all()
 
     def save(self, cast_member: CastMember) -> None:
-        CastMemberMapper.to_model(cast_member, save=True)
+        with transaction.atomic():
+            CastMemberMapper.to_model(cast_member, save=True)
+            increment_row_count(self.cast_member_model)
+            truncate_page_boundaries(self.cast_member_model, cast_member.id)
+            invalidate_list_cache_on_commit(self.cast_member_model)
+        self._count = None
+
+    def save_many(self, cast_members: list[CastMember]) -> None:
+        if not cast_members:
+            return None
+
+        with transaction.atomic():
+            self.cast_member_model.objects.bulk_create(
+                [
+                    CastMemberMapper.to_model(cast_member)
+                    for cast_member in cast_members
+                ],
+                batch_size=core_settings.REPOSITORY["bulk_create_batch_size"],
+            )
+            finish_rows_write(
+                self.cast_member_model,
+                [cast_member.id for cast_member in cast_members],
+                row_delta=len(cast_members),
+            )
+        self._count = None
+
+    def update_many(self, cast_members: list[CastMember]) -> set[UUID]:
+        if not cast_members:
+            return set()
+
+        ids = [cast_member.id for cast_member in cast_members]
+        with transaction.atomic():
+            start_rows_write(self.cast_member_model, ids)
+            conflicted_ids = update_versioned_rows(
+                self.cast_member_model,
+                cast_members,
+                update_fields=CAST_MEMBER_UPDATE_FIELDS,
+            )
+            finish_rows_write(self.cast_member_model, ids)
+        return conflicted_ids
+
+    def delete_many(self, ids: set[UUID]) -> set[UUID]:
+        missing_ids = delete_rows_in_chunks(
+            ids,
+            partial(delete_existing_rows, self.cast_member_model),
+        )
+        self._count = None
+        return missing_ids
+
+    def upsert(self, cast_member: CastMember) -> bool:
+        return bool(self.upsert_many([cast_member]))
+
+    def upsert_many(self, cast_members: list[CastMember]) -> set[UUID]:
+        if not cast_members:
+            return set()
+
+        ids = [cast_member.id for cast_member in cast_members]
+        with transaction.atomic():
+            start_rows_write(self.cast_member_model, ids)
+            created_ids = upsert_versioned_entities(
+                self.cast_member_model,
+                cast_members,
+                CastMemberMapper.to_model,
+                update_fields=CAST_MEMBER_UPDATE_FIELDS,
+            )
+            finish_rows_write(
+                self.cast_member_model,
+                ids,
+                row_delta=len(created_ids),
+            )
+        self._count = None
+        return created_ids
 
     def get_by_id(self, id: UUID) -> CastMember | None:
         try:
@@ -53,42 +158,152 @@ class DjangoORMCastMemberRepository(AbstractCastMemberRepository):
 
         return CastMemberMapper.to_entity(cast_member)
 
-    def list(
+    def list_after(
+        self,
+        cursor: Cursor | None,
+        order_by: str,
+        limit: int,
+    ) -> list[CastMember]:
+        cast_members = get_keyset_page(
+            queryset=self.get_queryset(),
+            cursor=cursor,
+            order_by=order_by,
+            limit=limit,
+        )
+
+        return [
+            CastMemberMapper.to_entity(cast_member)
+            for cast_member in cast_members
+        ]
+
+    def list_values_after(
         self,
+        fields: list[str],
+        cursor: Cursor | None,
+        order_by: str,
+        limit: int,
+    ) -> list[dict[str, Any]]:
+        return list(
+            get_keyset_page(
+                queryset=self.get_queryset().values(*fields),
+                cursor=cursor,
+                order_by=order_by,
+                limit=limit,
+            )
+        )
+
+    def list_values(
+        self,
+        fields: list[str],
         order_by: str | None = None,
         page: int | None = None,
-    ) -> list[CastMember]:
-        queryset = self.get_queryset()
+        page_size: int | None = None,
+        with_total: bool = False,
+    ) -> list[dict[str, Any]]:
+        return self._get_page_rows(
+            queryset=self.get_queryset().values(*fields),
+            order_by=order_by,
+            page=page,
+            page_size=page_size,
+            with_total=with_total,
+        )
 
+    def _get_page_rows(
+        self,
+        queryset: QuerySet,
+        order_by: str | None,
+        page: int | None,
+        page_size: int | None,
+        with_total: bool,
+    ) -> list[Any]:
         if order_by is not None:
-            queryset = queryset.order_by(order_by)
+            queryset = queryset.order_by(*get_ordering(order_by))
+
+        if page is None:
+            return list(queryset)
+
+        if page_size is None:
+            page_size = core_settings.REPOSITORY["page_size"]
+
+        start, start_position = get_page_boundary(
+            queryset=self.get_queryset(),
+            order_by=order_by,
+            offset=(page - 1) * page_size,
+        )
+
+        rows, total = get_offset_page(
+            queryset=queryset,
+            page=page,
+            page_size=page_size,
+            with_total=with_total,
+            start=start,
+            start_position=start_position,
+        )
+
+        if total is not None:
+            self._count = total
 
-        if page is not None:
-            paginator = Paginator(queryset, core_settings.REPOSITORY["page_size"])
-            paginator_page = paginator.page(page)
-            cast_members = paginator_page.object_list
-            self._count = paginator.count
-        else:
-            cast_members = list(queryset)
+        return rows
+
+    def list(
+        self,
+        order_by: str | None = None,
+        page: int | None = None,
+        page_size: int | None = None,
+        with_total: bool = False,
+    ) -> list[CastMember]:
+        cast_members = self._get_page_rows(
+            queryset=self.get_queryset(),
+            order_by=order_by,
+            page=page,
+            page_size=page_size,
+            with_total=with_total,
+        )
 
         return [
             CastMemberMapper.to_entity(cast_member)
             for cast_member in cast_members
         ]
 
-    def count(
-        self,
-    ) -> int:
+    def count(self, mode: TotalMode = TotalMode.EXACT) -> int:
+        if mode == TotalMode.MAINTAINED:
+            return get_row_count(self.cast_member_model)
+
+        if mode == TotalMode.ESTIMATED:
+            return get_estimated_row_count(self.cast_member_model)
+
         if self._count is None:
             self._count = self.get_queryset().count()
         return self._count
 
-    def delete(self, id: UUID) -> None:
-        self.cast_member_model.objects.filter(id=id).delete()
+    def delete(self, id: UUID) -> bool:
+        with transaction.atomic():
+            truncate_page_boundaries(self.cast_member_model, id)
+            invalidate_list_cache_on_commit(self.cast_member_model)
+            _, deleted_by_model = (
+                self.cast_member_model.objects.filter(id=id).delete()
+            )
+            deleted = deleted_by_model.get(self.cast_member_model._meta.label, 0)
+            if deleted:
+                increment_row_count(self.cast_member_model, delta=-deleted)
+        self._count = None
+        return bool(deleted)
 
-    def update(self, cast_member: CastMember) -> None:
-        self.cast_member_model.objects.filter(id=cast_member.id).update(
-            id=cast_member.id,
-            name=cast_member.name,
-            type=cast_member.type,
-        )
+    def update(self, cast_member: CastMember) -> bool:
+        with transaction.atomic():
+            truncate_page_boundaries(self.cast_member_model, cast_member.id)
+            updated = self.cast_member_model.objects.filter(
+                id=cast_member.id,
+                version=cast_member.version,
+            ).update(
+                name=cast_member.name,
+                type=cast_member.type,
+                version=F("version") + 1,
+            )
+            if not updated:
+                return False
+
+            truncate_page_boundaries(self.cast_member_model, cast_member.id)
+            invalidate_list_cache_on_commit(self.cast_member_model)
+        cast_member.version += 1
+        return True
@@ -3,6 +3,7 @@ from rest_framework import serializers
 from src.core.cast_member.domain.cast_member import CastMemberType
 from src.django_project.shared.serializers.serializers import (
     PaginatedListResponseSerializer,
+    SparseFieldsetSerializer,
 )
 
 
@@ -18,7 +19,7 @@ class CastMemberTypeField(serializers.ChoiceField):
         return str(super().to_representation(value))
 
 
-class CastMemberResponseSerializer(serializers.Serializer):
+class CastMemberResponseSerializer(SparseFieldsetSerializer):
     id = serializers.UUIDField()
     name = serializers.CharField(max_length=255)
     type = CastMemberTypeField()
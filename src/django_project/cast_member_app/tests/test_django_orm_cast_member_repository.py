@@ -1,8 +1,13 @@
+from unittest.mock import patch
 from uuid import uuid4
 
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
-from src.core.cast_member.domain.cast_member import CastMember
+from src.core.cast_member.domain.cast_member import CastMember, CastMemberType
+from src.core.shared import settings as core_settings
+from src.core.shared.application.count import TotalMode
 from src.django_project.cast_member_app.repository import DjangoORMCastMemberRepository
 
 
@@ -84,3 +89,52 @@ class TestSave:
 
         assert actor_cast_member not in cast_members
         assert director_cast_member in cast_members
+
+
+@pytest.mark.django_db
+class TestDeleteManyDjangoORMCastMemberRepository:
+    def test_deletes_in_chunks_and_returns_missing_ids(
+        self,
+        cast_member_repository: DjangoORMCastMemberRepository,
+    ):
+        cast_members = [
+            CastMember(name=f"Actor {index}", type=CastMemberType.ACTOR)
+            for index in range(5)
+        ]
+        cast_member_repository.save_many(cast_members)
+        missing_id = uuid4()
+
+        with (
+            patch.dict(core_settings.REPOSITORY, {"delete_chunk_size": 2}),
+            CaptureQueriesContext(connection) as context,
+        ):
+            missing_ids = cast_member_repository.delete_many(
+                {cast_member.id for cast_member in cast_members} | {missing_id},
+            )
+
+        assert missing_ids == {missing_id}
+        assert sum(
+            query["sql"].startswith('DELETE FROM "cast_member"')
+            for query in context.captured_queries
+        ) == 3
+        assert cast_member_repository.count(mode=TotalMode.MAINTAINED) == 0
+
+
+@pytest.mark.django_db
+class TestDelete:
+    def test_delete_reports_whether_a_row_was_removed(
+        self,
+        director_cast_member: CastMember,
+        cast_member_repository: DjangoORMCastMemberRepository,
+    ):
+        cast_member_repository.save(cast_member=director_cast_member)
+
+        with CaptureQueriesContext(connection) as context:
+            deleted = cast_member_repository.delete(id=director_cast_member.id)
+
+        assert deleted is True
+        assert cast_member_repository.delete(id=director_cast_member.id) is False
+        assert not any(
+            query["sql"].startswith('SELECT "cast_member"')
+            for query in context.captured_queries
+        )
@@ -12,6 +12,7 @@ from src.core.cast_member.gateway.cast_member_gateway import (
     AbstractCastMemberRepository,
 )
 from src.core.shared import settings as core_settings
+from src.core.shared.application.cursor import Cursor
 from src.django_project.cast_member_app.repository import DjangoORMCastMemberRepository
 
 BASE_CAST_MEMBERS_URL = "/api/cast_members/"
@@ -60,6 +61,8 @@ class TestListAPI:
                 "page": 1,
                 "total": 2,
                 "per_page": core_settings.REPOSITORY["page_size"],
+                "next_cursor": None,
+                "prev_cursor": None,
             },
         }
 
@@ -77,6 +80,8 @@ class TestListAPI:
                 "page": 1,
                 "total": 0,
                 "per_page": core_settings.REPOSITORY["page_size"],
+                "next_cursor": None,
+                "prev_cursor": None,
             },
         }
 
@@ -145,6 +150,25 @@ class TestListAPI:
                 "page": page,
                 "total": 5,
                 "per_page": overriden_page_size,
+                "next_cursor": (
+                    Cursor(
+                        order_by="name",
+                        value=expected_cast_members_per_page[page][-1]["name"],
+                        id=UUID(expected_cast_members_per_page[page][-1]["id"]),
+                    ).encode()
+                    if page < 3
+                    else None
+                ),
+                "prev_cursor": (
+                    Cursor(
+                        order_by="name",
+                        value=expected_cast_members_per_page[page][0]["name"],
+                        id=UUID(expected_cast_members_per_page[page][0]["id"]),
+                        backward=True,
+                    ).encode()
+                    if page > 1
+                    else None
+                ),
             },
         }
 
@@ -220,6 +244,92 @@ class TestCreateAPI:
         assert created_cast_member.type == post_data["type"]
 
 
+@pytest.mark.django_db
+class TestIdempotentCreateAPI:
+    def test_retry_replays_response_without_creating_again(
+        self,
+        cast_member_repository: AbstractCastMemberRepository,
+    ):
+        client = APIClient()
+        post_data = {"name": "John", "type": "ACTOR"}
+
+        responses = [
+            client.post(
+                BASE_CAST_MEMBERS_URL,
+                data=post_data,
+                HTTP_IDEMPOTENCY_KEY="create-1",
+            )
+            for _ in range(2)
+        ]
+
+        assert [response.status_code for response in responses] == [
+            status.HTTP_201_CREATED,
+        ] * 2
+        assert responses[0].data == responses[1].data
+        assert cast_member_repository.count() == 1
+
+
+@pytest.mark.django_db
+class TestBulkCreateAPI:
+    def test_bulk_create_cast_members(
+        self,
+        cast_member_repository: AbstractCastMemberRepository,
+    ):
+        response = APIClient().post(
+            path=f"{BASE_CAST_MEMBERS_URL}bulk/",
+            data=[
+                {"name": "John", "type": "ACTOR"},
+                {"name": "Jane", "type": "INVALID_TYPE"},
+                {"name": "Mary", "type": "DIRECTOR"},
+            ],
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert len(response.data["ids"]) == 2
+        assert [error["index"] for error in response.data["errors"]] == [1]
+        assert cast_member_repository.count() == 2
+
+    def test_bulk_create_with_only_invalid_items(
+        self,
+        cast_member_repository: AbstractCastMemberRepository,
+    ):
+        response = APIClient().post(
+            path=f"{BASE_CAST_MEMBERS_URL}bulk/",
+            data=[{"name": "", "type": "ACTOR"}],
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data["ids"] == []
+        assert cast_member_repository.count() == 0
+
+
+@pytest.mark.django_db
+class TestBulkDeleteAPI:
+    def test_deletes_ids_and_reports_missing(
+        self,
+        actor_john_cast_member_model: CastMember,
+        cast_member_repository: AbstractCastMemberRepository,
+    ):
+        missing_id = uuid4()
+
+        response = APIClient().delete(
+            f"{BASE_CAST_MEMBERS_URL}bulk/"
+            f"?ids={actor_john_cast_member_model.id},{missing_id}",
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {"missing_ids": [str(missing_id)]}
+        assert cast_member_repository.count() == 0
+
+    def test_rejects_invalid_ids(self):
+        response = APIClient().delete(f"{BASE_CAST_MEMBERS_URL}bulk/?ids=invalid")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data == {"ids": {0: ["Must be a valid UUID."]}}
+
+
 @pytest.mark.django_db
 class TestUpdateAPI:
     def test_update_cast_member_invalid_payload_error(
@@ -297,6 +407,91 @@ class TestUpdateAPI:
         assert updated_cast_member.name == post_data["name"]
         assert updated_cast_member.type == post_data["type"]
 
+    def test_update_non_existing_cast_member_creates_it(
+        self,
+        cast_member_repository: DjangoORMCastMemberRepository,
+    ):
+        cast_member_id = uuid4()
+        post_data = {
+            "name": "Jane",
+            "type": "DIRECTOR",
+        }
+
+        url = BASE_CAST_MEMBERS_URL + f"{str(cast_member_id)}/"
+        response = APIClient().put(url, data=post_data)
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data["id"] == str(cast_member_id)
+
+        created_cast_member = cast_member_repository.get_by_id(id=cast_member_id)
+
+        assert created_cast_member is not None
+        assert created_cast_member.name == post_data["name"]
+        assert created_cast_member.type == post_data["type"]
+        assert response["ETag"] == '"1"'
+
+    def test_update_with_if_match_rejects_stale_version(
+        self,
+        actor_john_cast_member_model: CastMember,
+        cast_member_repository: DjangoORMCastMemberRepository,
+    ):
+        url = BASE_CAST_MEMBERS_URL + f"{str(actor_john_cast_member_model.id)}/"
+        first_response = APIClient().put(
+            url,
+            data={"name": "Jonathan", "type": "DIRECTOR"},
+            HTTP_IF_MATCH='"1"',
+        )
+        second_response = APIClient().put(
+            url,
+            data={"name": "Johnny", "type": "ACTOR"},
+            HTTP_IF_MATCH='"1"',
+        )
+
+        assert first_response.status_code == status.HTTP_204_NO_CONTENT
+        assert first_response["ETag"] == '"2"'
+        assert second_response.status_code == status.HTTP_409_CONFLICT
+
+        updated_cast_member = cast_member_repository.get_by_id(
+            id=actor_john_cast_member_model.id,
+        )
+        assert updated_cast_member is not None
+        assert updated_cast_member.name == "Jonathan"
+        assert updated_cast_member.version == 2
+
+    def test_partial_update_cast_member_name(
+        self,
+        actor_john_cast_member_model: CastMember,
+        cast_member_repository: DjangoORMCastMemberRepository,
+    ):
+        url = BASE_CAST_MEMBERS_URL + f"{str(actor_john_cast_member_model.id)}/"
+        response = APIClient().patch(
+            url,
+            data={"name": "Jonathan"},
+            HTTP_IF_MATCH='"1"',
+        )
+        stale_response = APIClient().patch(
+            url,
+            data={"type": "DIRECTOR"},
+            HTTP_IF_MATCH='"1"',
+        )
+
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        assert response["ETag"] == '"2"'
+        assert stale_response.status_code == status.HTTP_409_CONFLICT
+
+        updated_cast_member = cast_member_repository.get_by_id(
+            id=actor_john_cast_member_model.id,
+        )
+        assert updated_cast_member is not None
+        assert updated_cast_member.name == "Jonathan"
+        assert updated_cast_member.type == actor_john_cast_member_model.type
+
+    def test_partial_update_non_existing_cast_member_error(self):
+        url = BASE_CAST_MEMBERS_URL + f"{str(uuid4())}/"
+        response = APIClient().patch(url, data={"name": "Jane"})
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
 
 @pytest.mark.django_db
 class TestDeleteCastMember:
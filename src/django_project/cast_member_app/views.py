@@ -1,15 +1,29 @@
+from typing import Any
+from uuid import UUID
+
+from django.http import QueryDict
 from rest_framework import status, viewsets
 from rest_framework.request import Request
 from rest_framework.response import Response
 
+from src.core.cast_member.application.bulk_create_cast_members import (
+    BulkCreateCastMembers,
+)
+from src.core.cast_member.application.bulk_delete_cast_members import (
+    BulkDeleteCastMembers,
+)
 from src.core.cast_member.application.create_cast_member import CreateCastMember
 from src.core.cast_member.application.delete_cast_member import DeleteCastMember
 from src.core.cast_member.application.errors import (
     CastMemberNotFound,
+    CastMemberVersionConflict,
     InvalidCastMemberData,
 )
 from src.core.cast_member.application.list_cast_member import ListCastMembers
 from src.core.cast_member.application.update_cast_member import UpdateCastMember
+from src.core.cast_member.application.upsert_cast_member import UpsertCastMember
+from src.core.shared.application.bulk import BulkCreateOutput, BulkDeleteOutput
+from src.django_project.cast_member_app.models import CastMember as CastMemberModel
 from src.django_project.cast_member_app.repository import DjangoORMCastMemberRepository
 from src.django_project.cast_member_app.serializers import (
     CreateCastMemberRequestSerializer,
@@ -19,16 +33,39 @@ from src.django_project.cast_member_app.serializers import (
     UpdateCastMemberRequestSerializer,
     UpdateCastMemberResponseSerializer,
 )
+from src.django_project.shared.repository.unit_of_work import DjangoUnitOfWork
 from src.django_project.shared.views import mixins
 
 
-class CastMemberViewSet(viewsets.ViewSet, mixins.OrderedPaginatedListMixin):
+class CastMemberViewSet(
+    viewsets.ViewSet,
+    mixins.OrderedPaginatedListMixin,
+    mixins.BulkMixin,
+    mixins.IdempotentCreateMixin,
+    mixins.ConditionalUpdateMixin,
+):
     repository_class = DjangoORMCastMemberRepository
 
     list_use_case_class = ListCastMembers
     serializer_class = ListCastMemberResponseSerializer
 
-    def create(self, request: Request) -> Response:
+    list_cache_model = CastMemberModel
+
+    bulk_item_serializer_class = CreateCastMemberRequestSerializer
+
+    def execute_bulk_create(self, items: list[dict[str, Any]]) -> BulkCreateOutput:
+        input = BulkCreateCastMembers.Input(
+            items=[CreateCastMember.Input(**item) for item in items],
+        )
+        use_case = BulkCreateCastMembers(unit_of_work=DjangoUnitOfWork())
+        return use_case.execute(input=input)
+
+    def execute_bulk_delete(self, ids: list[UUID]) -> BulkDeleteOutput:
+        input = BulkDeleteCastMembers.Input(ids=ids)
+        use_case = BulkDeleteCastMembers(repository=DjangoORMCastMemberRepository())
+        return use_case.execute(input=input)
+
+    def execute_create(self, request: Request) -> Response:
         serializer_input = CreateCastMemberRequestSerializer(data=request.data)
         serializer_input.is_valid(raise_exception=True)
 
@@ -59,7 +96,56 @@ class CastMemberViewSet(viewsets.ViewSet, mixins.OrderedPaginatedListMixin):
         )
         serializer_input.is_valid(raise_exception=True)
 
-        input = UpdateCastMember.Input(**serializer_input.validated_data)
+        input = UpsertCastMember.Input(
+            **serializer_input.validated_data,
+            version=self.get_if_match_version(request),
+        )
+        use_case = UpsertCastMember(
+            repository=DjangoORMCastMemberRepository(),
+            unit_of_work=DjangoUnitOfWork(),
+        )
+
+        try:
+            output = use_case.execute(input=input)
+        except InvalidCastMemberData as exc:
+            return Response(
+                status=status.HTTP_400_BAD_REQUEST,
+                data={"error": str(exc)},
+            )
+        except CastMemberVersionConflict:
+            return Response(status=status.HTTP_409_CONFLICT)
+
+        serialized_output = UpdateCastMemberResponseSerializer(instance=output)
+
+        return Response(
+            status=(
+                status.HTTP_201_CREATED
+                if output.created
+                else status.HTTP_204_NO_CONTENT
+            ),
+            data=serialized_output.data,
+            headers=self.get_etag_headers(output.version),
+        )
+
+    def partial_update(self, request: Request, pk=None) -> Response:
+        if isinstance(request.data, QueryDict):
+            data = request.data.dict()
+        else:
+            data = request.data
+
+        serializer_input = UpdateCastMemberRequestSerializer(
+            data={
+                **data,
+                "id": pk,
+            },
+            partial=True,
+        )
+        serializer_input.is_valid(raise_exception=True)
+
+        input = UpdateCastMember.Input(
+            **serializer_input.validated_data,
+            version=self.get_if_match_version(request),
+        )
         use_case = UpdateCastMember(repository=DjangoORMCastMemberRepository())
 
         try:
@@ -71,12 +157,15 @@ class CastMemberViewSet(viewsets.ViewSet, mixins.OrderedPaginatedListMixin):
                 status=status.HTTP_400_BAD_REQUEST,
                 data={"error": str(exc)},
             )
+        except CastMemberVersionConflict:
+            return Response(status=status.HTTP_409_CONFLICT)
 
         serialized_output = UpdateCastMemberResponseSerializer(instance=output)
 
         return Response(
             status=status.HTTP_204_NO_CONTENT,
             data=serialized_output.data,
+            headers=self.get_etag_headers(output.version),
         )
 
     def destroy(self, request: Request, pk=None) -> Response:
@@ -0,0 +1,22 @@
+# Generated by Django 5.0.2 on 2026-10-18 12:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('category_app', '0002_add_name_id_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='category',
+            name='genre_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name='category',
+            index=models.Index(fields=['genre_count', 'id'], name='category_genre_count_id_idx'),
+        ),
+    ]
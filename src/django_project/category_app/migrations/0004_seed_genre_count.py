@@ -0,0 +1,29 @@
+from django.db import migrations
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def seed_genre_count(apps, schema_editor):
+    Category = apps.get_model("category_app", "Category")
+    GenreCategory = apps.get_model("genre_app", "GenreCategory")
+
+    genre_count = (
+        GenreCategory.objects
+        .filter(category_id=OuterRef("id"))
+        .values("category_id")
+        .annotate(count=Count("*"))
+        .values("count")
+    )
+    Category.objects.update(genre_count=Coalesce(Subquery(genre_count), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('category_app', '0003_add_genre_count'),
+        ('genre_app', '0003_add_genre_category_through_model'),
+    ]
+
+    operations = [
+        migrations.RunPython(seed_genre_count, migrations.RunPython.noop),
+    ]
@@ -8,11 +8,20 @@ class Category(models.Model):
         app_label = "category_app"
         db_table = "category"
         verbose_name_plural = "categories"
+        indexes = [
+            models.Index(fields=["name", "id"], name="category_name_id_idx"),
+            models.Index(
+                fields=["genre_count", "id"],
+                name="category_genre_count_id_idx",
+            ),
+        ]
 
     id = models.UUIDField(primary_key=True, default=uuid4)
     name = models.CharField(max_length=255)
     description = models.TextField()
     is_active = models.BooleanField(default=True)
+    genre_count = models.PositiveIntegerField(default=0)
+    version = models.PositiveIntegerField(default=1)
 
     def __str__(self) -> str:
         return self.name
@@ -1,13 +1,47 @@
+from collections.abc import Callable, Sequence
+from typing import Any
 from uuid import UUID
 
-from django.core.paginator import Paginator
+from django.db import connection, transaction
+from django.db.models import F
 from django.db.models.query import QuerySet
 
 from src.core.category.domain.category import Category
 from src.core.category.gateway.category_gateway import AbstractCategoryRepository
 from src.core.shared import settings as core_settings
+from src.core.shared.application.count import TotalMode
+from src.core.shared.application.cursor import Cursor
+from src.core.shared.application.ordering import get_ordering
 from src.django_project.category_app.models import Category as CategoryModel
+from src.django_project.counter_app.counters import (
+    get_estimated_row_count,
+    get_row_count,
+    increment_row_count,
+)
+from src.django_project.genre_app.models import GenreCategory
+from src.django_project.genre_app.read_model import remove_categories_from_genre_list
+from src.django_project.page_boundary_app.boundaries import (
+    get_page_boundary,
+    truncate_page_boundaries,
+)
+from src.django_project.shared.repository.list_cache import (
+    invalidate_list_cache_on_commit,
+)
 from src.django_project.shared.repository.mapper import BaseORMMapper
+from src.django_project.shared.repository.pagination import (
+    get_keyset_page,
+    get_offset_page,
+)
+from src.django_project.shared.repository.upsert import upsert_versioned_entities
+from src.django_project.shared.repository.writes import (
+    delete_existing_rows,
+    delete_rows_in_chunks,
+    finish_rows_write,
+    start_rows_write,
+    update_versioned_rows,
+)
+
+CATEGORY_UPDATE_FIELDS = ["name", "description", "is_active"]
 
 
 class CategoryMapper(BaseORMMapper[Category, CategoryModel]):
@@ -18,6 +52,7 @@ class CategoryMapper(BaseORMMapper[Category, CategoryModel]):
             name=entity.name,
             description=entity.description,
             is_active=entity.is_active,
+            version=entity.version,
         )
         if save:
             instance.save()
@@ -30,6 +65,8 @@ class CategoryMapper(BaseORMMapper[Category, CategoryModel]):
             name=model.name,
             description=model.description,
             is_active=model.is_active,
+            genre_count=model.genre_count,
+            version=model.version,
         )
 
 
@@ -37,12 +74,78 @@ class DjangoORMCategoryRepository(AbstractCategoryRepository):
     def __init__(self, category_model: type[CategoryModel] = CategoryModel):
         self.category_model = category_model
         self._count: int | None = None
+        self._count_by_genre: dict[UUID, int] = {}
 
     def get_queryset(self) -> QuerySet:
         return self.category_model.objects.all()
 
     def save(self, category: Category) -> None:
-        CategoryMapper.to_model(category, save=True)
+        with transaction.atomic():
+            CategoryMapper.to_model(category, save=True)
+            increment_row_count(self.category_model)
+            truncate_page_boundaries(self.category_model, category.id)
+            invalidate_list_cache_on_commit(self.category_model)
+        self._count = None
+
+    def save_many(self, categories: list[Category]) -> None:
+        if not categories:
+            return None
+
+        with transaction.atomic():
+            self.category_model.objects.bulk_create(
+                [CategoryMapper.to_model(category) for category in categories],
+                batch_size=core_settings.REPOSITORY["bulk_create_batch_size"],
+            )
+            finish_rows_write(
+                self.category_model,
+                [category.id for category in categories],
+                row_delta=len(categories),
+            )
+        self._count = None
+
+    def update_many(self, categories: list[Category]) -> set[UUID]:
+        if not categories:
+            return set()
+
+        ids = [category.id for category in categories]
+        with transaction.atomic():
+            start_rows_write(self.category_model, ids)
+            conflicted_ids = update_versioned_rows(
+                self.category_model,
+                categories,
+                update_fields=CATEGORY_UPDATE_FIELDS,
+            )
+            finish_rows_write(self.category_model, ids)
+        return conflicted_ids
+
+    def delete_many(self, ids: set[UUID]) -> set[UUID]:
+        missing_ids = delete_rows_in_chunks(ids, self._delete_chunk)
+        self._count = None
+        return missing_ids
+
+    def _delete_chunk(self, ids: list[UUID]) -> set[UUID]:
+        self._delete_genre_links(ids, on_progress=None)
+        return delete_existing_rows(self.category_model, ids)
+
+    def upsert(self, category: Category) -> bool:
+        return bool(self.upsert_many([category]))
+
+    def upsert_many(self, categories: list[Category]) -> set[UUID]:
+        if not categories:
+            return set()
+
+        ids = [category.id for category in categories]
+        with transaction.atomic():
+            start_rows_write(self.category_model, ids)
+            created_ids = upsert_versioned_entities(
+                self.category_model,
+                categories,
+                CategoryMapper.to_model,
+                update_fields=CATEGORY_UPDATE_FIELDS,
+            )
+            finish_rows_write(self.category_model, ids, row_delta=len(created_ids))
+        self._count = None
+        return created_ids
 
     def get_by_id(self, id: UUID) -> Category | None:
         try:
@@ -52,48 +155,315 @@ class DjangoORMCategoryRepository(AbstractCategoryRepository):
 
         return CategoryMapper.to_entity(found_category)
 
-    def list(
+    def get_missing_ids(self, ids: set[UUID]) -> set[UUID]:
+        if not ids:
+            return set()
+
+        existing_ids = (
+            self.get_queryset()
+            .filter(id__in=ids)
+            .values_list("id", flat=True)
+        )
+        return ids - set(existing_ids)
+
+    def get_values_by_id(self, id: UUID, fields: list[str]) -> dict[str, Any] | None:
+        return self.get_queryset().filter(id=id).values(*fields).first()
+
+    def list_values_by_ids(
         self,
+        ids: set[UUID],
+        fields: list[str],
+    ) -> list[dict[str, Any]]:
+        if not ids:
+            return []
+
+        return list(self.get_queryset().filter(id__in=ids).values(*fields))
+
+    def list_after(
+        self,
+        cursor: Cursor | None,
+        order_by: str,
+        limit: int,
+    ) -> list[Category]:
+        categories = get_keyset_page(
+            queryset=self.get_queryset(),
+            cursor=cursor,
+            order_by=order_by,
+            limit=limit,
+        )
+
+        return [
+            CategoryMapper.to_entity(category)
+            for category in categories
+        ]
+
+    def list_values_after(
+        self,
+        fields: list[str],
+        cursor: Cursor | None,
+        order_by: str,
+        limit: int,
+    ) -> list[dict[str, Any]]:
+        return list(
+            get_keyset_page(
+                queryset=self.get_queryset().values(*fields),
+                cursor=cursor,
+                order_by=order_by,
+                limit=limit,
+            )
+        )
+
+    def list_values(
+        self,
+        fields: list[str],
         order_by: str | None = None,
         page: int | None = None,
-    ) -> list[Category]:
-        queryset = self.get_queryset()
+        page_size: int | None = None,
+        with_total: bool = False,
+    ) -> list[dict[str, Any]]:
+        return self._get_page_rows(
+            queryset=self.get_queryset().values(*fields),
+            order_by=order_by,
+            page=page,
+            page_size=page_size,
+            with_total=with_total,
+        )
+
+    def _get_page_rows(
+        self,
+        queryset: QuerySet,
+        order_by: str | None,
+        page: int | None,
+        page_size: int | None,
+        with_total: bool,
+        genre_id: UUID | None = None,
+    ) -> list[Any]:
+        if genre_id is not None:
+            queryset = queryset.filter(genrecategory__genre_id=genre_id)
 
         if order_by is not None:
-            queryset = queryset.order_by(order_by)
+            queryset = queryset.order_by(*get_ordering(order_by))
+
+        if page is None:
+            return list(queryset)
+
+        if page_size is None:
+            page_size = core_settings.REPOSITORY["page_size"]
 
-        if page is not None:
-            paginator = Paginator(queryset, core_settings.REPOSITORY["page_size"])
-            paginator_page = paginator.page(page)
-            categories = paginator_page.object_list
-            self._count = paginator.count
+        if genre_id is None:
+            start, start_position = get_page_boundary(
+                queryset=self.get_queryset(),
+                order_by=order_by,
+                offset=(page - 1) * page_size,
+            )
         else:
-            categories = list(queryset)
+            # Page boundaries are kept for the whole table only.
+            start, start_position = None, 0
+
+        rows, total = get_offset_page(
+            queryset=queryset,
+            page=page,
+            page_size=page_size,
+            with_total=with_total,
+            start=start,
+            start_position=start_position,
+        )
+
+        if total is not None:
+            if genre_id is None:
+                self._count = total
+            else:
+                self._count_by_genre[genre_id] = total
+
+        return rows
+
+    def list_by_genre_after(
+        self,
+        genre_id: UUID,
+        cursor: Cursor | None,
+        order_by: str,
+        limit: int,
+    ) -> list[Category]:
+        categories = get_keyset_page(
+            queryset=self.get_queryset().filter(genrecategory__genre_id=genre_id),
+            cursor=cursor,
+            order_by=order_by,
+            limit=limit,
+        )
 
         return [
             CategoryMapper.to_entity(category)
             for category in categories
         ]
 
-    def count(
+    def list_by_genre(
+        self,
+        genre_id: UUID,
+        order_by: str | None = None,
+        page: int | None = None,
+        page_size: int | None = None,
+        with_total: bool = False,
+    ) -> list[Category]:
+        categories = self._get_page_rows(
+            queryset=self.get_queryset(),
+            order_by=order_by,
+            page=page,
+            page_size=page_size,
+            with_total=with_total,
+            genre_id=genre_id,
+        )
+
+        return [
+            CategoryMapper.to_entity(category)
+            for category in categories
+        ]
+
+    def list_values_by_genre_after(
+        self,
+        genre_id: UUID,
+        fields: list[str],
+        cursor: Cursor | None,
+        order_by: str,
+        limit: int,
+    ) -> list[dict[str, Any]]:
+        return list(
+            get_keyset_page(
+                queryset=self.get_queryset()
+                .filter(genrecategory__genre_id=genre_id)
+                .values(*fields),
+                cursor=cursor,
+                order_by=order_by,
+                limit=limit,
+            )
+        )
+
+    def list_values_by_genre(
+        self,
+        genre_id: UUID,
+        fields: list[str],
+        order_by: str | None = None,
+        page: int | None = None,
+        page_size: int | None = None,
+        with_total: bool = False,
+    ) -> list[dict[str, Any]]:
+        return self._get_page_rows(
+            queryset=self.get_queryset().values(*fields),
+            order_by=order_by,
+            page=page,
+            page_size=page_size,
+            with_total=with_total,
+            genre_id=genre_id,
+        )
+
+    def list(
         self,
-    ) -> int:
+        order_by: str | None = None,
+        page: int | None = None,
+        page_size: int | None = None,
+        with_total: bool = False,
+    ) -> list[Category]:
+        categories = self._get_page_rows(
+            queryset=self.get_queryset(),
+            order_by=order_by,
+            page=page,
+            page_size=page_size,
+            with_total=with_total,
+        )
+
+        return [
+            CategoryMapper.to_entity(category)
+            for category in categories
+        ]
+
+    def count(self, mode: TotalMode = TotalMode.EXACT) -> int:
+        if mode == TotalMode.MAINTAINED:
+            return get_row_count(self.category_model)
+
+        if mode == TotalMode.ESTIMATED:
+            return get_estimated_row_count(self.category_model)
+
         if self._count is None:
             self._count = self.get_queryset().count()
         return self._count
 
-    def delete(self, id: UUID) -> None:
-        self.get_queryset().filter(id=id).delete()
+    def count_by_genre(self, genre_id: UUID) -> int:
+        count = self._count_by_genre.pop(genre_id, None)
+        if count is None:
+            count = GenreCategory.objects.filter(genre_id=genre_id).count()
+        return count
+
+    def delete(
+        self,
+        id: UUID,
+        on_progress: Callable[[int], None] | None = None,
+    ) -> bool:
+        self._delete_genre_links([id], on_progress=on_progress)
+
+        with transaction.atomic():
+            truncate_page_boundaries(self.category_model, id)
+            invalidate_list_cache_on_commit(self.category_model)
+            _, deleted_by_model = self.get_queryset().filter(id=id).delete()
+            deleted = deleted_by_model.get(self.category_model._meta.label, 0)
+            if deleted:
+                increment_row_count(self.category_model, delta=-deleted)
         self._count = None
+        return bool(deleted)
 
-    def update(self, category: Category) -> None:
-        (
-            self.get_queryset()
-            .filter(
-                id=category.id,
-            ).update(
-                name=category.name,
-                description=category.description,
-                is_active=category.is_active,
+    def _delete_genre_links(
+        self,
+        ids: Sequence[UUID],
+        on_progress: Callable[[int], None] | None,
+    ) -> None:
+        """Delete genre links in short transactions, bypassing the collector."""
+        chunk_size = core_settings.REPOSITORY["delete_chunk_size"]
+        table = connection.ops.quote_name(GenreCategory._meta.db_table)
+        deleted_links = 0
+
+        while True:
+            with transaction.atomic():
+                links = list(
+                    GenreCategory.objects
+                    .filter(category_id__in=ids)
+                    .values_list("id", "genre_id")[:chunk_size]
+                )
+                if not links:
+                    return None
+
+                remove_categories_from_genre_list(
+                    ids,
+                    genre_ids={genre_id for _, genre_id in links},
+                )
+                with connection.cursor() as cursor:
+                    cursor.execute(
+                        f"DELETE FROM {table}"
+                        f" WHERE id IN ({', '.join(['%s'] * len(links))})",
+                        [link_id for link_id, _ in links],
+                    )
+                invalidate_list_cache_on_commit(self.category_model)
+
+            deleted_links += len(links)
+            if on_progress is not None:
+                on_progress(deleted_links)
+
+    def update(self, category: Category) -> bool:
+        with transaction.atomic():
+            truncate_page_boundaries(self.category_model, category.id)
+            updated = (
+                self.get_queryset()
+                .filter(
+                    id=category.id,
+                    version=category.version,
+                ).update(
+                    name=category.name,
+                    description=category.description,
+                    is_active=category.is_active,
+                    version=F("version") + 1,
+                )
             )
-        )
+            if not updated:
+                return False
+
+            truncate_page_boundaries(self.category_model, category.id)
+            invalidate_list_cache_on_commit(self.category_model)
+        category.version += 1
+        return True
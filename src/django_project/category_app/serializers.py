@@ -2,14 +2,16 @@ from rest_framework import serializers
 
 from src.django_project.shared.serializers.serializers import (
     PaginatedListResponseSerializer,
+    SparseFieldsetSerializer,
 )
 
 
-class CategoryResponseSerializer(serializers.Serializer):
+class CategoryResponseSerializer(SparseFieldsetSerializer):
     id = serializers.UUIDField()
     name = serializers.CharField(max_length=255)
     description = serializers.CharField()
     is_active = serializers.BooleanField()
+    genre_count = serializers.IntegerField()
 
 
 class ListCategoryResponseSerializer(PaginatedListResponseSerializer):
@@ -1,7 +1,20 @@
+from unittest.mock import patch
+from uuid import UUID, uuid4
+
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
+from src.core.category.application.list_categories import ListCategories
 from src.core.category.domain.category import Category
+from src.core.genre.domain.genre import Genre
+from src.core.shared import settings as core_settings
+from src.core.shared.application.count import TotalMode
+from src.core.shared.application.cursor import Cursor
+from src.core.shared.application.ordering import get_cursor_value, sort_rows
 from src.django_project.category_app.repository import DjangoORMCategoryRepository
+from src.django_project.genre_app.models import GenreCategory, GenreListItem
+from src.django_project.genre_app.repository import DjangoORMGenreRepository
 
 
 @pytest.mark.django_db
@@ -59,6 +72,29 @@ class TestGetByIdDjangoORMCategoryRepository:
         assert movie_category == found_category
 
 
+@pytest.mark.django_db
+class TestGetMissingIdsDjangoORMCategoryRepository:
+    def test_checks_ids_in_single_query(
+        self,
+        movie_category: Category,
+        serie_category: Category,
+        django_assert_num_queries,
+    ):
+        repository = DjangoORMCategoryRepository()
+        repository.save(category=movie_category)
+        repository.save(category=serie_category)
+        unknown_id = uuid4()
+
+        with django_assert_num_queries(1):
+            missing_ids = repository.get_missing_ids({movie_category.id, unknown_id})
+
+        assert missing_ids == {unknown_id}
+
+    def test_no_ids_needs_no_query(self, django_assert_num_queries):
+        with django_assert_num_queries(0):
+            assert DjangoORMCategoryRepository().get_missing_ids(set()) == set()
+
+
 @pytest.mark.django_db
 class TestCanListCategoriesRepository:
     def test_can_empty_list_category(self):
@@ -97,6 +133,134 @@ class TestCanListCategoriesRepository:
         assert movie_category in found_categories
         assert serie_category in found_categories
 
+    def test_list_page_fills_count_in_single_query(
+        self,
+        movie_category: Category,
+        serie_category: Category,
+        django_assert_num_queries,
+    ):
+        repository = DjangoORMCategoryRepository()
+        repository.save(category=movie_category)
+        repository.save(category=serie_category)
+
+        repository = DjangoORMCategoryRepository()
+        with django_assert_num_queries(1):
+            output = ListCategories(repository=repository).execute(
+                input=ListCategories.Input(),
+            )
+
+        assert output.meta.total == 2
+        assert len(output.data) == 2
+
+    def test_list_values_by_genre_only_selects_requested_fields(
+        self,
+        movie_category: Category,
+        serie_category: Category,
+        django_assert_num_queries,
+    ):
+        repository = DjangoORMCategoryRepository()
+        repository.save(category=movie_category)
+        repository.save(category=serie_category)
+        genre = Genre(name="Romance", categories=[serie_category.id])
+        DjangoORMGenreRepository().save(genre=genre)
+
+        with django_assert_num_queries(1) as context:
+            categories = repository.list_values_by_genre(
+                genre_id=genre.id,
+                fields=["id", "name"],
+            )
+
+        assert categories == [
+            {"id": serie_category.id, "name": serie_category.name},
+        ]
+        assert "description" not in context.captured_queries[0]["sql"]
+
+
+@pytest.mark.django_db
+class TestListAfterDjangoORMCategoryRepository:
+    @pytest.mark.parametrize(
+        "order_by",
+        ["name", "-name"],
+    )
+    def test_can_list_categories_after_cursor(
+        self,
+        order_by: str,
+        movie_category: Category,
+        serie_category: Category,
+        documentary_category: Category,
+    ):
+        categories = [
+            movie_category,
+            serie_category,
+            documentary_category,
+        ]
+
+        repository = DjangoORMCategoryRepository()
+
+        for category in categories:
+            repository.save(category=category)
+
+        expected_categories = sorted(
+            categories,
+            key=lambda category: category.name,
+            reverse=order_by.startswith("-"),
+        )
+
+        first_page = repository.list_after(cursor=None, order_by=order_by, limit=2)
+        cursor = Cursor(
+            order_by=order_by,
+            value=first_page[-1].name,
+            id=first_page[-1].id,
+        )
+        second_page = repository.list_after(
+            cursor=cursor,
+            order_by=order_by,
+            limit=2,
+        )
+
+        assert first_page == expected_categories[:2]
+        assert second_page == expected_categories[2:]
+
+    @pytest.mark.parametrize(
+        "order_by",
+        ["name", "name,-id", "-name,description", "description,-name,id"],
+    )
+    def test_pages_with_duplicate_keys_are_stable(self, order_by: str):
+        categories = [
+            Category(name=f"Category {index % 2}", description="Same description")
+            for index in range(6)
+        ]
+
+        repository = DjangoORMCategoryRepository()
+
+        for category in categories:
+            repository.save(category=category)
+
+        expected_ids = [
+            category.id
+            for category in sort_rows(categories, order_by=order_by)
+        ]
+
+        offset_ids = [
+            category.id
+            for page in (1, 2, 3)
+            for category in repository.list(order_by=order_by, page=page, page_size=2)
+        ]
+
+        keyset_ids: list[UUID] = []
+        cursor = None
+        for _ in range(3):
+            page = repository.list_after(cursor=cursor, order_by=order_by, limit=2)
+            keyset_ids.extend(category.id for category in page)
+            cursor = Cursor(
+                order_by=order_by,
+                value=get_cursor_value(page[-1], order_by),
+                id=page[-1].id,
+            )
+
+        assert offset_ids == expected_ids
+        assert keyset_ids == expected_ids
+
 
 @pytest.mark.django_db
 class TestDeleteDjangoORMCategoryRepository:
@@ -130,6 +294,97 @@ class TestDeleteDjangoORMCategoryRepository:
         assert repository.category_model.objects.filter(id=serie_category.id).exists()
         assert repository.category_model.objects.count() == 1
 
+    def test_deletes_genre_links_in_chunks_before_category(
+        self,
+        movie_category: Category,
+    ):
+        repository = DjangoORMCategoryRepository()
+        repository.save(movie_category)
+        genre_repository = DjangoORMGenreRepository()
+        genres = [
+            Genre(name=f"Genre {index}", categories=[movie_category.id])
+            for index in range(5)
+        ]
+        for genre in genres:
+            genre_repository.save(genre)
+        progress: list[int] = []
+
+        with (
+            patch.dict(core_settings.REPOSITORY, {"delete_chunk_size": 2}),
+            CaptureQueriesContext(connection) as context,
+        ):
+            repository.delete(id=movie_category.id, on_progress=progress.append)
+
+        assert progress == [2, 4, 5]
+        # Three chunks, then the collector's now-empty fast delete.
+        assert [
+            query["sql"].split('"')[1]
+            for query in context.captured_queries
+            if query["sql"].startswith("DELETE")
+        ] == ["genre_categories"] * 4 + ["category"]
+        assert not GenreCategory.objects.exists()
+        assert list(
+            GenreListItem.objects.values_list("categories", flat=True)
+        ) == [[]] * 5
+
+    def test_delete_many_deletes_genre_links_in_chunks(
+        self,
+        movie_category: Category,
+        serie_category: Category,
+    ):
+        repository = DjangoORMCategoryRepository()
+        repository.save(movie_category)
+        repository.save(serie_category)
+        genre_repository = DjangoORMGenreRepository()
+        for index in range(3):
+            genre_repository.save(
+                Genre(
+                    name=f"Genre {index}",
+                    categories=[movie_category.id, serie_category.id],
+                )
+            )
+
+        with (
+            patch.dict(core_settings.REPOSITORY, {"delete_chunk_size": 4}),
+            CaptureQueriesContext(connection) as context,
+        ):
+            missing_ids = repository.delete_many(
+                {movie_category.id, serie_category.id},
+            )
+
+        assert missing_ids == set()
+        # Two bounded link chunks, then the collector's now-empty fast delete.
+        assert [
+            query["sql"].split('"')[1]
+            for query in context.captured_queries
+            if query["sql"].startswith("DELETE")
+        ] == ["genre_categories"] * 3 + ["category"]
+        assert not repository.category_model.objects.exists()
+        assert list(
+            GenreListItem.objects.values_list("categories", flat=True)
+        ) == [[]] * 3
+
+
+@pytest.mark.django_db
+class TestCountDjangoORMCategoryRepository:
+    def test_save_and_delete_maintain_row_count(
+        self,
+        movie_category: Category,
+        serie_category: Category,
+    ):
+        repository = DjangoORMCategoryRepository()
+
+        repository.save(category=movie_category)
+        repository.save(category=serie_category)
+
+        assert repository.count(mode=TotalMode.MAINTAINED) == 2
+
+        repository.delete(id=movie_category.id)
+        repository.delete(id=movie_category.id)
+
+        assert repository.count(mode=TotalMode.MAINTAINED) == 1
+        assert repository.count(mode=TotalMode.EXACT) == 1
+
 
 @pytest.mark.django_db
 class TestUpdateDjangoORMCategoryRepository:
@@ -158,3 +413,126 @@ class TestUpdateDjangoORMCategoryRepository:
         assert updated_category.name == updated_category_name
         assert updated_category.description == movie_category.description
         assert updated_category.is_active == movie_category.is_active
+
+    def test_update_checks_and_bumps_version(
+        self,
+        movie_category: Category,
+        category_repository: DjangoORMCategoryRepository,
+    ):
+        category_repository.save(movie_category)
+        stale_category = category_repository.get_by_id(id=movie_category.id)
+        assert stale_category is not None
+
+        movie_category.update_category(name="Film", description="")
+        stale_category.update_category(name="Serie", description="")
+
+        with CaptureQueriesContext(connection) as context:
+            updated = category_repository.update(category=movie_category)
+
+        assert updated is True
+        assert movie_category.version == 2
+        assert category_repository.update(category=stale_category) is False
+
+        category_updates = [
+            query["sql"]
+            for query in context.captured_queries
+            if query["sql"].startswith('UPDATE "category"')
+        ]
+        assert len(category_updates) == 1
+        assert '"version"' in category_updates[0].split("WHERE")[1]
+
+        updated_category = category_repository.get_by_id(id=movie_category.id)
+        assert updated_category is not None
+        assert updated_category.name == "Film"
+        assert updated_category.version == 2
+
+    def test_update_many_reports_version_conflicts(
+        self,
+        movie_category: Category,
+        serie_category: Category,
+        category_repository: DjangoORMCategoryRepository,
+    ):
+        category_repository.save(movie_category)
+        category_repository.save(serie_category)
+        stale_category = category_repository.get_by_id(id=movie_category.id)
+        assert stale_category is not None
+        category_repository.update(category=movie_category)
+
+        stale_category.update_category(name="Film", description="")
+        serie_category.update_category(name="Show", description="")
+        conflicted_ids = category_repository.update_many(
+            [stale_category, serie_category],
+        )
+
+        assert conflicted_ids == {movie_category.id}
+        assert (stale_category.version, serie_category.version) == (1, 2)
+        assert list(
+            category_repository.get_queryset()
+            .order_by("name")
+            .values_list("name", "version")
+        ) == [("Movie", 2), ("Show", 2)]
+
+
+@pytest.mark.django_db
+class TestUpsertDjangoORMCategoryRepository:
+    def test_upsert_writes_row_in_one_statement(
+        self,
+        movie_category: Category,
+        category_repository: DjangoORMCategoryRepository,
+    ):
+        with CaptureQueriesContext(connection) as context:
+            created = category_repository.upsert(category=movie_category)
+
+        category_writes = [
+            query["sql"]
+            for query in context.captured_queries
+            if query["sql"].startswith(('INSERT INTO "category"', 'UPDATE "category"'))
+        ]
+        assert created is True
+        assert len(category_writes) == 1
+        assert "ON CONFLICT" in category_writes[0]
+
+    def test_upsert_replaces_existing_row(
+        self,
+        movie_category: Category,
+        serie_category: Category,
+        category_repository: DjangoORMCategoryRepository,
+    ):
+        category_repository.save(category=movie_category)
+        movie_category.update_category(name="Film", description="")
+
+        created_ids = category_repository.upsert_many(
+            [movie_category, serie_category],
+        )
+
+        assert created_ids == {serie_category.id}
+        updated_category = category_repository.get_by_id(id=movie_category.id)
+        assert updated_category is not None
+        assert updated_category.name == "Film"
+        assert updated_category.version == 2
+        assert serie_category.version == 1
+        assert category_repository.count(mode=TotalMode.MAINTAINED) == 2
+
+    def test_upsert_bumps_version_in_the_statement(
+        self,
+        movie_category: Category,
+        category_repository: DjangoORMCategoryRepository,
+    ):
+        category_repository.save(category=movie_category)
+        first_put = Category(id=movie_category.id, name="Film")
+        second_put = Category(id=movie_category.id, name="Picture")
+
+        with CaptureQueriesContext(connection) as context:
+            category_repository.upsert(category=first_put)
+            category_repository.upsert(category=second_put)
+
+        # Both writers start from the same stale version and neither reads it.
+        assert (first_put.version, second_put.version) == (2, 3)
+        assert not [
+            query["sql"]
+            for query in context.captured_queries
+            if query["sql"].startswith('SELECT "category"')
+        ]
+        updated_category = category_repository.get_by_id(id=movie_category.id)
+        assert updated_category is not None
+        assert (updated_category.name, updated_category.version) == ("Picture", 3)
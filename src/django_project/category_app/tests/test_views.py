@@ -1,5 +1,7 @@
+import json
+from base64 import urlsafe_b64encode
 from typing import Any
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 from uuid import UUID, uuid4
 
 import pytest
@@ -8,8 +10,17 @@ from rest_framework.test import APIClient
 
 from src.core.category.application.list_categories import ListCategories
 from src.core.category.domain.category import Category
+from src.core.genre.domain.genre import Genre
 from src.core.shared import settings as core_settings
+from src.core.shared.application.count import TotalMode
+from src.core.shared.application.cursor import Cursor
+from src.django_project.category_app.models import Category as CategoryModel
 from src.django_project.category_app.repository import DjangoORMCategoryRepository
+from src.django_project.category_app.views import CategoryViewSet
+from src.django_project.genre_app.models import GenreListItem
+from src.django_project.idempotency_app.models import IdempotencyKey
+from src.django_project.genre_app.repository import DjangoORMGenreRepository
+from src.django_project.shared.views.prefetch import submit_prefetch
 
 
 @pytest.mark.django_db
@@ -30,12 +41,14 @@ class TestListCategoryAPI:
                 "name": movie_category_model.name,
                 "description": movie_category_model.description,
                 "is_active": movie_category_model.is_active,
+                "genre_count": movie_category_model.genre_count,
             },
             {
                 "id": str(serie_category_model.id),
                 "name": serie_category_model.name,
                 "description": serie_category_model.description,
                 "is_active": serie_category_model.is_active,
+                "genre_count": serie_category_model.genre_count,
             },
         ]
 
@@ -57,6 +70,8 @@ class TestListCategoryAPI:
                 "page": 1,
                 "total": 2,
                 "per_page": core_settings.REPOSITORY["page_size"],
+                "next_cursor": None,
+                "prev_cursor": None,
             },
         }
 
@@ -86,12 +101,14 @@ class TestListCategoryAPI:
                         "name": serie_category_model.name,
                         "description": serie_category_model.description,
                         "is_active": serie_category_model.is_active,
+                        "genre_count": serie_category_model.genre_count,
                     },
                     {
                         "id": str(music_clip_category_model.id),
                         "name": music_clip_category_model.name,
                         "description": music_clip_category_model.description,
                         "is_active": music_clip_category_model.is_active,
+                        "genre_count": music_clip_category_model.genre_count,
                     },
             ],
             2: [
@@ -100,12 +117,14 @@ class TestListCategoryAPI:
                         "name": movie_category_model.name,
                         "description": movie_category_model.description,
                         "is_active": movie_category_model.is_active,
+                        "genre_count": movie_category_model.genre_count,
                     },
                     {
                         "id": str(lecture_category_model.id),
                         "name": lecture_category_model.name,
                         "description": lecture_category_model.description,
                         "is_active": lecture_category_model.is_active,
+                        "genre_count": lecture_category_model.genre_count,
                     },
             ],
             3: [
@@ -114,6 +133,7 @@ class TestListCategoryAPI:
                         "name": documentary_category_model.name,
                         "description": documentary_category_model.description,
                         "is_active": documentary_category_model.is_active,
+                        "genre_count": documentary_category_model.genre_count,
                     },
             ],
         }
@@ -131,6 +151,25 @@ class TestListCategoryAPI:
                 "page": page,
                 "total": 5,
                 "per_page": overriden_page_size,
+                "next_cursor": (
+                    Cursor(
+                        order_by="-description",
+                        value=expected_categories_per_page[page][-1]["description"],
+                        id=UUID(expected_categories_per_page[page][-1]["id"]),
+                    ).encode()
+                    if page < 3
+                    else None
+                ),
+                "prev_cursor": (
+                    Cursor(
+                        order_by="-description",
+                        value=expected_categories_per_page[page][0]["description"],
+                        id=UUID(expected_categories_per_page[page][0]["id"]),
+                        backward=True,
+                    ).encode()
+                    if page > 1
+                    else None
+                ),
             },
         }
 
@@ -144,6 +183,268 @@ class TestListCategoryAPI:
         assert response.status_code == status.HTTP_200_OK
         assert response.data == expected_data
 
+    def test_list_categories_with_cursor(
+        self,
+        movie_category_model: Category,
+        serie_category_model: Category,
+        documentary_category_model: Category,
+    ):
+        url = "/api/categories/"
+        with patch.dict(
+            core_settings.REPOSITORY,
+            {"page_size": 2},
+        ):
+            first_response = APIClient().get(url, {"order_by": "name"})
+            second_response = APIClient().get(
+                url,
+                {"cursor": first_response.data["meta"]["next_cursor"]},
+            )
+
+        assert second_response.status_code == status.HTTP_200_OK
+        assert second_response.data["data"] == [
+            {
+                "id": str(serie_category_model.id),
+                "name": serie_category_model.name,
+                "description": serie_category_model.description,
+                "is_active": serie_category_model.is_active,
+                "genre_count": serie_category_model.genre_count,
+            },
+        ]
+        assert second_response.data["meta"]["page"] is None
+        assert second_response.data["meta"]["total"] == 3
+        assert second_response.data["meta"]["next_cursor"] is None
+        assert second_response.data["meta"]["prev_cursor"] is not None
+
+    def test_list_categories_with_invalid_cursor(self):
+        url = "/api/categories/"
+        response = APIClient().get(url, {"cursor": "potato"})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data == {"error": "Provided cursor 'potato' is not valid"}
+
+    def test_list_categories_with_malformed_cursor_payload(self):
+        token = urlsafe_b64encode(
+            json.dumps(["name", "x", 123, False]).encode()
+        ).decode().rstrip("=")
+
+        response = APIClient().get("/api/categories/", {"cursor": token})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data == {"error": f"Provided cursor '{token}' is not valid"}
+
+    def test_list_categories_with_cursor_missing_order_by_values(self):
+        token = Cursor(
+            order_by="name,description", value="x", id=uuid4()
+        ).encode()
+
+        response = APIClient().get(
+            "/api/categories/",
+            {"cursor": token, "order_by": "name,description"},
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data == {"error": f"Provided cursor '{token}' is not valid"}
+
+    def test_list_categories_with_per_page(
+        self,
+        movie_category_model: Category,
+        serie_category_model: Category,
+        documentary_category_model: Category,
+    ):
+        url = "/api/categories/"
+        response = APIClient().get(url, {"order_by": "name", "per_page": 1})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [category["id"] for category in response.data["data"]] == [
+            str(documentary_category_model.id),
+        ]
+        assert response.data["meta"]["per_page"] == 1
+        assert response.data["meta"]["total"] == 3
+
+    def test_list_categories_with_per_page_above_maximum(self):
+        url = "/api/categories/"
+        response = APIClient().get(url, {"per_page": 1_001})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_list_categories_with_composite_order_by(
+        self,
+        movie_category_model: Category,
+        serie_category_model: Category,
+    ):
+        url = "/api/categories/"
+        response = APIClient().get(url, {"order_by": "-name,id"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [category["id"] for category in response.data["data"]] == [
+            str(serie_category_model.id),
+            str(movie_category_model.id),
+        ]
+
+    def test_list_categories_ordered_by_genre_count(
+        self,
+        movie_category_model: Category,
+        serie_category_model: Category,
+    ):
+        DjangoORMGenreRepository().save(
+            Genre(name="Drama", categories=[serie_category_model.id]),
+        )
+
+        url = "/api/categories/"
+        response = APIClient().get(url, {"order_by": "-genre_count"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [
+            (category["id"], category["genre_count"])
+            for category in response.data["data"]
+        ] == [
+            (str(serie_category_model.id), 1),
+            (str(movie_category_model.id), 0),
+        ]
+
+    def test_list_categories_with_fields(
+        self,
+        movie_category_model: Category,
+        serie_category_model: Category,
+    ):
+        url = "/api/categories/"
+        response = APIClient().get(url, {"order_by": "name", "fields": "name"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["data"] == [
+            {"id": str(movie_category_model.id), "name": movie_category_model.name},
+            {"id": str(serie_category_model.id), "name": serie_category_model.name},
+        ]
+        assert response.data["meta"]["total"] == 2
+
+    def test_list_categories_with_invalid_fields(self):
+        url = "/api/categories/"
+        response = APIClient().get(url, {"fields": "potato"})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db
+class TestListPrefetchAPI:
+    @pytest.fixture(autouse=True)
+    def prefetch_next_page(self):
+        with patch.object(CategoryViewSet, "prefetch_next_page", True):
+            yield
+
+    @pytest.fixture
+    def run_prefetch_now(self, list_prefetch: MagicMock) -> MagicMock:
+        list_prefetch.side_effect = lambda function, *args: function(*args)
+        return list_prefetch
+
+    def test_schedules_next_page_after_responding(
+        self,
+        list_prefetch: MagicMock,
+        movie_category_model: Category,
+        serie_category_model: Category,
+    ):
+        url = "/api/categories/"
+        response = APIClient().get(url, {"order_by": "name", "per_page": 1})
+
+        assert response.status_code == status.HTTP_200_OK
+        list_prefetch.assert_called_once()
+        _, next_input_params = list_prefetch.call_args.args
+        assert next_input_params == {"order_by": "name", "per_page": "1", "page": 2}
+
+    def test_does_not_schedule_when_not_enabled(
+        self,
+        list_prefetch: MagicMock,
+        movie_category_model: Category,
+        serie_category_model: Category,
+    ):
+        with patch.object(CategoryViewSet, "prefetch_next_page", False):
+            APIClient().get("/api/categories/", {"order_by": "name", "per_page": 1})
+
+        list_prefetch.assert_not_called()
+
+    def test_does_not_schedule_after_last_page(
+        self,
+        list_prefetch: MagicMock,
+        movie_category_model: Category,
+    ):
+        APIClient().get("/api/categories/")
+
+        list_prefetch.assert_not_called()
+
+    def test_serves_prefetched_page_from_cache(
+        self,
+        run_prefetch_now: MagicMock,
+        movie_category_model: Category,
+        serie_category_model: Category,
+        django_assert_num_queries,
+    ):
+        url = "/api/categories/"
+        APIClient().get(url, {"order_by": "name", "per_page": 1})
+
+        with django_assert_num_queries(0):
+            response = APIClient().get(
+                url,
+                {"order_by": "name", "per_page": 1, "page": 2},
+            )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [category["id"] for category in response.data["data"]] == [
+            str(serie_category_model.id),
+        ]
+        assert response.data["meta"]["page"] == 2
+
+    def test_writes_invalidate_prefetched_pages(
+        self,
+        run_prefetch_now: MagicMock,
+        movie_category_model: Category,
+        serie_category_model: Category,
+        django_capture_on_commit_callbacks,
+    ):
+        url = "/api/categories/"
+        APIClient().get(url, {"order_by": "name", "per_page": 1})
+
+        with django_capture_on_commit_callbacks(execute=True):
+            APIClient().post(
+                url,
+                data={"name": "Anime", "description": "Anime category"},
+            )
+
+        response = APIClient().get(
+            url,
+            {"order_by": "name", "per_page": 1, "page": 2},
+        )
+
+        assert [category["id"] for category in response.data["data"]] == [
+            str(movie_category_model.id),
+        ]
+        assert response.data["meta"]["total"] == 3
+
+    @pytest.mark.django_db(transaction=True)
+    def test_prefetches_on_executor_thread(
+        self,
+        list_prefetch: MagicMock,
+        movie_category_model: Category,
+        serie_category_model: Category,
+        django_assert_num_queries,
+    ):
+        futures = []
+        list_prefetch.side_effect = (
+            lambda function, *args: futures.append(submit_prefetch(function, *args))
+        )
+
+        url = "/api/categories/"
+        APIClient().get(url, {"order_by": "name", "per_page": 1})
+        futures[0].result(timeout=10)
+
+        with django_assert_num_queries(0):
+            response = APIClient().get(
+                url,
+                {"order_by": "name", "per_page": 1, "page": 2},
+            )
+
+        assert [category["id"] for category in response.data["data"]] == [
+            str(serie_category_model.id),
+        ]
+
 
 @pytest.mark.django_db
 class TestRetrieveAPI:
@@ -163,6 +464,7 @@ class TestRetrieveAPI:
                 "name": movie_category_model.name,
                 "description": movie_category_model.description,
                 "is_active": movie_category_model.is_active,
+                "genre_count": movie_category_model.genre_count,
             }
         }
 
@@ -172,6 +474,21 @@ class TestRetrieveAPI:
         assert response.status_code == status.HTTP_200_OK
         assert response.data == expected_data
 
+    def test_get_category_with_fields(
+        self,
+        movie_category_model: Category,
+    ):
+        url = f"/api/categories/{movie_category_model.id}/"
+        response = APIClient().get(url, {"fields": "is_active"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {
+            "data": {
+                "id": str(movie_category_model.id),
+                "is_active": movie_category_model.is_active,
+            }
+        }
+
     def test_get_category_when_does_not_exists(self):
         does_not_exist_id = str(uuid4())
         url = f"/api/categories/{does_not_exist_id}/"
@@ -179,6 +496,16 @@ class TestRetrieveAPI:
 
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
+    def test_get_category_sets_version_etag(
+        self,
+        movie_category_model: Category,
+    ):
+        url = f"/api/categories/{movie_category_model.id}/"
+        response = APIClient().get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["ETag"] == '"1"'
+
 
 @pytest.mark.django_db
 class TestCreateAPI:
@@ -228,6 +555,187 @@ class TestCreateAPI:
         assert category_repository.count() == 1
 
 
+@pytest.mark.django_db
+class TestIdempotentCreateAPI:
+    post_data = {
+        "name": "New category",
+        "description": "New category description",
+    }
+
+    def test_retry_replays_response_without_creating_again(
+        self,
+        category_repository: DjangoORMCategoryRepository,
+    ):
+        client = APIClient()
+
+        response = client.post(
+            "/api/categories/",
+            data=self.post_data,
+            HTTP_IDEMPOTENCY_KEY="create-1",
+        )
+        retried_response = client.post(
+            "/api/categories/",
+            data=self.post_data,
+            HTTP_IDEMPOTENCY_KEY="create-1",
+        )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert retried_response.status_code == status.HTTP_201_CREATED
+        assert retried_response.data == response.data
+        assert category_repository.count() == 1
+
+    def test_key_reused_with_different_request_is_rejected(
+        self,
+        category_repository: DjangoORMCategoryRepository,
+    ):
+        client = APIClient()
+        client.post(
+            "/api/categories/",
+            data=self.post_data,
+            HTTP_IDEMPOTENCY_KEY="create-1",
+        )
+
+        response = client.post(
+            "/api/categories/",
+            data={**self.post_data, "name": "Other category"},
+            HTTP_IDEMPOTENCY_KEY="create-1",
+        )
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        assert category_repository.count() == 1
+
+    def test_failed_request_can_be_retried_with_same_key(
+        self,
+        category_repository: DjangoORMCategoryRepository,
+    ):
+        client = APIClient()
+
+        failed_response = client.post(
+            "/api/categories/",
+            data={"name": ""},
+            HTTP_IDEMPOTENCY_KEY="create-1",
+        )
+        response = client.post(
+            "/api/categories/",
+            data={"name": ""},
+            HTTP_IDEMPOTENCY_KEY="create-1",
+        )
+
+        assert failed_response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert not IdempotencyKey.objects.exists()
+
+    @pytest.mark.parametrize("key", ["", "k" * 256])
+    def test_invalid_idempotency_key_is_rejected(
+        self,
+        key: str,
+        category_repository: DjangoORMCategoryRepository,
+    ):
+        response = APIClient().post(
+            "/api/categories/",
+            data=self.post_data,
+            HTTP_IDEMPOTENCY_KEY=key,
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data == {
+            "error": "Idempotency-Key must be between 1 and 255 characters",
+        }
+        assert category_repository.count() == 0
+        assert not IdempotencyKey.objects.exists()
+
+
+@pytest.mark.django_db
+class TestBulkCreateAPI:
+    def test_creates_valid_items_and_reports_invalid_by_index(
+        self,
+        category_repository: DjangoORMCategoryRepository,
+    ):
+        response = APIClient().post(
+            path="/api/categories/bulk/",
+            data=[
+                {"name": "Movie", "description": "Movies"},
+                {"name": "", "description": "Blank"},
+                {"name": "Serie", "description": "Series", "is_active": False},
+                {"name": "a" * 256, "description": "Too long"},
+            ],
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert list(
+            CategoryModel.objects
+            .filter(id__in=response.data["ids"])
+            .order_by("name")
+            .values_list("name", flat=True)
+        ) == ["Movie", "Serie"]
+        assert [error["index"] for error in response.data["errors"]] == [1, 3]
+        assert response.data["errors"][0]["error"] == {
+            "name": ["This field may not be blank."],
+        }
+        assert category_repository.count() == 2
+
+    def test_rejects_more_items_than_allowed(
+        self,
+        category_repository: DjangoORMCategoryRepository,
+    ):
+        with patch.dict(core_settings.REPOSITORY, {"max_bulk_size": 1}):
+            response = APIClient().post(
+                path="/api/categories/bulk/",
+                data=[
+                    {"name": "Movie", "description": "Movies"},
+                    {"name": "Serie", "description": "Series"},
+                ],
+                format="json",
+            )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "error" in response.data
+        assert category_repository.count() == 0
+
+    def test_rejects_payload_that_is_not_a_list(self):
+        response = APIClient().post(
+            path="/api/categories/bulk/",
+            data={"name": "Movie"},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db
+class TestBulkDeleteAPI:
+    def test_deletes_ids_from_query_and_reports_missing(
+        self,
+        movie_category_model: CategoryModel,
+        serie_category_model: CategoryModel,
+        documentary_category_model: CategoryModel,
+        category_repository: DjangoORMCategoryRepository,
+    ):
+        genre = Genre(name="Drama", categories=[movie_category_model.id])
+        DjangoORMGenreRepository().save(genre=genre)
+        missing_id = uuid4()
+        ids = [movie_category_model.id, missing_id, serie_category_model.id]
+
+        response = APIClient().delete(
+            "/api/categories/bulk/?ids=" + ",".join(str(id) for id in ids),
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {"missing_ids": [str(missing_id)]}
+        assert list(CategoryModel.objects.values_list("id", flat=True)) == [
+            documentary_category_model.id,
+        ]
+        assert category_repository.count() == 1
+        assert GenreListItem.objects.get(id=genre.id).categories == []
+
+    def test_requires_ids(self):
+        response = APIClient().delete("/api/categories/bulk/")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data == {"ids": ["This field is required."]}
+
+
 @pytest.mark.django_db
 class TestUpdateAPI:
     def test_update_category_invalid_payload_error(
@@ -266,20 +774,47 @@ class TestUpdateAPI:
             "id": ["Must be a valid UUID."],
         }
 
-    def test_update_category_non_existing_category_error(
+    def test_update_non_existing_category_creates_it(
         self,
-        movie_category_model: Category,
+        category_repository: DjangoORMCategoryRepository,
     ):
+        category_id = uuid4()
         post_data = {
-            "name": movie_category_model.name,
-            "description": movie_category_model.description,
-            "is_active": not movie_category_model.is_active,
+            "name": "Documentary",
+            "description": "Documentary category",
+            "is_active": False,
         }
 
-        url = f"/api/categories/{str(uuid4())}/"
+        url = f"/api/categories/{str(category_id)}/"
         response = APIClient().put(url, data=post_data)
 
-        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data["id"] == str(category_id)
+        created_category = category_repository.get_by_id(id=category_id)
+
+        assert created_category is not None
+        assert created_category.name == post_data["name"]
+        assert created_category.description == post_data["description"]
+        assert created_category.is_active is False
+        assert category_repository.count(mode=TotalMode.MAINTAINED) == 1
+
+    def test_update_is_idempotent(
+        self,
+        category_repository: DjangoORMCategoryRepository,
+    ):
+        post_data = {
+            "name": "Documentary",
+            "description": "Documentary category",
+            "is_active": True,
+        }
+
+        url = f"/api/categories/{str(uuid4())}/"
+        first_response = APIClient().put(url, data=post_data)
+        second_response = APIClient().put(url, data=post_data)
+
+        assert first_response.status_code == status.HTTP_201_CREATED
+        assert second_response.status_code == status.HTTP_204_NO_CONTENT
+        assert category_repository.count(mode=TotalMode.MAINTAINED) == 1
 
     def test_update_category_valid_payload_success(
         self,
@@ -309,6 +844,67 @@ class TestUpdateAPI:
         assert updated_category_movie.description == post_data["description"]
         assert updated_category_movie.is_active == post_data["is_active"]
 
+    def test_update_with_matching_if_match_bumps_version(
+        self,
+        movie_category_model: Category,
+        category_repository: DjangoORMCategoryRepository,
+    ):
+        post_data = {
+            "name": "Film",
+            "description": "Film category",
+            "is_active": True,
+        }
+
+        url = f"/api/categories/{str(movie_category_model.id)}/"
+        response = APIClient().put(url, data=post_data, HTTP_IF_MATCH='"1"')
+
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        assert response["ETag"] == '"2"'
+
+        updated_category_movie = category_repository.get_by_id(
+            id=movie_category_model.id,
+        )
+        assert updated_category_movie is not None
+        assert updated_category_movie.name == post_data["name"]
+        assert updated_category_movie.version == 2
+
+    def test_update_with_stale_if_match_conflicts(
+        self,
+        movie_category_model: Category,
+        category_repository: DjangoORMCategoryRepository,
+    ):
+        post_data = {
+            "name": "Film",
+            "description": "Film category",
+            "is_active": True,
+        }
+
+        url = f"/api/categories/{str(movie_category_model.id)}/"
+        response = APIClient().put(url, data=post_data, HTTP_IF_MATCH='"2"')
+
+        assert response.status_code == status.HTTP_409_CONFLICT
+
+        category = category_repository.get_by_id(id=movie_category_model.id)
+        assert category is not None
+        assert category.name == movie_category_model.name
+        assert category.version == 1
+
+    def test_update_with_if_match_on_missing_category_conflicts(
+        self,
+        category_repository: DjangoORMCategoryRepository,
+    ):
+        post_data = {
+            "name": "Film",
+            "description": "Film category",
+            "is_active": True,
+        }
+
+        url = f"/api/categories/{str(uuid4())}/"
+        response = APIClient().put(url, data=post_data, HTTP_IF_MATCH='"1"')
+
+        assert response.status_code == status.HTTP_409_CONFLICT
+        assert category_repository.count() == 0
+
 
 @pytest.mark.django_db
 class TestPartialUpdateAPI:
@@ -436,6 +1032,45 @@ class TestPartialUpdateAPI:
         assert updated_category_movie.description == movie_category_model.description
         assert updated_category_movie.is_active == post_data["is_active"]
 
+    def test_partial_update_with_stale_if_match_conflicts(
+        self,
+        movie_category_model: Category,
+        category_repository: DjangoORMCategoryRepository,
+    ):
+        url = f"/api/categories/{str(movie_category_model.id)}/"
+        first_response = APIClient().patch(
+            url,
+            data={"name": "Film"},
+            HTTP_IF_MATCH='W/"1"',
+        )
+        second_response = APIClient().patch(
+            url,
+            data={"name": "Movies"},
+            HTTP_IF_MATCH='W/"1"',
+        )
+
+        assert first_response.status_code == status.HTTP_204_NO_CONTENT
+        assert first_response["ETag"] == '"2"'
+        assert second_response.status_code == status.HTTP_409_CONFLICT
+
+        category = category_repository.get_by_id(id=movie_category_model.id)
+        assert category is not None
+        assert category.name == "Film"
+
+    def test_partial_update_with_invalid_if_match_error(
+        self,
+        movie_category_model: Category,
+    ):
+        url = f"/api/categories/{str(movie_category_model.id)}/"
+        response = APIClient().patch(
+            url,
+            data={"name": "Film"},
+            HTTP_IF_MATCH="latest",
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "If-Match" in response.data
+
 
 @pytest.mark.django_db
 class TestDeleteCategory:
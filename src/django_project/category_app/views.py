@@ -1,8 +1,20 @@
+from typing import Any
+from uuid import UUID
+
 from django.http import QueryDict
 from rest_framework import status, viewsets
+from rest_framework.decorators import action
 from rest_framework.request import Request
 from rest_framework.response import Response
 
+from src.core.category.application.bulk_create_categories import (
+    BulkCreateCategories,
+    BulkCreateCategoriesInput,
+)
+from src.core.category.application.bulk_delete_categories import (
+    BulkDeleteCategories,
+    BulkDeleteCategoriesInput,
+)
 from src.core.category.application.create_category import (
     CreateCategory,
     CreateCategoryInput,
@@ -11,13 +23,28 @@ from src.core.category.application.delete_category import (
     DeleteCategory,
     DeleteCategoryInput,
 )
-from src.core.category.application.errors import CategoryNotFound, InvalidCategoryData
+from src.core.category.application.errors import (
+    CategoryNotFound,
+    CategoryVersionConflict,
+    InvalidCategoryData,
+)
 from src.core.category.application.get_category import GetCategory, GetCategoryInput
 from src.core.category.application.list_categories import ListCategories
 from src.core.category.application.update_category import (
     UpdateCategory,
     UpdateCategoryInput,
 )
+from src.core.category.application.upsert_category import (
+    UpsertCategory,
+    UpsertCategoryInput,
+)
+from src.core.genre.application.expand_categories import EXPANDABLE_GENRE_FIELDS
+from src.core.genre.application.list_genres_by_category import ListGenresByCategory
+from src.core.shared.application.bulk import BulkCreateOutput, BulkDeleteOutput
+from src.core.shared.application.errors import InvalidFieldsRequested
+from src.core.shared.application.expand import get_validated_expand
+from src.core.shared.application.fields import parse_fields
+from src.django_project.category_app.models import Category as CategoryModel
 from src.django_project.category_app.repository import DjangoORMCategoryRepository
 from src.django_project.category_app.serializers import (
     CreateCategoryRequestSerializer,
@@ -29,35 +56,75 @@ from src.django_project.category_app.serializers import (
     UpdateCategoryRequestSerializer,
     UpdateCategoryResponseSerializer,
 )
+from src.django_project.genre_app.repository import DjangoORMGenreRepository
+from src.django_project.genre_app.serializers import ListGenreResponseSerializers
+from src.django_project.genre_app.views import get_genre_serializer_context
+from src.django_project.shared.repository.unit_of_work import DjangoUnitOfWork
 from src.django_project.shared.views import mixins
 
 
-class CategoryViewSet(viewsets.ViewSet, mixins.OrderedPaginatedListMixin):
+class CategoryViewSet(
+    viewsets.ViewSet,
+    mixins.OrderedPaginatedListMixin,
+    mixins.BulkMixin,
+    mixins.IdempotentCreateMixin,
+    mixins.ConditionalUpdateMixin,
+):
     repository_class = DjangoORMCategoryRepository
 
     list_use_case_class = ListCategories
     serializer_class = ListCategoryResponseSerializer
 
+    list_cache_model = CategoryModel
+
+    bulk_item_serializer_class = CreateCategoryRequestSerializer
+
+    def execute_bulk_create(self, items: list[dict[str, Any]]) -> BulkCreateOutput:
+        input = BulkCreateCategoriesInput(
+            items=[CreateCategoryInput(**item) for item in items],
+        )
+        use_case = BulkCreateCategories(unit_of_work=DjangoUnitOfWork())
+        return use_case.execute(input=input)
+
+    def execute_bulk_delete(self, ids: list[UUID]) -> BulkDeleteOutput:
+        input = BulkDeleteCategoriesInput(ids=ids)
+        use_case = BulkDeleteCategories(repository=DjangoORMCategoryRepository())
+        return use_case.execute(input=input)
+
     def retrieve(self, request: Request, pk=None) -> Response:
         serializer_input = RetrieveCategoryRequestSerializer(data={"id": pk})
         serializer_input.is_valid(raise_exception=True)
 
-        input = GetCategoryInput(id=serializer_input.validated_data["id"])
+        fields = request.query_params.get(self.fields_query_param, None)
+
+        input = GetCategoryInput(
+            id=serializer_input.validated_data["id"],
+            fields=fields,
+        )
         use_case = GetCategory(repository=DjangoORMCategoryRepository())
 
         try:
             output = use_case.execute(input=input)
         except CategoryNotFound:
             return Response(status=status.HTTP_404_NOT_FOUND)
+        except InvalidFieldsRequested as exc:
+            return Response(
+                status=status.HTTP_400_BAD_REQUEST,
+                data={"error": str(exc)},
+            )
 
-        serialized_output = RetrieveCategoryResponseSerializer(instance=output)
+        serialized_output = RetrieveCategoryResponseSerializer(
+            instance=output,
+            context={"fields": parse_fields(fields)},
+        )
 
         return Response(
             status=status.HTTP_200_OK,
             data=serialized_output.data,
+            headers=self.get_etag_headers(getattr(output, "version", None)),
         )
 
-    def create(self, request: Request) -> Response:
+    def execute_create(self, request: Request) -> Response:
         serializer_input = CreateCategoryRequestSerializer(data=request.data)
         serializer_input.is_valid(raise_exception=True)
 
@@ -92,19 +159,35 @@ class CategoryViewSet(viewsets.ViewSet, mixins.OrderedPaginatedListMixin):
         )
         serializer_input.is_valid(raise_exception=True)
 
-        input = UpdateCategoryInput(**serializer_input.validated_data)
-        use_case = UpdateCategory(repository=DjangoORMCategoryRepository())
+        input = UpsertCategoryInput(
+            **serializer_input.validated_data,
+            version=self.get_if_match_version(request),
+        )
+        use_case = UpsertCategory(
+            repository=DjangoORMCategoryRepository(),
+            unit_of_work=DjangoUnitOfWork(),
+        )
 
         try:
             output = use_case.execute(input=input)
-        except CategoryNotFound:
-            return Response(status=status.HTTP_404_NOT_FOUND)
+        except InvalidCategoryData as exc:
+            return Response(
+                status=status.HTTP_400_BAD_REQUEST,
+                data={"error": str(exc)},
+            )
+        except CategoryVersionConflict:
+            return Response(status=status.HTTP_409_CONFLICT)
 
         serialized_output = UpdateCategoryResponseSerializer(instance=output)
 
         return Response(
-            status=status.HTTP_204_NO_CONTENT,
+            status=(
+                status.HTTP_201_CREATED
+                if output.created
+                else status.HTTP_204_NO_CONTENT
+            ),
             data=serialized_output.data,
+            headers=self.get_etag_headers(output.version),
         )
 
     def partial_update(self, request: Request, pk=None) -> Response:
@@ -124,19 +207,25 @@ class CategoryViewSet(viewsets.ViewSet, mixins.OrderedPaginatedListMixin):
         )
         serializer_input.is_valid(raise_exception=True)
 
-        input = UpdateCategoryInput(**serializer_input.validated_data)
+        input = UpdateCategoryInput(
+            **serializer_input.validated_data,
+            version=self.get_if_match_version(request),
+        )
         use_case = UpdateCategory(repository=DjangoORMCategoryRepository())
 
         try:
             output = use_case.execute(input=input)
         except CategoryNotFound:
             return Response(status=status.HTTP_404_NOT_FOUND)
+        except CategoryVersionConflict:
+            return Response(status=status.HTTP_409_CONFLICT)
 
         serialized_output = UpdateCategoryResponseSerializer(instance=output)
 
         return Response(
             status=status.HTTP_204_NO_CONTENT,
             data=serialized_output.data,
+            headers=self.get_etag_headers(output.version),
         )
 
     def destroy(self, request: Request, pk=None) -> Response:
@@ -152,3 +241,43 @@ class CategoryViewSet(viewsets.ViewSet, mixins.OrderedPaginatedListMixin):
             return Response(status=status.HTTP_404_NOT_FOUND)
 
         return Response(status=status.HTTP_204_NO_CONTENT)
+
+    @action(detail=True, methods=["get"])
+    def genres(self, request: Request, pk=None) -> Response:
+        serializer_input = RetrieveCategoryRequestSerializer(data={"id": pk})
+        serializer_input.is_valid(raise_exception=True)
+
+        input_params = self.get_input_params_dict(request=request)
+        expand = input_params.pop("expand", None)
+
+        input = ListGenresByCategory.Input(**input_params)
+        use_case = ListGenresByCategory(
+            repository=DjangoORMGenreRepository(),
+            category_repository=DjangoORMCategoryRepository(),
+            category_id=serializer_input.validated_data["id"],
+        )
+
+        try:
+            get_validated_expand(expand=expand, valid_expand=EXPANDABLE_GENRE_FIELDS)
+            output = use_case.execute(input=input)
+        except CategoryNotFound:
+            return Response(status=status.HTTP_404_NOT_FOUND)
+        except mixins.LIST_INPUT_ERRORS as exc:
+            return Response(
+                status=status.HTTP_400_BAD_REQUEST,
+                data={"error": str(exc)},
+            )
+
+        serialized_output = ListGenreResponseSerializers(
+            instance=output,
+            context=get_genre_serializer_context(
+                fields=input_params.get("fields"),
+                expand=expand,
+                genres=output.data,
+            ),
+        )
+
+        return Response(
+            status=status.HTTP_200_OK,
+            data=serialized_output.data,
+        )
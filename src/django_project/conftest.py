@@ -0,0 +1,12 @@
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache
+
+
+@pytest.fixture(autouse=True)
+def list_prefetch():
+    cache.clear()
+    with patch("src.django_project.shared.views.mixins.submit_prefetch") as submit:
+        yield submit
+    cache.clear()
@@ -0,0 +1,10 @@
+from django.contrib import admin
+
+from src.django_project.counter_app.models import RowCounter
+
+
+class RowCounterAdmin(admin.ModelAdmin):
+    pass
+
+
+admin.site.register(RowCounter, RowCounterAdmin)
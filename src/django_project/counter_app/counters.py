@@ -0,0 +1,66 @@
+from django.db import connection
+from django.db.models import F, Model
+
+from src.django_project.counter_app.models import RowCounter
+
+
+def increment_row_count(model: type[Model], delta: int = 1) -> None:
+    table = model._meta.db_table
+
+    updated = (
+        RowCounter.objects
+        .filter(table=table)
+        .update(count=F("count") + delta)
+    )
+
+    if not updated:
+        RowCounter.objects.create(
+            table=table,
+            count=model._default_manager.count(),
+        )
+
+
+def get_row_count(model: type[Model]) -> int:
+    count = (
+        RowCounter.objects
+        .filter(table=model._meta.db_table)
+        .values_list("count", flat=True)
+        .first()
+    )
+
+    if count is None:
+        return model._default_manager.count()
+
+    return count
+
+
+def get_estimated_row_count(model: type[Model]) -> int:
+    table = model._meta.db_table
+    estimated_count: int | None = None
+
+    with connection.cursor() as cursor:
+        if connection.vendor == "postgresql":
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                [table],
+            )
+            row = cursor.fetchone()
+            if row is not None and row[0] >= 0:
+                estimated_count = row[0]
+        elif connection.vendor == "sqlite":
+            cursor.execute(
+                "SELECT name FROM sqlite_master WHERE name = 'sqlite_stat1'",
+            )
+            if cursor.fetchone() is not None:
+                cursor.execute(
+                    "SELECT stat FROM sqlite_stat1 WHERE tbl = %s LIMIT 1",
+                    [table],
+                )
+                row = cursor.fetchone()
+                if row is not None:
+                    estimated_count = int(row[0].split()[0])
+
+    if estimated_count is None:
+        return get_row_count(model)
+
+    return estimated_count
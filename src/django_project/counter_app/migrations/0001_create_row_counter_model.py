@@ -0,0 +1,25 @@
+# Generated by Django 5.0.2 on 2026-10-18 11:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RowCounter',
+            fields=[
+                ('table', models.CharField(max_length=255, primary_key=True, serialize=False)),
+                ('count', models.BigIntegerField(default=0)),
+            ],
+            options={
+                'verbose_name_plural': 'row_counters',
+                'db_table': 'row_counter',
+            },
+        ),
+    ]
@@ -0,0 +1,37 @@
+from django.db import migrations
+
+COUNTED_MODELS = [
+    ("category_app", "Category"),
+    ("genre_app", "Genre"),
+    ("cast_member_app", "CastMember"),
+]
+
+
+def seed_row_counters(apps, schema_editor):
+    RowCounter = apps.get_model("counter_app", "RowCounter")
+
+    for app_label, model_name in COUNTED_MODELS:
+        model = apps.get_model(app_label, model_name)
+        RowCounter.objects.update_or_create(
+            table=model._meta.db_table,
+            defaults={"count": model.objects.count()},
+        )
+
+
+def delete_row_counters(apps, schema_editor):
+    RowCounter = apps.get_model("counter_app", "RowCounter")
+    RowCounter.objects.all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('counter_app', '0001_create_row_counter_model'),
+        ('category_app', '0001_create_category_model'),
+        ('genre_app', '0001_create_genre_model'),
+        ('cast_member_app', '0001_create_cast_member_model'),
+    ]
+
+    operations = [
+        migrations.RunPython(seed_row_counters, delete_row_counters),
+    ]
@@ -0,0 +1,14 @@
+from django.db import models
+
+
+class RowCounter(models.Model):
+    class Meta:
+        app_label = "counter_app"
+        db_table = "row_counter"
+        verbose_name_plural = "row_counters"
+
+    table = models.CharField(max_length=255, primary_key=True)
+    count = models.BigIntegerField(default=0)
+
+    def __str__(self) -> str:
+        return f"{self.table}: {self.count}"
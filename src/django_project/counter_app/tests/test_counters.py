@@ -0,0 +1,48 @@
+import pytest
+
+from src.django_project.category_app.models import Category as CategoryModel
+from src.django_project.counter_app.counters import (
+    get_estimated_row_count,
+    get_row_count,
+    increment_row_count,
+)
+from src.django_project.counter_app.models import RowCounter
+
+
+@pytest.mark.django_db
+class TestIncrementRowCount:
+    def test_increments_existing_counter(self):
+        increment_row_count(CategoryModel)
+        increment_row_count(CategoryModel, delta=2)
+
+        assert RowCounter.objects.get(table="category").count == 3
+
+    def test_creates_missing_counter_from_table_count(self):
+        RowCounter.objects.filter(table="category").delete()
+        CategoryModel.objects.create(name="Movie", description="Movie category")
+
+        increment_row_count(CategoryModel)
+
+        assert RowCounter.objects.get(table="category").count == 1
+
+
+@pytest.mark.django_db
+class TestGetRowCount:
+    def test_reads_counter(self):
+        RowCounter.objects.update_or_create(table="category", defaults={"count": 42})
+
+        assert get_row_count(CategoryModel) == 42
+
+    def test_falls_back_to_table_count_when_counter_is_missing(self):
+        RowCounter.objects.filter(table="category").delete()
+        CategoryModel.objects.create(name="Movie", description="Movie category")
+
+        assert get_row_count(CategoryModel) == 1
+
+
+@pytest.mark.django_db
+class TestGetEstimatedRowCount:
+    def test_falls_back_to_counter_without_table_statistics(self):
+        RowCounter.objects.update_or_create(table="category", defaults={"count": 7})
+
+        assert get_estimated_row_count(CategoryModel) == 7
@@ -0,0 +1,42 @@
+# Generated by Django 5.0.2 on 2026-10-18 12:21
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('category_app', '0002_add_name_id_index'),
+        ('genre_app', '0002_add_name_id_index'),
+    ]
+
+    operations = [
+        # The auto-created "genre_categories" table already matches this model,
+        # so only the migration state changes.
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.CreateModel(
+                    name='GenreCategory',
+                    fields=[
+                        ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                        ('category', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='category_app.category')),
+                        ('genre', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='genre_app.genre')),
+                    ],
+                    options={
+                        'db_table': 'genre_categories',
+                        'unique_together': {('genre', 'category')},
+                    },
+                ),
+                migrations.AlterField(
+                    model_name='genre',
+                    name='categories',
+                    field=models.ManyToManyField(related_name='genres', through='genre_app.GenreCategory', to='category_app.category'),
+                ),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='genrecategory',
+            index=models.Index(fields=['category', 'genre'], name='genre_cat_category_genre_idx'),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.0.2 on 2026-10-18 12:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('genre_app', '0003_add_genre_category_through_model'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GenreListItem',
+            fields=[
+                ('id', models.UUIDField(primary_key=True, serialize=False)),
+                ('name', models.CharField(max_length=255)),
+                ('is_active', models.BooleanField(default=True)),
+                ('categories', models.JSONField(default=list)),
+            ],
+            options={
+                'db_table': 'genre_list',
+                'indexes': [models.Index(fields=['name', 'id'], name='genre_list_name_id_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,41 @@
+from collections import defaultdict
+
+from django.db import migrations
+
+
+def seed_genre_list(apps, schema_editor):
+    Genre = apps.get_model("genre_app", "Genre")
+    GenreCategory = apps.get_model("genre_app", "GenreCategory")
+    GenreListItem = apps.get_model("genre_app", "GenreListItem")
+
+    category_ids_by_genre_id = defaultdict(list)
+    links = GenreCategory.objects.order_by("id").values_list(
+        "genre_id",
+        "category_id",
+    )
+    for genre_id, category_id in links.iterator():
+        category_ids_by_genre_id[genre_id].append(str(category_id))
+
+    GenreListItem.objects.bulk_create(
+        (
+            GenreListItem(
+                id=genre.id,
+                name=genre.name,
+                is_active=genre.is_active,
+                categories=category_ids_by_genre_id[genre.id],
+            )
+            for genre in Genre.objects.iterator()
+        ),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('genre_app', '0004_create_genre_list_model'),
+    ]
+
+    operations = [
+        migrations.RunPython(seed_genre_list, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.0.2 on 2026-10-18 12:34
+
+from django.db import migrations, models
+
+
+def seed_categories_count(apps, schema_editor):
+    GenreListItem = apps.get_model("genre_app", "GenreListItem")
+
+    items = []
+    for item in GenreListItem.objects.only("id", "categories").iterator():
+        item.categories_count = len(item.categories)
+        items.append(item)
+    GenreListItem.objects.bulk_update(items, ["categories_count"], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('genre_app', '0005_seed_genre_list'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='genrelistitem',
+            name='categories_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(seed_categories_count, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.2 on 2026-10-18 12:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('genre_app', '0006_add_genre_list_categories_count'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='genre',
+            name='version',
+            field=models.PositiveIntegerField(default=1),
+        ),
+    ]
@@ -8,14 +8,56 @@ class Genre(models.Model):
         app_label = "genre_app"
         db_table = "genre"
         verbose_name_plural = "genres"
+        indexes = [
+            models.Index(fields=["name", "id"], name="genre_name_id_idx"),
+        ]
 
     id = models.UUIDField(primary_key=True, default=uuid4)
     name = models.CharField(max_length=255)
     is_active = models.BooleanField(default=True)
+    version = models.PositiveIntegerField(default=1)
     categories = models.ManyToManyField(
         to="category_app.Category",
         related_name="genres",
+        through="GenreCategory",
     )
 
     def __str__(self) -> str:
         return self.name
+
+
+class GenreCategory(models.Model):
+    class Meta:
+        app_label = "genre_app"
+        db_table = "genre_categories"
+        unique_together = [("genre", "category")]
+        indexes = [
+            models.Index(
+                fields=["category", "genre"],
+                name="genre_cat_category_genre_idx",
+            ),
+        ]
+
+    genre = models.ForeignKey(to=Genre, on_delete=models.CASCADE)
+    category = models.ForeignKey(
+        to="category_app.Category",
+        on_delete=models.CASCADE,
+    )
+
+
+class GenreListItem(models.Model):
+    class Meta:
+        app_label = "genre_app"
+        db_table = "genre_list"
+        indexes = [
+            models.Index(fields=["name", "id"], name="genre_list_name_id_idx"),
+        ]
+
+    id = models.UUIDField(primary_key=True)
+    name = models.CharField(max_length=255)
+    is_active = models.BooleanField(default=True)
+    categories = models.JSONField(default=list)
+    categories_count = models.PositiveIntegerField(default=0)
+
+    def __str__(self) -> str:
+        return self.name
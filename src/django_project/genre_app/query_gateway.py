@@ -0,0 +1,167 @@
+from collections.abc import Iterable
+from typing import Any
+from uuid import UUID
+
+from django.db.models.query import QuerySet
+
+from src.core.genre.gateway.genre_query_gateway import AbstractGenreQueryGateway
+from src.core.shared import settings as core_settings
+from src.core.shared.application.count import TotalMode
+from src.core.shared.application.cursor import Cursor
+from src.core.shared.application.errors import (
+    InvalidOrderByRequested,
+    InvalidPageRequested,
+)
+from src.core.shared.application.ordering import (
+    TIE_BREAKER_FIELD,
+    get_field_name,
+    get_ordering,
+    split_order_by,
+)
+from src.django_project.counter_app.counters import (
+    get_estimated_row_count,
+    get_row_count,
+)
+from src.django_project.genre_app.models import Genre as GenreModel
+from src.django_project.genre_app.models import GenreListItem
+from src.django_project.genre_app.repository import (
+    DEFAULT_GENRE_LIST_ORDER,
+    VALID_ORDER_BY_ATTRIBUTES,
+)
+from src.django_project.page_boundary_app.boundaries import get_page_boundary
+from src.django_project.shared.repository.pagination import (
+    get_keyset_page,
+    get_offset_page,
+)
+
+GENRE_LIST_FIELDS = ["id", "name", "is_active", "categories", "categories_count"]
+
+
+def decode_genre_list_rows(rows: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+    rows = list(rows)
+    for row in rows:
+        if "categories" in row:
+            row["categories"] = [UUID(category_id) for category_id in row["categories"]]
+    return rows
+
+
+class DjangoORMGenreQueryGateway(AbstractGenreQueryGateway):
+    def __init__(self, list_model: type[GenreListItem] = GenreListItem):
+        self.list_model = list_model
+        self._count: int | None = None
+
+    def get_queryset(self) -> QuerySet:
+        return self.list_model.objects.all()
+
+    def list_after(
+        self,
+        cursor: Cursor | None,
+        order_by: str,
+        limit: int,
+    ) -> list[dict[str, Any]]:
+        return self.list_values_after(
+            fields=GENRE_LIST_FIELDS,
+            cursor=cursor,
+            order_by=order_by,
+            limit=limit,
+        )
+
+    def list_values_after(
+        self,
+        fields: list[str],
+        cursor: Cursor | None,
+        order_by: str,
+        limit: int,
+    ) -> list[dict[str, Any]]:
+        self._validate_order_by(order_by)
+
+        rows = get_keyset_page(
+            queryset=self.get_queryset().values(*fields),
+            cursor=cursor,
+            order_by=order_by,
+            limit=limit,
+        )
+
+        return decode_genre_list_rows(rows)
+
+    def list_values(
+        self,
+        fields: list[str],
+        order_by: str | None = None,
+        page: int = 1,
+        page_size: int | None = None,
+        with_total: bool = False,
+    ) -> list[dict[str, Any]]:
+        if page < 1:
+            raise InvalidPageRequested(page=page)
+
+        if order_by is None:
+            order_by = DEFAULT_GENRE_LIST_ORDER
+
+        self._validate_order_by(order_by)
+
+        if page_size is None:
+            page_size = core_settings.REPOSITORY["page_size"]
+
+        start, start_position = get_page_boundary(
+            queryset=self.get_queryset(),
+            order_by=order_by,
+            offset=(page - 1) * page_size,
+        )
+
+        rows, total = get_offset_page(
+            queryset=self.get_queryset()
+            .values(*fields)
+            .order_by(*get_ordering(order_by)),
+            page=page,
+            page_size=page_size,
+            with_total=with_total,
+            start=start,
+            start_position=start_position,
+        )
+
+        if total is not None:
+            self._count = total
+
+        return decode_genre_list_rows(rows)
+
+    def list(
+        self,
+        order_by: str | None = None,
+        page: int = 1,
+        page_size: int | None = None,
+        with_total: bool = False,
+    ) -> list[dict[str, Any]]:
+        return self.list_values(
+            fields=GENRE_LIST_FIELDS,
+            order_by=order_by,
+            page=page,
+            page_size=page_size,
+            with_total=with_total,
+        )
+
+    def count(self, mode: TotalMode = TotalMode.EXACT) -> int:
+        # The read table mirrors the genre table row for row.
+        if mode == TotalMode.MAINTAINED:
+            return get_row_count(GenreModel)
+
+        if mode == TotalMode.ESTIMATED:
+            return get_estimated_row_count(GenreModel)
+
+        if self._count is None:
+            self._count = self.get_queryset().count()
+        return self._count
+
+    @staticmethod
+    def _validate_order_by(order_by: str) -> None:
+        keys = split_order_by(order_by)
+
+        if not keys or any(
+            key not in VALID_ORDER_BY_ATTRIBUTES
+            and get_field_name(key) != TIE_BREAKER_FIELD
+            for key in keys
+        ):
+            raise InvalidOrderByRequested(
+                order_by=order_by,
+                valid_order_by_attributes=VALID_ORDER_BY_ATTRIBUTES,
+            )
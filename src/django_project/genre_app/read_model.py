@@ -0,0 +1,111 @@
+from collections.abc import Collection, Iterable
+from typing import Any
+from uuid import UUID
+
+from src.core.genre.domain.genre import Genre
+from src.core.shared import settings as core_settings
+from src.django_project.genre_app.models import GenreListItem
+from src.django_project.page_boundary_app.boundaries import (
+    reset_page_boundaries,
+    truncate_page_boundaries,
+)
+
+
+def encode_category_ids(category_ids: Iterable[UUID]) -> list[str]:
+    return [str(category_id) for category_id in category_ids]
+
+
+def to_genre_list_item(genre: Genre) -> GenreListItem:
+    return GenreListItem(
+        id=genre.id,
+        name=genre.name,
+        is_active=genre.is_active,
+        categories=encode_category_ids(genre.categories),
+        categories_count=genre.categories_count,
+    )
+
+
+def create_genre_list_item(genre: Genre) -> None:
+    to_genre_list_item(genre).save(force_insert=True)
+    truncate_page_boundaries(GenreListItem, genre.id)
+
+
+def create_genre_list_items(genres: list[Genre]) -> None:
+    GenreListItem.objects.bulk_create(
+        [to_genre_list_item(genre) for genre in genres],
+        batch_size=core_settings.REPOSITORY["bulk_create_batch_size"],
+    )
+    reset_page_boundaries(GenreListItem)
+
+
+def upsert_genre_list_items(genres: list[Genre]) -> None:
+    if len(genres) == 1:
+        truncate_page_boundaries(GenreListItem, genres[0].id)
+    GenreListItem.objects.bulk_create(
+        [to_genre_list_item(genre) for genre in genres],
+        batch_size=core_settings.REPOSITORY["bulk_create_batch_size"],
+        update_conflicts=True,
+        unique_fields=["id"],
+        update_fields=["name", "is_active", "categories", "categories_count"],
+    )
+    if len(genres) == 1:
+        truncate_page_boundaries(GenreListItem, genres[0].id)
+    else:
+        reset_page_boundaries(GenreListItem)
+
+
+def update_genre_list_item(genre: Genre, fields: Collection[str]) -> None:
+    values: dict[str, Any] = {
+        field: getattr(genre, field) for field in fields if field != "categories"
+    }
+    if "categories" in fields:
+        values["categories"] = encode_category_ids(genre.categories)
+        values["categories_count"] = genre.categories_count
+    if not values:
+        return None
+
+    if "name" in values:
+        truncate_page_boundaries(GenreListItem, genre.id)
+    GenreListItem.objects.filter(id=genre.id).update(**values)
+    if "name" in values:
+        truncate_page_boundaries(GenreListItem, genre.id)
+
+
+def update_genre_list_items(genres: list[Genre]) -> None:
+    if len(genres) == 1:
+        truncate_page_boundaries(GenreListItem, genres[0].id)
+    GenreListItem.objects.bulk_update(
+        [to_genre_list_item(genre) for genre in genres],
+        ["name", "is_active", "categories", "categories_count"],
+        batch_size=core_settings.REPOSITORY["bulk_create_batch_size"],
+    )
+    if len(genres) == 1:
+        truncate_page_boundaries(GenreListItem, genres[0].id)
+    else:
+        reset_page_boundaries(GenreListItem)
+
+
+def delete_genre_list_item(genre_id: UUID) -> None:
+    truncate_page_boundaries(GenreListItem, genre_id)
+    GenreListItem.objects.filter(id=genre_id).delete()
+
+
+def delete_genre_list_items(genre_ids: set[UUID]) -> None:
+    GenreListItem.objects.filter(id__in=genre_ids).delete()
+    reset_page_boundaries(GenreListItem)
+
+
+def remove_categories_from_genre_list(
+    category_ids: Collection[UUID],
+    genre_ids: Iterable[UUID],
+) -> None:
+    encoded_category_ids = set(encode_category_ids(category_ids))
+    items = list(GenreListItem.objects.filter(id__in=genre_ids))
+    for item in items:
+        item.categories = [
+            item_category_id
+            for item_category_id in item.categories
+            if item_category_id not in encoded_category_ids
+        ]
+        item.categories_count = len(item.categories)
+    GenreListItem.objects.bulk_update(items, ["categories", "categories_count"])
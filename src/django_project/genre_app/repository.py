@@ -1,26 +1,77 @@
+from collections import Counter, defaultdict
+from collections.abc import Iterable
+from functools import partial
+from typing import Any
 from uuid import UUID
 
-from django.core.paginator import EmptyPage, Paginator
 from django.db import transaction
-from django.db.models import Prefetch
+from django.db.models import F, Q
 from django.db.models.query import QuerySet
 
 from src.core.genre.domain.genre import Genre
-from src.core.genre.gateway.genre_gateway import AbstractGenreRepository
+from src.core.genre.gateway.genre_gateway import (
+    AbstractGenreRepository,
+    GenreChanges,
+)
 from src.core.shared import settings as core_settings
+from src.core.shared.application.count import TotalMode
+from src.core.shared.application.cursor import Cursor
+from src.core.shared.application.ordering import (
+    TIE_BREAKER_FIELD,
+    get_field_name,
+    get_ordering,
+    is_descending,
+    split_order_by,
+)
 from src.core.shared.application.errors import (
     InvalidOrderByRequested,
     InvalidPageRequested,
 )
 from src.django_project.category_app.models import Category as CategoryModel
+from src.django_project.counter_app.counters import (
+    get_estimated_row_count,
+    get_row_count,
+    increment_row_count,
+)
 from src.django_project.genre_app.models import Genre as GenreModel
+from src.django_project.genre_app.read_model import (
+    create_genre_list_item,
+    create_genre_list_items,
+    delete_genre_list_item,
+    delete_genre_list_items,
+    update_genre_list_item,
+    update_genre_list_items,
+    upsert_genre_list_items,
+)
+from src.django_project.page_boundary_app.boundaries import (
+    clear_page_boundaries,
+    get_page_boundary,
+    truncate_page_boundaries,
+)
+from src.django_project.shared.repository.list_cache import (
+    invalidate_list_cache_on_commit,
+)
 from src.django_project.shared.repository.mapper import BaseORMMapper
+from src.django_project.shared.repository.pagination import (
+    get_keyset_page,
+    get_offset_page,
+)
+from src.django_project.shared.repository.upsert import upsert_versioned_entities
+from src.django_project.shared.repository.writes import (
+    delete_existing_rows,
+    delete_rows_in_chunks,
+    finish_rows_write,
+    start_rows_write,
+    update_versioned_rows,
+)
 
 DEFAULT_GENRE_LIST_ORDER = "name"
 VALID_ORDER_BY_ATTRIBUTES = [
     "name",
     "-name",
 ]
+CATEGORY_FIELDS = {"categories", "categories_count"}
+GENRE_UPDATE_FIELDS = ["name", "is_active"]
 
 
 class GenreMapper(BaseORMMapper[Genre, GenreModel]):
@@ -30,27 +81,33 @@ class GenreMapper(BaseORMMapper[Genre, GenreModel]):
                 id=entity.id,
                 name=entity.name,
                 is_active=entity.is_active,
+                version=entity.version,
             )
         if save:
             instance.save()
         return instance
 
     @staticmethod
-    def to_entity(model: GenreModel) -> Genre:
+    def to_entity(model: GenreModel, category_ids: Iterable[UUID] = ()) -> Genre:
         return Genre(
             id=model.id,
             name=model.name,
             is_active=model.is_active,
-            categories=[
-                category.id
-                for category in model.ordered_categories
-            ]
+            categories=list(category_ids),
+            version=model.version,
         )
 
 
 class DjangoORMGenreRepository(AbstractGenreRepository):
-    def __init__(self, genre_model: type[GenreModel] = GenreModel):
+    def __init__(
+        self,
+        genre_model: type[GenreModel] = GenreModel,
+        category_order_by: str | None = None,
+    ):
         self.genre_model = genre_model
+        self.category_order_by = category_order_by
+        self._count: int | None = None
+        self._count_by_category: dict[UUID, int] = {}
 
     def get_queryset(self) -> QuerySet:
         queryset = self.genre_model.objects.all()
@@ -58,96 +115,631 @@ class DjangoORMGenreRepository(AbstractGenreRepository):
 
     def save(self, genre: Genre) -> None:
         with transaction.atomic():
-            genre_model = GenreMapper.to_model(genre, save=True)
-            genre_model.categories.set(genre.categories)
+            GenreMapper.to_model(genre, save=True)
+            self._add_category_links(genre.id, genre.categories)
+            create_genre_list_item(genre)
+            increment_row_count(self.genre_model)
+            truncate_page_boundaries(self.genre_model, genre.id)
+            invalidate_list_cache_on_commit(self.genre_model)
+        self._count = None
 
-    def get_by_id(self, id: UUID) -> Genre | None:
-        try:
-            genre_model = (
-                self.genre_model.objects
-                .filter(id=id)
-                .prefetch_related(
-                    self._get_categories_prefetch(to_attr="ordered_categories")
-                )
-                .get()
+    def save_many(self, genres: list[Genre]) -> None:
+        if not genres:
+            return None
+
+        batch_size = core_settings.REPOSITORY["bulk_create_batch_size"]
+        through_model = self.genre_model.categories.through
+
+        with transaction.atomic():
+            self.genre_model.objects.bulk_create(
+                [GenreMapper.to_model(genre) for genre in genres],
+                batch_size=batch_size,
             )
-        except self.genre_model.DoesNotExist:
+            through_model.objects.bulk_create(
+                [
+                    through_model(genre_id=genre.id, category_id=category_id)
+                    for genre in genres
+                    for category_id in genre.categories
+                ],
+                batch_size=batch_size,
+            )
+            self._update_genre_counts(
+                Counter(
+                    category_id
+                    for genre in genres
+                    for category_id in genre.categories
+                ),
+            )
+            create_genre_list_items(genres)
+            finish_rows_write(
+                self.genre_model,
+                [genre.id for genre in genres],
+                row_delta=len(genres),
+            )
+        self._count = None
+
+    def update_many(self, genres: list[Genre]) -> set[UUID]:
+        if not genres:
+            return set()
+
+        ids = [genre.id for genre in genres]
+        with transaction.atomic():
+            start_rows_write(self.genre_model, ids)
+            conflicted_ids = update_versioned_rows(
+                self.genre_model,
+                genres,
+                update_fields=GENRE_UPDATE_FIELDS,
+            )
+            updated_genres = [
+                genre for genre in genres if genre.id not in conflicted_ids
+            ]
+            if updated_genres:
+                self._replace_category_links(updated_genres)
+                update_genre_list_items(updated_genres)
+                finish_rows_write(self.genre_model, ids)
+        return conflicted_ids
+
+    def delete_many(self, ids: set[UUID]) -> set[UUID]:
+        missing_ids = delete_rows_in_chunks(
+            ids,
+            partial(
+                delete_existing_rows,
+                self.genre_model,
+                before_delete=self._delete_related_rows,
+            ),
+        )
+        self._count = None
+        return missing_ids
+
+    def _delete_related_rows(self, ids: set[UUID]) -> None:
+        links = self.genre_model.categories.through.objects.filter(
+            genre_id__in=ids,
+        )
+        self._update_genre_counts(
+            Counter({
+                category_id: -count
+                for category_id, count in Counter(
+                    links.values_list("category_id", flat=True)
+                ).items()
+            }),
+        )
+        links.delete()
+        delete_genre_list_items(ids)
+
+    def upsert(self, genre: Genre) -> bool:
+        return bool(self.upsert_many([genre]))
+
+    def upsert_many(self, genres: list[Genre]) -> set[UUID]:
+        if not genres:
+            return set()
+
+        ids = [genre.id for genre in genres]
+        with transaction.atomic():
+            start_rows_write(self.genre_model, ids)
+            created_ids = upsert_versioned_entities(
+                self.genre_model,
+                genres,
+                GenreMapper.to_model,
+                update_fields=GENRE_UPDATE_FIELDS,
+            )
+            self._replace_category_links(genres)
+            upsert_genre_list_items(genres)
+            finish_rows_write(self.genre_model, ids, row_delta=len(created_ids))
+        self._count = None
+        return created_ids
+
+    def _replace_category_links(self, genres: list[Genre]) -> None:
+        through_model = self.genre_model.categories.through
+        current_category_ids_by_genre_id = self._get_category_ids_by_genre_id(
+            [genre.id for genre in genres]
+        )
+        links_to_remove = Q()
+        links_to_add = []
+        deltas: Counter[UUID] = Counter()
+        for genre in genres:
+            current_category_ids = set(current_category_ids_by_genre_id[genre.id])
+            removed_category_ids = current_category_ids - set(genre.categories)
+            if removed_category_ids:
+                links_to_remove |= Q(
+                    genre_id=genre.id,
+                    category_id__in=removed_category_ids,
+                )
+                deltas.subtract(removed_category_ids)
+            for category_id in genre.categories:
+                if category_id not in current_category_ids:
+                    links_to_add.append(
+                        through_model(genre_id=genre.id, category_id=category_id)
+                    )
+                    deltas[category_id] += 1
+
+        if links_to_remove:
+            through_model.objects.filter(links_to_remove).delete()
+        through_model.objects.bulk_create(
+            links_to_add,
+            batch_size=core_settings.REPOSITORY["bulk_create_batch_size"],
+        )
+        self._update_genre_counts(deltas)
+
+    def get_by_id(self, id: UUID) -> Genre | None:
+        genre_model = self.genre_model.objects.filter(id=id).first()
+        if genre_model is None:
             return None
 
-        return GenreMapper.to_entity(genre_model)
+        return self._to_entities([genre_model])[0]
 
-    def list(
+    def get_missing_ids(self, ids: set[UUID]) -> set[UUID]:
+        if not ids:
+            return set()
+
+        existing_ids = (
+            self.get_queryset()
+            .filter(id__in=ids)
+            .values_list("id", flat=True)
+        )
+        return ids - set(existing_ids)
+
+    def get_values_by_id(
+        self,
+        id: UUID,
+        fields: list[str],
+        categories_limit: int | None = None,
+    ) -> dict[str, Any] | None:
+        values = self._get_values_queryset(fields).filter(id=id).first()
+        if values is None:
+            return None
+
+        links = self.genre_model.categories.through.objects.filter(genre_id=id)
+        if "categories" in fields:
+            category_ids = links.order_by(
+                *self._get_category_link_ordering()
+            ).values_list("category_id", flat=True)
+            values["categories"] = list(category_ids[:categories_limit])
+        if "categories_count" in fields:
+            if categories_limit is None and "categories" in fields:
+                values["categories_count"] = len(values["categories"])
+            else:
+                values["categories_count"] = links.count()
+
+        return values
+
+    def list_after(
         self,
+        cursor: Cursor | None,
+        order_by: str,
+        limit: int,
+    ) -> list[Genre]:
+        self._validate_order_by(order_by)
+
+        genres = get_keyset_page(
+            queryset=self.get_queryset(),
+            cursor=cursor,
+            order_by=order_by,
+            limit=limit,
+        )
+
+        return self._to_entities(list(genres))
+
+    def list_values_after(
+        self,
+        fields: list[str],
+        cursor: Cursor | None,
+        order_by: str,
+        limit: int,
+    ) -> list[dict[str, Any]]:
+        self._validate_order_by(order_by)
+
+        genres = list(
+            get_keyset_page(
+                queryset=self._get_values_queryset(fields),
+                cursor=cursor,
+                order_by=order_by,
+                limit=limit,
+            )
+        )
+
+        return self._add_category_ids(genres, fields)
+
+    def list_values(
+        self,
+        fields: list[str],
         order_by: str | None = None,
         page: int = 1,
-    ) -> list[Genre]:
+        page_size: int | None = None,
+        with_total: bool = False,
+    ) -> list[dict[str, Any]]:
+        genres = self._get_page_rows(
+            queryset=self._get_values_queryset(fields),
+            order_by=order_by,
+            page=page,
+            page_size=page_size,
+            with_total=with_total,
+        )
+
+        return self._add_category_ids(genres, fields)
+
+    def _get_page_rows(
+        self,
+        queryset: QuerySet,
+        order_by: str | None,
+        page: int,
+        page_size: int | None,
+        with_total: bool,
+        category_id: UUID | None = None,
+    ) -> list[Any]:
         if page < 1:
             raise InvalidPageRequested(page=page)
 
         if order_by is None:
             order_by = DEFAULT_GENRE_LIST_ORDER
 
-        if order_by not in VALID_ORDER_BY_ATTRIBUTES:
-            raise InvalidOrderByRequested(
+        self._validate_order_by(order_by)
+
+        if page_size is None:
+            page_size = core_settings.REPOSITORY["page_size"]
+
+        if category_id is None:
+            start, start_position = get_page_boundary(
+                queryset=self.get_queryset(),
                 order_by=order_by,
-                valid_order_by_attributes=VALID_ORDER_BY_ATTRIBUTES,
+                offset=(page - 1) * page_size,
             )
+        else:
+            # Page boundaries are kept for the whole table only.
+            queryset = queryset.filter(categories=category_id)
+            start, start_position = None, 0
 
-        queryset = (
-            self.get_queryset()
-            .prefetch_related(
-                self._get_categories_prefetch(to_attr="ordered_categories")
-            )
-            .order_by(order_by)
+        rows, total = get_offset_page(
+            queryset=queryset.order_by(*get_ordering(order_by)),
+            page=page,
+            page_size=page_size,
+            with_total=with_total,
+            start=start,
+            start_position=start_position,
         )
 
-        paginator = Paginator(queryset, core_settings.REPOSITORY["page_size"])
+        if total is not None:
+            if category_id is None:
+                self._count = total
+            else:
+                self._count_by_category[category_id] = total
 
-        try:
-            paginator_page = paginator.page(page)
-        except EmptyPage:
-            raise InvalidPageRequested(
-                page=page,
-            )
+        return rows
+
+    def _get_values_queryset(self, fields: list[str]) -> QuerySet:
+        return self.get_queryset().values(
+            *[field for field in fields if field not in CATEGORY_FIELDS]
+        )
+
+    def _add_category_ids(
+        self,
+        genres: list[dict[str, Any]],
+        fields: list[str],
+    ) -> list[dict[str, Any]]:
+        if not CATEGORY_FIELDS.intersection(fields):
+            return genres
+
+        category_ids_by_genre_id = self._get_category_ids_by_genre_id(
+            [genre["id"] for genre in genres]
+        )
+
+        for genre in genres:
+            category_ids = category_ids_by_genre_id[genre["id"]]
+            if "categories" in fields:
+                genre["categories"] = category_ids
+            if "categories_count" in fields:
+                genre["categories_count"] = len(category_ids)
+
+        return genres
 
-        entities = paginator_page.object_list
-        self._count = paginator.count
+    def _to_entities(self, genre_models: list[GenreModel]) -> list[Genre]:
+        category_ids_by_genre_id = self._get_category_ids_by_genre_id(
+            [genre_model.id for genre_model in genre_models]
+        )
 
         return [
-            GenreMapper.to_entity(genre)
-            for genre in entities
+            GenreMapper.to_entity(
+                genre_model,
+                category_ids=category_ids_by_genre_id[genre_model.id],
+            )
+            for genre_model in genre_models
         ]
 
-    def count(
+    def _get_category_ids_by_genre_id(
+        self,
+        genre_ids: list[UUID],
+    ) -> defaultdict[UUID, list[UUID]]:
+        category_ids_by_genre_id: defaultdict[UUID, list[UUID]] = defaultdict(list)
+        if not genre_ids:
+            return category_ids_by_genre_id
+
+        links = (
+            self.genre_model.categories.through.objects
+            .filter(genre_id__in=genre_ids)
+            .order_by(*self._get_category_link_ordering())
+            .values_list("genre_id", "category_id")
+        )
+        for genre_id, category_id in links:
+            category_ids_by_genre_id[genre_id].append(category_id)
+
+        return category_ids_by_genre_id
+
+    def _get_category_link_ordering(self) -> list[str]:
+        if self.category_order_by is None:
+            return ["id"]
+
+        return [
+            f"-category__{get_field_name(key)}"
+            if is_descending(key)
+            else f"category__{key}"
+            for key in split_order_by(self.category_order_by)
+        ] + ["id"]
+
+    def _add_category_links(
+        self,
+        genre_id: UUID,
+        category_ids: Iterable[UUID],
+    ) -> None:
+        category_ids = list(category_ids)
+        through_model = self.genre_model.categories.through
+        through_model.objects.bulk_create([
+            through_model(genre_id=genre_id, category_id=category_id)
+            for category_id in category_ids
+        ])
+        self._update_genre_count(category_ids, delta=1)
+
+    def _remove_category_links(
+        self,
+        genre_id: UUID,
+        category_ids: Iterable[UUID] | None = None,
+    ) -> None:
+        links = self.genre_model.categories.through.objects.filter(genre_id=genre_id)
+        if category_ids is not None:
+            links = links.filter(category_id__in=category_ids)
+
+        self._update_genre_count(links.values("category_id"), delta=-1)
+        links.delete()
+
+    def _update_genre_counts(self, deltas: Counter[UUID]) -> None:
+        category_ids_by_delta: defaultdict[int, list[UUID]] = defaultdict(list)
+        for category_id, delta in deltas.items():
+            if delta:
+                category_ids_by_delta[delta].append(category_id)
+
+        for delta, category_ids in category_ids_by_delta.items():
+            self._update_genre_count(category_ids, delta=delta)
+
+    def _update_genre_count(self, category_ids: Any, delta: int) -> None:
+        updated = CategoryModel.objects.filter(id__in=category_ids).update(
+            genre_count=F("genre_count") + delta,
+        )
+        if updated:
+            clear_page_boundaries(CategoryModel, field_name="genre_count")
+            invalidate_list_cache_on_commit(CategoryModel)
+
+    def list_by_category_after(
+        self,
+        category_id: UUID,
+        cursor: Cursor | None,
+        order_by: str,
+        limit: int,
+    ) -> list[Genre]:
+        self._validate_order_by(order_by)
+
+        genres = get_keyset_page(
+            queryset=self.get_queryset().filter(categories=category_id),
+            cursor=cursor,
+            order_by=order_by,
+            limit=limit,
+        )
+
+        return self._to_entities(list(genres))
+
+    def list_by_category(
+        self,
+        category_id: UUID,
+        order_by: str | None = None,
+        page: int = 1,
+        page_size: int | None = None,
+        with_total: bool = False,
+    ) -> list[Genre]:
+        genres = self._get_page_rows(
+            queryset=self.get_queryset(),
+            order_by=order_by,
+            page=page,
+            page_size=page_size,
+            with_total=with_total,
+            category_id=category_id,
+        )
+
+        return self._to_entities(genres)
+
+    def list_values_by_category_after(
+        self,
+        category_id: UUID,
+        fields: list[str],
+        cursor: Cursor | None,
+        order_by: str,
+        limit: int,
+    ) -> list[dict[str, Any]]:
+        self._validate_order_by(order_by)
+
+        genres = list(
+            get_keyset_page(
+                queryset=self._get_values_queryset(fields).filter(
+                    categories=category_id
+                ),
+                cursor=cursor,
+                order_by=order_by,
+                limit=limit,
+            )
+        )
+
+        return self._add_category_ids(genres, fields)
+
+    def list_values_by_category(
         self,
-    ) -> int:
+        category_id: UUID,
+        fields: list[str],
+        order_by: str | None = None,
+        page: int = 1,
+        page_size: int | None = None,
+        with_total: bool = False,
+    ) -> list[dict[str, Any]]:
+        genres = self._get_page_rows(
+            queryset=self._get_values_queryset(fields),
+            order_by=order_by,
+            page=page,
+            page_size=page_size,
+            with_total=with_total,
+            category_id=category_id,
+        )
+
+        return self._add_category_ids(genres, fields)
+
+    def list(
+        self,
+        order_by: str | None = None,
+        page: int = 1,
+        page_size: int | None = None,
+        with_total: bool = False,
+    ) -> list[Genre]:
+        genres = self._get_page_rows(
+            queryset=self.get_queryset(),
+            order_by=order_by,
+            page=page,
+            page_size=page_size,
+            with_total=with_total,
+        )
+
+        return self._to_entities(genres)
+
+    def count(self, mode: TotalMode = TotalMode.EXACT) -> int:
+        if mode == TotalMode.MAINTAINED:
+            return get_row_count(self.genre_model)
+
+        if mode == TotalMode.ESTIMATED:
+            return get_estimated_row_count(self.genre_model)
+
         if self._count is None:
             self._count = self.get_queryset().count()
         return self._count
 
-    def delete(self, id: UUID) -> None:
-        self.genre_model.objects.filter(id=id).delete()
+    def count_by_category(self, category_id: UUID) -> int:
+        count = self._count_by_category.pop(category_id, None)
+        if count is None:
+            count = (
+                self.genre_model.categories.through.objects
+                .filter(category_id=category_id)
+                .count()
+            )
+        return count
 
-    def update(self, genre: Genre) -> None:
-        try:
-            genre_model = self.genre_model.objects.get(id=genre.id)
-        except self.genre_model.DoesNotExist:
-            return None
+    def delete(self, id: UUID) -> bool:
+        with transaction.atomic():
+            truncate_page_boundaries(self.genre_model, id)
+            invalidate_list_cache_on_commit(self.genre_model)
+            self._remove_category_links(id)
+            delete_genre_list_item(id)
+            _, deleted_by_model = self.genre_model.objects.filter(id=id).delete()
+            deleted = deleted_by_model.get(self.genre_model._meta.label, 0)
+            if deleted:
+                increment_row_count(self.genre_model, delta=-deleted)
+        self._count = None
+        return bool(deleted)
+
+    def update(self, genre: Genre, changes: GenreChanges | None = None) -> bool:
+        if changes is None:
+            return self._replace(genre)
+
+        if not changes:
+            return True
 
         with transaction.atomic():
-            self.genre_model.objects.filter(id=genre.id).update(
+            if changes.fields:
+                truncate_page_boundaries(self.genre_model, genre.id)
+            updated = self.genre_model.objects.filter(
+                id=genre.id,
+                version=genre.version,
+            ).update(
+                **changes.fields,
+                version=F("version") + 1,
+            )
+            if not updated:
+                return False
+            if changes.fields:
+                truncate_page_boundaries(self.genre_model, genre.id)
+
+            if changes.category_ids_to_remove:
+                self._remove_category_links(
+                    genre.id,
+                    changes.category_ids_to_remove,
+                )
+
+            if changes.category_ids_to_add:
+                self._add_category_links(
+                    genre.id,
+                    [
+                        category_id
+                        for category_id in genre.categories
+                        if category_id in changes.category_ids_to_add
+                    ],
+                )
+
+            changed_fields = set(changes.fields)
+            if changes.category_ids_to_add or changes.category_ids_to_remove:
+                changed_fields.add("categories")
+            update_genre_list_item(genre, fields=changed_fields)
+            invalidate_list_cache_on_commit(self.genre_model)
+        genre.version += 1
+        return True
+
+    def _replace(self, genre: Genre) -> bool:
+        with transaction.atomic():
+            truncate_page_boundaries(self.genre_model, genre.id)
+            updated = self.genre_model.objects.filter(
+                id=genre.id,
+                version=genre.version,
+            ).update(
                 name=genre.name,
                 is_active=genre.is_active,
+                version=F("version") + 1,
             )
-            genre_model.categories.set(genre.categories)
+            if not updated:
+                return False
 
-    def _get_categories_prefetch(self, to_attr: str | None = None) -> Prefetch:
-        return Prefetch(
-            "categories",
-            queryset=(
-                CategoryModel.objects
-                .order_by("name")
-                .only("id")
-            ),
-            to_attr=to_attr,
-        )
+            current_category_ids = set(
+                self._get_category_ids_by_genre_id([genre.id])[genre.id]
+            )
+            self._remove_category_links(
+                genre.id,
+                current_category_ids - set(genre.categories),
+            )
+            self._add_category_links(
+                genre.id,
+                [
+                    category_id
+                    for category_id in genre.categories
+                    if category_id not in current_category_ids
+                ],
+            )
+            update_genre_list_item(
+                genre,
+                fields=["name", "is_active", "categories"],
+            )
+            truncate_page_boundaries(self.genre_model, genre.id)
+            invalidate_list_cache_on_commit(self.genre_model)
+        genre.version += 1
+        return True
+
+    def _validate_order_by(self, order_by: str) -> None:
+        keys = split_order_by(order_by)
+
+        if not keys or any(
+            key not in VALID_ORDER_BY_ATTRIBUTES
+            and get_field_name(key) != TIE_BREAKER_FIELD
+            for key in keys
+        ):
+            raise InvalidOrderByRequested(
+                order_by=order_by,
+                valid_order_by_attributes=VALID_ORDER_BY_ATTRIBUTES,
+            )
@@ -2,6 +2,7 @@ from rest_framework import serializers
 
 from src.django_project.shared.serializers.serializers import (
     PaginatedListResponseSerializer,
+    SparseFieldsetSerializer,
 )
 
 # class SetField(serializers.ListField):
@@ -9,11 +10,34 @@ from src.django_project.shared.serializers.serializers import (
 #         return set(super().to_internal_value(data))
 
 
-class GenreResponseSerializer(serializers.Serializer):
+class CategorySummaryResponseSerializer(serializers.Serializer):
     id = serializers.UUIDField()
     name = serializers.CharField(max_length=255)
     is_active = serializers.BooleanField()
-    categories = serializers.ListField(child=serializers.UUIDField())
+
+
+class ExpandableCategoriesField(serializers.ListField):
+    def to_representation(self, data):
+        category_summaries = self.context.get("category_summaries")
+        if category_summaries is None:
+            return super().to_representation(data)
+
+        return CategorySummaryResponseSerializer(
+            [
+                category_summaries[category_id]
+                for category_id in data
+                if category_id in category_summaries
+            ],
+            many=True,
+        ).data
+
+
+class GenreResponseSerializer(SparseFieldsetSerializer):
+    id = serializers.UUIDField()
+    name = serializers.CharField(max_length=255)
+    is_active = serializers.BooleanField()
+    categories = ExpandableCategoriesField(child=serializers.UUIDField())
+    categories_count = serializers.IntegerField()
 
 
 class ListGenreResponseSerializers(PaginatedListResponseSerializer):
@@ -40,12 +40,7 @@ def romance_genre_model_with_categories(
 
     genre_repository.save(genre=romance_genre)
 
-    return (
-        GenreModel.objects
-        .prefetch_related(
-            genre_repository._get_categories_prefetch()
-        ).get(id=romance_genre.id)
-    )
+    return GenreModel.objects.get(id=romance_genre.id)
 
 
 @pytest.fixture
@@ -54,12 +49,7 @@ def drama_genre_model_without_categories(
 ) -> GenreModel:
     drama_genre = Genre(name="Drama")
     genre_repository.save(genre=drama_genre)
-    return (
-        GenreModel.objects
-        .prefetch_related(
-            genre_repository._get_categories_prefetch()
-        ).get(id=drama_genre.id)
-    )
+    return GenreModel.objects.get(id=drama_genre.id)
 
 
 @pytest.fixture
@@ -68,12 +58,7 @@ def horror_genre_model_without_categories(
 ) -> GenreModel:
     horror_genre = Genre(name="Horror")
     genre_repository.save(genre=horror_genre)
-    return (
-        GenreModel.objects
-        .prefetch_related(
-            genre_repository._get_categories_prefetch()
-        ).get(id=horror_genre.id)
-    )
+    return GenreModel.objects.get(id=horror_genre.id)
 
 
 @pytest.fixture
@@ -82,12 +67,7 @@ def scifi_genre_model_without_categories(
 ) -> GenreModel:
     scifi_genre = Genre(name="Scifi")
     genre_repository.save(genre=scifi_genre)
-    return (
-        GenreModel.objects
-        .prefetch_related(
-            genre_repository._get_categories_prefetch()
-        ).get(id=scifi_genre.id)
-    )
+    return GenreModel.objects.get(id=scifi_genre.id)
 
 
 @pytest.fixture
@@ -96,12 +76,7 @@ def action_genre_model_without_categories(
 ) -> GenreModel:
     action_genre = Genre(name="Action")
     genre_repository.save(genre=action_genre)
-    return (
-        GenreModel.objects
-        .prefetch_related(
-            genre_repository._get_categories_prefetch()
-        ).get(id=action_genre.id)
-    )
+    return GenreModel.objects.get(id=action_genre.id)
 
 
 # ----------------------------------------- #
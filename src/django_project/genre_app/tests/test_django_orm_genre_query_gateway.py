@@ -0,0 +1,137 @@
+import pytest
+
+from src.core.category.domain.category import Category
+from src.core.genre.application.list_genres import GenreOutput, ListGenres
+from src.core.genre.domain.genre import Genre
+from src.core.genre.gateway.genre_gateway import GenreChanges
+from src.django_project.category_app.repository import DjangoORMCategoryRepository
+from src.django_project.genre_app.models import GenreListItem
+from src.django_project.genre_app.query_gateway import DjangoORMGenreQueryGateway
+from src.django_project.genre_app.repository import DjangoORMGenreRepository
+
+
+@pytest.fixture
+def query_gateway() -> DjangoORMGenreQueryGateway:
+    return DjangoORMGenreQueryGateway()
+
+
+@pytest.fixture
+def romance_genre(
+    movie_category: Category,
+    documentary_category: Category,
+    category_repository: DjangoORMCategoryRepository,
+    genre_repository: DjangoORMGenreRepository,
+) -> Genre:
+    category_repository.save(category=movie_category)
+    category_repository.save(category=documentary_category)
+
+    genre = Genre(
+        name="Romance",
+        categories=[documentary_category.id, movie_category.id],
+    )
+    genre_repository.save(genre=genre)
+    return genre
+
+
+@pytest.mark.django_db
+class TestList:
+    def test_list_is_a_single_select_on_read_table(
+        self,
+        romance_genre: Genre,
+        query_gateway: DjangoORMGenreQueryGateway,
+        django_assert_num_queries,
+    ):
+        with django_assert_num_queries(1) as context:
+            output = ListGenres(repository=query_gateway).execute(
+                input=ListGenres.Input(),
+            )
+
+        assert '"genre_list"' in context.captured_queries[0]["sql"]
+        assert output.data == [
+            GenreOutput(
+                id=romance_genre.id,
+                name=romance_genre.name,
+                is_active=romance_genre.is_active,
+                categories=list(romance_genre.categories),
+                categories_count=romance_genre.categories_count,
+            ),
+        ]
+        assert output.meta.total == 1
+
+    def test_list_values_after_pages_with_cursor(
+        self,
+        genre_repository: DjangoORMGenreRepository,
+        query_gateway: DjangoORMGenreQueryGateway,
+    ):
+        for name in ["Drama", "Action", "Romance"]:
+            genre_repository.save(genre=Genre(name=name))
+
+        use_case = ListGenres(repository=query_gateway)
+        first_page = use_case.execute(
+            input=ListGenres.Input(per_page=2, fields="name"),
+        )
+        second_page = use_case.execute(
+            input=ListGenres.Input(cursor=first_page.meta.next_cursor, fields="name"),
+        )
+
+        assert [genre.name for genre in first_page.data] == ["Action", "Drama"]
+        assert [genre.name for genre in second_page.data] == ["Romance"]
+
+
+@pytest.mark.django_db
+class TestReadModelSync:
+    def test_update_with_changes_rewrites_row(
+        self,
+        movie_category: Category,
+        romance_genre: Genre,
+        genre_repository: DjangoORMGenreRepository,
+    ):
+        romance_genre.update_name(name="Love")
+        romance_genre.remove_category(id=movie_category.id)
+
+        genre_repository.update(
+            genre=romance_genre,
+            changes=GenreChanges(
+                fields={"name": "Love"},
+                category_ids_to_remove={movie_category.id},
+            ),
+        )
+
+        item = GenreListItem.objects.get(id=romance_genre.id)
+        assert item.name == "Love"
+        assert item.categories == [str(id) for id in romance_genre.categories]
+
+    def test_replace_rewrites_row(
+        self,
+        romance_genre: Genre,
+        genre_repository: DjangoORMGenreRepository,
+    ):
+        romance_genre.deactivate()
+        romance_genre.categories.reverse()
+
+        genre_repository.update(genre=romance_genre)
+
+        item = GenreListItem.objects.get(id=romance_genre.id)
+        assert item.is_active is False
+        assert item.categories == [str(id) for id in romance_genre.categories]
+
+    def test_delete_genre_removes_row(
+        self,
+        romance_genre: Genre,
+        genre_repository: DjangoORMGenreRepository,
+    ):
+        genre_repository.delete(id=romance_genre.id)
+
+        assert not GenreListItem.objects.exists()
+
+    def test_delete_category_removes_it_from_rows(
+        self,
+        movie_category: Category,
+        documentary_category: Category,
+        romance_genre: Genre,
+        category_repository: DjangoORMCategoryRepository,
+    ):
+        category_repository.delete(id=movie_category.id)
+
+        item = GenreListItem.objects.get(id=romance_genre.id)
+        assert item.categories == [str(documentary_category.id)]
@@ -1,11 +1,20 @@
+from unittest.mock import patch
 from uuid import uuid4
 
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 from src.core.category.domain.category import Category
+from src.core.genre.application.list_genres import ListGenres
 from src.core.genre.domain.genre import Genre
+from src.core.genre.gateway.genre_gateway import GenreChanges
+from src.core.shared import settings as core_settings
+from src.core.shared.application.cursor import Cursor
+from src.django_project.category_app.models import Category as CategoryModel
 from src.django_project.category_app.repository import DjangoORMCategoryRepository
 from src.django_project.genre_app.repository import DjangoORMGenreRepository
+from src.django_project.page_boundary_app.models import PageBoundary
 
 
 @pytest.fixture
@@ -122,6 +131,194 @@ class TestList:
         genres = genre_repository.list()
         assert genres == []
 
+    def test_list_genre_page_and_count_in_two_queries(
+        self,
+        genre_repository_with_romance_genre: DjangoORMGenreRepository,
+        django_assert_num_queries,
+    ):
+        repository = DjangoORMGenreRepository()
+        with django_assert_num_queries(2):
+            output = ListGenres(repository=repository).execute(
+                input=ListGenres.Input(),
+            )
+
+        assert output.meta.total == 1
+        assert len(output.data[0].categories) == 2
+
+    def test_list_values_only_selects_requested_fields(
+        self,
+        romance_genre: Genre,
+        genre_repository_with_romance_genre: DjangoORMGenreRepository,
+        django_assert_num_queries,
+    ):
+        repository = DjangoORMGenreRepository()
+        with django_assert_num_queries(1) as context:
+            genres = repository.list_values(fields=["id", "name"])
+
+        assert genres == [{"id": romance_genre.id, "name": romance_genre.name}]
+        assert "is_active" not in context.captured_queries[0]["sql"]
+
+    def test_list_values_with_categories_in_two_queries(
+        self,
+        romance_genre: Genre,
+        documentary_category: Category,
+        movie_category: Category,
+        genre_repository_with_romance_genre: DjangoORMGenreRepository,
+        django_assert_num_queries,
+    ):
+        repository = DjangoORMGenreRepository()
+        with django_assert_num_queries(2):
+            genres = repository.list_values(fields=["id", "categories"])
+
+        assert genres == [
+            {
+                "id": romance_genre.id,
+                "categories": [documentary_category.id, movie_category.id],
+            },
+        ]
+
+    def test_get_values_by_id_limits_categories_in_sql(
+        self,
+        romance_genre: Genre,
+        documentary_category: Category,
+        genre_repository_with_romance_genre: DjangoORMGenreRepository,
+        django_assert_num_queries,
+    ):
+        repository = DjangoORMGenreRepository()
+        with django_assert_num_queries(3) as context:
+            values = repository.get_values_by_id(
+                id=romance_genre.id,
+                fields=["id", "categories", "categories_count"],
+                categories_limit=1,
+            )
+
+        assert values == {
+            "id": romance_genre.id,
+            "categories": [documentary_category.id],
+            "categories_count": 2,
+        }
+        assert "LIMIT 1" in context.captured_queries[1]["sql"]
+
+    def test_list_values_by_category_only_selects_requested_fields(
+        self,
+        romance_genre: Genre,
+        movie_category: Category,
+        genre_repository_with_romance_genre: DjangoORMGenreRepository,
+        django_assert_num_queries,
+    ):
+        genre_repository_with_romance_genre.save(genre=Genre(name="Drama"))
+
+        repository = DjangoORMGenreRepository()
+        with django_assert_num_queries(1) as context:
+            genres = repository.list_values_by_category(
+                category_id=movie_category.id,
+                fields=["id", "name"],
+            )
+
+        assert genres == [{"id": romance_genre.id, "name": romance_genre.name}]
+        assert "is_active" not in context.captured_queries[0]["sql"]
+
+    def test_list_keeps_category_link_order_by_default(
+        self,
+        documentary_category: Category,
+        movie_category: Category,
+        category_repository: DjangoORMCategoryRepository,
+        genre_repository: DjangoORMGenreRepository,
+        django_assert_num_queries,
+    ):
+        category_repository.save(category=documentary_category)
+        category_repository.save(category=movie_category)
+        genre_repository.save(
+            Genre(
+                name="Romance",
+                categories=[movie_category.id, documentary_category.id],
+            )
+        )
+
+        with django_assert_num_queries(2) as context:
+            genres = genre_repository.list()
+
+        assert genres[0].categories == [movie_category.id, documentary_category.id]
+        assert "JOIN" not in context.captured_queries[-1]["sql"]
+
+    def test_list_orders_categories_by_category_order_by(
+        self,
+        documentary_category: Category,
+        movie_category: Category,
+        genre_repository_with_romance_genre: DjangoORMGenreRepository,
+    ):
+        repository = DjangoORMGenreRepository(category_order_by="-name")
+
+        genres = repository.list()
+
+        assert genres[0].categories == [movie_category.id, documentary_category.id]
+
+
+@pytest.mark.django_db
+class TestListByCategory:
+    def test_list_by_category_reads_through_table_index(
+        self,
+        romance_genre: Genre,
+        movie_category: Category,
+        genre_repository_with_romance_genre: DjangoORMGenreRepository,
+        django_assert_num_queries,
+    ):
+        genre_repository_with_romance_genre.save(Genre(name="Drama"))
+
+        repository = DjangoORMGenreRepository()
+        with django_assert_num_queries(2) as context:
+            genres = repository.list_by_category(
+                category_id=movie_category.id,
+                with_total=True,
+            )
+            total = repository.count_by_category(category_id=movie_category.id)
+
+        assert genres == [romance_genre]
+        assert total == 1
+        assert "genre_categories" in context.captured_queries[0]["sql"]
+        assert '"category"' not in context.captured_queries[0]["sql"]
+
+    def test_list_by_category_after_cursor(
+        self,
+        movie_category: Category,
+        genre_repository_with_romance_genre: DjangoORMGenreRepository,
+    ):
+        genre_repository_with_romance_genre.save(
+            Genre(name="Action", categories=[movie_category.id]),
+        )
+
+        first_page = genre_repository_with_romance_genre.list_by_category_after(
+            category_id=movie_category.id,
+            cursor=None,
+            order_by="name",
+            limit=1,
+        )
+        second_page = genre_repository_with_romance_genre.list_by_category_after(
+            category_id=movie_category.id,
+            cursor=Cursor(
+                order_by="name",
+                value=first_page[0].name,
+                id=first_page[0].id,
+            ),
+            order_by="name",
+            limit=1,
+        )
+
+        assert [genre.name for genre in first_page] == ["Action"]
+        assert [genre.name for genre in second_page] == ["Romance"]
+
+    def test_count_by_category_without_list(
+        self,
+        documentary_category: Category,
+        genre_repository_with_romance_genre: DjangoORMGenreRepository,
+    ):
+        assert genre_repository_with_romance_genre.count_by_category(
+            category_id=documentary_category.id,
+        ) == 1
+        assert genre_repository_with_romance_genre.count_by_category(
+            category_id=uuid4(),
+        ) == 0
+
 
 @pytest.mark.django_db
 class TestGetById:
@@ -177,6 +374,231 @@ class TestUpdate:
 
         assert genre_found.categories == new_categories
 
+    def test_update_with_changes_writes_only_the_delta(
+        self,
+        movie_category: Category,
+        romance_genre: Genre,
+        genre_repository_with_romance_genre: DjangoORMGenreRepository,
+    ):
+        drama_category = Category(name="Drama")
+        DjangoORMCategoryRepository().save(category=drama_category)
+
+        romance_genre.update_name(name="Love")
+        romance_genre.remove_category(id=movie_category.id)
+        romance_genre.add_category(id=drama_category.id)
+
+        with CaptureQueriesContext(connection) as context:
+            genre_repository_with_romance_genre.update(
+                genre=romance_genre,
+                changes=GenreChanges(
+                    fields={"name": "Love"},
+                    category_ids_to_add={drama_category.id},
+                    category_ids_to_remove={movie_category.id},
+                ),
+            )
+
+        assert [
+            (query["sql"].split()[0], query["sql"].split('"')[1])
+            for query in context.captured_queries
+            if query["sql"].startswith(("UPDATE", "DELETE", "INSERT"))
+        ] == [
+            ("UPDATE", "genre"),
+            ("UPDATE", "category"),
+            ("DELETE", "genre_categories"),
+            ("INSERT", "genre_categories"),
+            ("UPDATE", "category"),
+            ("UPDATE", "genre_list"),
+        ]
+
+        genre_found = genre_repository_with_romance_genre.get_by_id(id=romance_genre.id)
+
+        assert genre_found is not None
+        assert genre_found.name == "Love"
+        assert genre_found.categories == romance_genre.categories
+
+    def test_update_without_changes_does_not_query(
+        self,
+        romance_genre: Genre,
+        genre_repository_with_romance_genre: DjangoORMGenreRepository,
+        django_assert_num_queries,
+    ):
+        with django_assert_num_queries(0):
+            genre_repository_with_romance_genre.update(
+                genre=romance_genre,
+                changes=GenreChanges(),
+            )
+
+    def test_update_with_stale_version_writes_nothing(
+        self,
+        movie_category: Category,
+        romance_genre: Genre,
+        genre_repository_with_romance_genre: DjangoORMGenreRepository,
+    ):
+        stale_genre = genre_repository_with_romance_genre.get_by_id(
+            id=romance_genre.id,
+        )
+        assert stale_genre is not None
+        romance_genre.update_name(name="Love")
+        genre_repository_with_romance_genre.update(
+            genre=romance_genre,
+            changes=GenreChanges(fields={"name": "Love"}),
+        )
+
+        stale_genre.remove_category(id=movie_category.id)
+        changes_updated = genre_repository_with_romance_genre.update(
+            genre=stale_genre,
+            changes=GenreChanges(category_ids_to_remove={movie_category.id}),
+        )
+        replaced = genre_repository_with_romance_genre.update(genre=stale_genre)
+
+        genre_found = genre_repository_with_romance_genre.get_by_id(id=romance_genre.id)
+        assert changes_updated is False
+        assert replaced is False
+        assert romance_genre.version == 2
+        assert genre_found is not None
+        assert genre_found.version == 2
+        assert genre_found.name == "Love"
+        assert movie_category.id in genre_found.categories
+
+
+@pytest.mark.django_db
+class TestGenreCount:
+    def get_genre_counts(self, *categories: Category) -> list[int]:
+        return [
+            CategoryModel.objects.get(id=category.id).genre_count
+            for category in categories
+        ]
+
+    def test_save_increments_genre_count(
+        self,
+        movie_category: Category,
+        documentary_category: Category,
+        genre_repository_with_romance_genre: DjangoORMGenreRepository,
+    ):
+        genre_repository_with_romance_genre.save(
+            Genre(name="Drama", categories=[movie_category.id]),
+        )
+
+        assert self.get_genre_counts(movie_category, documentary_category) == [2, 1]
+
+    def test_update_applies_genre_count_delta(
+        self,
+        romance_genre: Genre,
+        movie_category: Category,
+        documentary_category: Category,
+        genre_repository_with_romance_genre: DjangoORMGenreRepository,
+    ):
+        drama_category = Category(name="Drama")
+        DjangoORMCategoryRepository().save(category=drama_category)
+
+        romance_genre.remove_category(id=movie_category.id)
+        romance_genre.add_category(id=drama_category.id)
+        genre_repository_with_romance_genre.update(
+            genre=romance_genre,
+            changes=GenreChanges(
+                category_ids_to_add={drama_category.id},
+                category_ids_to_remove={movie_category.id},
+            ),
+        )
+
+        assert self.get_genre_counts(
+            movie_category,
+            documentary_category,
+            drama_category,
+        ) == [0, 1, 1]
+
+    def test_replace_applies_genre_count_delta(
+        self,
+        romance_genre: Genre,
+        movie_category: Category,
+        documentary_category: Category,
+        genre_repository_with_romance_genre: DjangoORMGenreRepository,
+    ):
+        romance_genre.remove_category(id=documentary_category.id)
+        genre_repository_with_romance_genre.update(genre=romance_genre)
+
+        assert self.get_genre_counts(movie_category, documentary_category) == [1, 0]
+
+    def test_delete_decrements_genre_count(
+        self,
+        romance_genre: Genre,
+        movie_category: Category,
+        documentary_category: Category,
+        genre_repository_with_romance_genre: DjangoORMGenreRepository,
+    ):
+        genre_repository_with_romance_genre.delete(id=romance_genre.id)
+
+        assert self.get_genre_counts(movie_category, documentary_category) == [0, 0]
+
+    def test_update_many_applies_genre_count_delta(
+        self,
+        romance_genre: Genre,
+        movie_category: Category,
+        documentary_category: Category,
+        genre_repository_with_romance_genre: DjangoORMGenreRepository,
+    ):
+        drama_genre = Genre(name="Drama", categories=[movie_category.id])
+        genre_repository_with_romance_genre.save(drama_genre)
+
+        romance_genre.remove_category(id=movie_category.id)
+        drama_genre.remove_category(id=movie_category.id)
+        drama_genre.add_category(id=documentary_category.id)
+        genre_repository_with_romance_genre.update_many([romance_genre, drama_genre])
+
+        assert self.get_genre_counts(movie_category, documentary_category) == [0, 2]
+        drama_genre_found = genre_repository_with_romance_genre.get_by_id(
+            drama_genre.id,
+        )
+        assert drama_genre_found is not None
+        assert drama_genre_found.categories == [documentary_category.id]
+
+    def test_delete_many_decrements_genre_count(
+        self,
+        romance_genre: Genre,
+        movie_category: Category,
+        documentary_category: Category,
+        genre_repository_with_romance_genre: DjangoORMGenreRepository,
+    ):
+        drama_genre = Genre(name="Drama", categories=[movie_category.id])
+        genre_repository_with_romance_genre.save(drama_genre)
+
+        missing_id = uuid4()
+        missing_ids = genre_repository_with_romance_genre.delete_many(
+            {romance_genre.id, drama_genre.id, missing_id},
+        )
+
+        assert missing_ids == {missing_id}
+        assert self.get_genre_counts(movie_category, documentary_category) == [0, 0]
+
+    def test_genre_count_changes_clear_category_page_boundaries(
+        self,
+        movie_category: Category,
+        genre_repository_with_romance_genre: DjangoORMGenreRepository,
+    ):
+        PageBoundary.objects.create(
+            table="category",
+            order_by="-genre_count",
+            position=2,
+            value=1,
+            row_id=movie_category.id,
+        )
+        PageBoundary.objects.create(
+            table="category",
+            order_by="name",
+            position=2,
+            value=movie_category.name,
+            row_id=movie_category.id,
+        )
+
+        with patch.dict(core_settings.REPOSITORY, {"page_boundary_interval": 2}):
+            genre_repository_with_romance_genre.save(
+                Genre(name="Drama", categories=[movie_category.id]),
+            )
+
+        assert list(
+            PageBoundary.objects.values_list("order_by", flat=True)
+        ) == ["name"]
+
 
 @pytest.mark.django_db
 class TestDelete:
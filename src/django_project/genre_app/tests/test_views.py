@@ -8,8 +8,11 @@ from rest_framework.test import APIClient
 
 from src.core.category.domain.category import Category
 from src.core.shared import settings as core_settings
+from src.core.shared.application.cursor import Cursor
+from src.django_project.category_app.models import Category as CategoryModel
 from src.django_project.category_app.repository import DjangoORMCategoryRepository
 from src.django_project.genre_app.models import Genre as GenreModel
+from src.django_project.genre_app.models import GenreListItem
 from src.django_project.genre_app.repository import (
     DEFAULT_GENRE_LIST_ORDER,
     DjangoORMGenreRepository,
@@ -36,6 +39,7 @@ class TestListAPI:
                 "name": drama_genre_model_without_categories.name,
                 "is_active": drama_genre_model_without_categories.is_active,
                 "categories": [],
+                "categories_count": 0,
             },
             {
                 "id": str(romance_genre_model_with_categories.id),
@@ -48,6 +52,7 @@ class TestListAPI:
                         .order_by("name")
                     )
                 ],
+                "categories_count": 2,
             },
         ]
 
@@ -69,6 +74,8 @@ class TestListAPI:
                 "page": 1,
                 "total": 2,
                 "per_page": core_settings.REPOSITORY["page_size"],
+                "next_cursor": None,
+                "prev_cursor": None,
             }
         }
 
@@ -77,6 +84,31 @@ class TestListAPI:
         assert response.status_code == status.HTTP_200_OK
         assert response.data == expected_data
 
+    def test_list_genres_with_fields(
+        self,
+        romance_genre_model_with_categories: GenreModel,
+        drama_genre_model_without_categories: GenreModel,
+    ):
+        response = APIClient().get(BASE_GENRE_URL, {"fields": "categories"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["data"] == [
+            {
+                "id": str(drama_genre_model_without_categories.id),
+                "categories": [],
+            },
+            {
+                "id": str(romance_genre_model_with_categories.id),
+                "categories": [
+                    str(category.id)
+                    for category in (
+                        romance_genre_model_with_categories.categories
+                        .order_by("name")
+                    )
+                ],
+            },
+        ]
+
     def test_empty_list_genres_and_categories(
         self,
     ):
@@ -86,6 +118,8 @@ class TestListAPI:
                 "page": 1,
                 "total": 0,
                 "per_page": core_settings.REPOSITORY["page_size"],
+                "next_cursor": None,
+                "prev_cursor": None,
             },
         }
 
@@ -114,6 +148,7 @@ class TestListAPI:
                         "name": scifi_genre_model_without_categories.name,
                         "is_active": scifi_genre_model_without_categories.is_active,
                         "categories": [],
+                        "categories_count": 0,
                     },
                     {
                         "id": str(romance_genre_model_with_categories.id),
@@ -126,6 +161,7 @@ class TestListAPI:
                                 .order_by("name")
                             )
                         ],
+                        "categories_count": 2,
                     },
             ],
             2: [
@@ -134,12 +170,14 @@ class TestListAPI:
                         "name": horror_genre_model_without_categories.name,
                         "is_active": horror_genre_model_without_categories.is_active,
                         "categories": [],
+                        "categories_count": 0,
                     },
                     {
                         "id": str(drama_genre_model_without_categories.id),
                         "name": drama_genre_model_without_categories.name,
                         "is_active": drama_genre_model_without_categories.is_active,
                         "categories": [],
+                        "categories_count": 0,
                     },
             ],
             3: [
@@ -148,6 +186,7 @@ class TestListAPI:
                         "name": action_genre_model_without_categories.name,
                         "is_active": action_genre_model_without_categories.is_active,
                         "categories": [],
+                        "categories_count": 0,
                     },
             ],
         }
@@ -165,6 +204,25 @@ class TestListAPI:
                 "page": page,
                 "total": 5,
                 "per_page": overriden_page_size,
+                "next_cursor": (
+                    Cursor(
+                        order_by="-name",
+                        value=expected_genres_per_page[page][-1]["name"],
+                        id=UUID(expected_genres_per_page[page][-1]["id"]),
+                    ).encode()
+                    if page < 3
+                    else None
+                ),
+                "prev_cursor": (
+                    Cursor(
+                        order_by="-name",
+                        value=expected_genres_per_page[page][0]["name"],
+                        id=UUID(expected_genres_per_page[page][0]["id"]),
+                        backward=True,
+                    ).encode()
+                    if page > 1
+                    else None
+                ),
             },
         }
 
@@ -179,6 +237,303 @@ class TestListAPI:
         assert response.data == expected_data
 
 
+@pytest.mark.django_db
+class TestExpandCategoriesAPI:
+    def test_list_genres_with_expanded_categories(
+        self,
+        movie_category: Category,
+        documentary_category: Category,
+        romance_genre_model_with_categories: GenreModel,
+        drama_genre_model_without_categories: GenreModel,
+        django_assert_num_queries,
+    ):
+        with django_assert_num_queries(2):
+            response = APIClient().get(BASE_GENRE_URL, {"expand": "categories"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [genre["categories"] for genre in response.data["data"]] == [
+            [],
+            [
+                {
+                    "id": str(documentary_category.id),
+                    "name": documentary_category.name,
+                    "is_active": documentary_category.is_active,
+                },
+                {
+                    "id": str(movie_category.id),
+                    "name": movie_category.name,
+                    "is_active": movie_category.is_active,
+                },
+            ],
+        ]
+
+    def test_list_genres_with_invalid_expand(self):
+        response = APIClient().get(BASE_GENRE_URL, {"expand": "cast_members"})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data == {
+            "error": "Provided expand 'cast_members' is not in: 'categories'",
+        }
+
+    def test_retrieve_genre_with_expanded_categories(
+        self,
+        movie_category: Category,
+        documentary_category: Category,
+        romance_genre_model_with_categories: GenreModel,
+    ):
+        response = APIClient().get(
+            f"{BASE_GENRE_URL}{romance_genre_model_with_categories.id}/",
+            {"expand": "categories"},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["data"]["categories"] == [
+            {
+                "id": str(documentary_category.id),
+                "name": documentary_category.name,
+                "is_active": documentary_category.is_active,
+            },
+            {
+                "id": str(movie_category.id),
+                "name": movie_category.name,
+                "is_active": movie_category.is_active,
+            },
+        ]
+
+    def test_retrieve_genre_without_expand(
+        self,
+        romance_genre_model_with_categories: GenreModel,
+        movie_category: Category,
+        documentary_category: Category,
+    ):
+        response = APIClient().get(
+            f"{BASE_GENRE_URL}{romance_genre_model_with_categories.id}/",
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {
+            "data": {
+                "id": str(romance_genre_model_with_categories.id),
+                "name": "Romance",
+                "is_active": True,
+                "categories": [
+                    str(documentary_category.id),
+                    str(movie_category.id),
+                ],
+                "categories_count": 2,
+            },
+        }
+
+    def test_retrieve_non_existing_genre(self):
+        response = APIClient().get(f"{BASE_GENRE_URL}{uuid4()}/")
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_retrieve_genre_with_fields(
+        self,
+        romance_genre_model_with_categories: GenreModel,
+    ):
+        response = APIClient().get(
+            f"{BASE_GENRE_URL}{romance_genre_model_with_categories.id}/",
+            {"fields": "name,categories_count"},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {
+            "data": {
+                "id": str(romance_genre_model_with_categories.id),
+                "name": "Romance",
+                "categories_count": 2,
+            },
+        }
+        assert "ETag" not in response
+
+    def test_retrieve_genre_with_invalid_fields(
+        self,
+        romance_genre_model_with_categories: GenreModel,
+    ):
+        response = APIClient().get(
+            f"{BASE_GENRE_URL}{romance_genre_model_with_categories.id}/",
+            {"fields": "name,secret"},
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "error" in response.data
+
+
+@pytest.mark.django_db
+class TestListCategoryGenresAPI:
+    def test_list_genres_of_category(
+        self,
+        movie_category: Category,
+        documentary_category: Category,
+        romance_genre_model_with_categories: GenreModel,
+        drama_genre_model_without_categories: GenreModel,
+    ):
+        response = APIClient().get(f"/api/categories/{movie_category.id}/genres/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["data"] == [
+            {
+                "id": str(romance_genre_model_with_categories.id),
+                "name": romance_genre_model_with_categories.name,
+                "is_active": romance_genre_model_with_categories.is_active,
+                "categories": [
+                    str(documentary_category.id),
+                    str(movie_category.id),
+                ],
+                "categories_count": 2,
+            },
+        ]
+        assert response.data["meta"]["total"] == 1
+
+    def test_list_genres_of_category_with_fields(
+        self,
+        movie_category: Category,
+        romance_genre_model_with_categories: GenreModel,
+    ):
+        response = APIClient().get(
+            f"/api/categories/{movie_category.id}/genres/",
+            {"fields": "name"},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["data"] == [
+            {"id": str(romance_genre_model_with_categories.id), "name": "Romance"},
+        ]
+
+    def test_list_genres_of_non_existing_category(self):
+        response = APIClient().get(f"/api/categories/{uuid4()}/genres/")
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_list_genres_of_category_with_invalid_page(
+        self,
+        movie_category: Category,
+        romance_genre_model_with_categories: GenreModel,
+    ):
+        response = APIClient().get(
+            f"/api/categories/{movie_category.id}/genres/",
+            {"page": 0},
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "error" in response.data
+
+
+@pytest.mark.django_db
+class TestListGenreCategoriesAPI:
+    def test_list_categories_of_genre_ordered_by_name(
+        self,
+        movie_category: Category,
+        documentary_category: Category,
+        romance_genre_model_with_categories: GenreModel,
+    ):
+        response = APIClient().get(
+            f"{BASE_GENRE_URL}{romance_genre_model_with_categories.id}/categories/",
+            {"fields": "name"},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["data"] == [
+            {"id": str(documentary_category.id), "name": "Category"},
+            {"id": str(movie_category.id), "name": "Movie"},
+        ]
+        assert response.data["meta"]["total"] == 2
+
+    def test_pages_categories_of_genre_with_cursor(
+        self,
+        movie_category: Category,
+        documentary_category: Category,
+        romance_genre_model_with_categories: GenreModel,
+    ):
+        url = f"{BASE_GENRE_URL}{romance_genre_model_with_categories.id}/categories/"
+
+        first_page = APIClient().get(url, {"order_by": "-name", "per_page": 1})
+        second_page = APIClient().get(
+            url,
+            {"cursor": first_page.data["meta"]["next_cursor"]},
+        )
+
+        assert [category["name"] for category in first_page.data["data"]] == [
+            "Movie",
+        ]
+        assert [category["name"] for category in second_page.data["data"]] == [
+            "Category",
+        ]
+        assert second_page.data["meta"]["next_cursor"] is None
+
+    def test_list_categories_of_genre_rejects_other_ordering(
+        self,
+        romance_genre_model_with_categories: GenreModel,
+    ):
+        response = APIClient().get(
+            f"{BASE_GENRE_URL}{romance_genre_model_with_categories.id}/categories/",
+            {"order_by": "genre_count"},
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "error" in response.data
+
+    def test_list_categories_of_non_existing_genre(self):
+        response = APIClient().get(f"{BASE_GENRE_URL}{uuid4()}/categories/")
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+class TestCategoriesLimitAPI:
+    def test_list_caps_inline_categories(
+        self,
+        documentary_category: Category,
+        romance_genre_model_with_categories: GenreModel,
+    ):
+        response = APIClient().get(BASE_GENRE_URL, {"categories_limit": 1})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["data"][0]["categories"] == [
+            str(documentary_category.id),
+        ]
+        assert response.data["data"][0]["categories_count"] == 2
+
+    def test_list_without_inline_categories(
+        self,
+        romance_genre_model_with_categories: GenreModel,
+    ):
+        response = APIClient().get(BASE_GENRE_URL, {"fields": "categories_count"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["data"] == [
+            {
+                "id": str(romance_genre_model_with_categories.id),
+                "categories_count": 2,
+            },
+        ]
+
+    def test_retrieve_caps_inline_categories(
+        self,
+        romance_genre_model_with_categories: GenreModel,
+    ):
+        response = APIClient().get(
+            f"{BASE_GENRE_URL}{romance_genre_model_with_categories.id}/",
+            {"categories_limit": 0},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["data"]["categories"] == []
+        assert response.data["data"]["categories_count"] == 2
+
+    @pytest.mark.parametrize("categories_limit", ["-1", "many"])
+    def test_invalid_categories_limit(self, categories_limit: str):
+        response = APIClient().get(
+            BASE_GENRE_URL,
+            {"categories_limit": categories_limit},
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "error" in response.data
+
+
 @pytest.mark.django_db
 class TestCreateAPI:
     def test_create_genre_with_categories_success(
@@ -277,6 +632,64 @@ class TestCreateAPI:
         }
 
 
+@pytest.mark.django_db
+class TestBulkCreateAPI:
+    def test_bulk_create_genres_with_categories(
+        self,
+        movie_category: Category,
+        category_repository: DjangoORMCategoryRepository,
+        genre_repository: DjangoORMGenreRepository,
+    ):
+        category_repository.save(movie_category)
+        missing_category_id = uuid4()
+
+        response = APIClient().post(
+            path=f"{BASE_GENRE_URL}bulk/",
+            data=[
+                {"name": "Romance", "categories": [str(movie_category.id)]},
+                {"name": "Drama", "categories": [str(missing_category_id)]},
+                {"name": "Horror"},
+            ],
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert [error["index"] for error in response.data["errors"]] == [1]
+        romance_genre = genre_repository.get_by_id(id=UUID(response.data["ids"][0]))
+        assert romance_genre is not None
+        assert romance_genre.categories == [movie_category.id]
+        assert CategoryModel.objects.get(id=movie_category.id).genre_count == 1
+        assert [
+            genre["name"]
+            for genre in APIClient().get(BASE_GENRE_URL).data["data"]
+        ] == ["Horror", "Romance"]
+
+
+@pytest.mark.django_db
+class TestBulkDeleteAPI:
+    def test_deletes_ids_from_body(
+        self,
+        romance_genre_model_with_categories: GenreModel,
+        drama_genre_model_without_categories: GenreModel,
+        movie_category: Category,
+    ):
+        response = APIClient().delete(
+            f"{BASE_GENRE_URL}bulk/",
+            data={"ids": [str(romance_genre_model_with_categories.id)]},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {"missing_ids": []}
+        assert list(GenreModel.objects.values_list("id", flat=True)) == [
+            drama_genre_model_without_categories.id,
+        ]
+        assert list(GenreListItem.objects.values_list("id", flat=True)) == [
+            drama_genre_model_without_categories.id,
+        ]
+        assert CategoryModel.objects.get(id=movie_category.id).genre_count == 0
+
+
 @pytest.mark.django_db
 class TestUpdateAPI:
     def test_update_genre_invalid_payload_error(
@@ -379,6 +792,85 @@ class TestUpdateAPI:
         assert updated_genre.is_active == post_data["is_active"]
         assert updated_genre.categories == [serie_category.id]
 
+    def test_update_non_existing_genre_creates_it(
+        self,
+        genre_repository: DjangoORMGenreRepository,
+        category_repository: DjangoORMCategoryRepository,
+    ):
+        serie_category = Category(name="Serie")
+        category_repository.save(category=serie_category)
+
+        genre_id = uuid4()
+        post_data = {
+            "name": "Drama",
+            "is_active": True,
+            "categories": [str(serie_category.id)],
+        }
+
+        url = BASE_GENRE_URL + f"{str(genre_id)}/"
+        response = APIClient().put(url, data=post_data)
+        repeated_response = APIClient().put(url, data=post_data)
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert repeated_response.status_code == status.HTTP_204_NO_CONTENT
+
+        created_genre = genre_repository.get_by_id(id=genre_id)
+
+        assert created_genre is not None
+        assert created_genre.name == "Drama"
+        assert created_genre.categories == [serie_category.id]
+        assert CategoryModel.objects.get(id=serie_category.id).genre_count == 1
+        assert GenreListItem.objects.get(id=genre_id).categories == [
+            str(serie_category.id),
+        ]
+
+    def test_update_with_if_match_rejects_stale_version(
+        self,
+        drama_genre_model_without_categories: GenreModel,
+        genre_repository: DjangoORMGenreRepository,
+    ):
+        url = BASE_GENRE_URL + f"{str(drama_genre_model_without_categories.id)}/"
+        retrieve_response = APIClient().get(url)
+        etag = retrieve_response["ETag"]
+
+        patch_response = APIClient().patch(
+            url,
+            data={"name": "New Drama"},
+            HTTP_IF_MATCH=etag,
+        )
+        put_response = APIClient().put(
+            url,
+            data={"name": "Old Drama", "is_active": True, "categories": []},
+            HTTP_IF_MATCH=etag,
+        )
+
+        assert etag == '"1"'
+        assert patch_response.status_code == status.HTTP_204_NO_CONTENT
+        assert patch_response["ETag"] == '"2"'
+        assert put_response.status_code == status.HTTP_409_CONFLICT
+
+        updated_genre = genre_repository.get_by_id(
+            id=drama_genre_model_without_categories.id,
+        )
+        assert updated_genre is not None
+        assert updated_genre.name == "New Drama"
+        assert updated_genre.version == 2
+
+    def test_partial_update_name_only_writes_changed_fields(
+        self,
+        romance_genre_model_with_categories: GenreModel,
+        django_assert_num_queries,
+    ):
+        url = BASE_GENRE_URL + f"{str(romance_genre_model_with_categories.id)}/"
+
+        with django_assert_num_queries(6):
+            response = APIClient().patch(url, data={"name": "New Romance"})
+
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        assert GenreListItem.objects.get(
+            id=romance_genre_model_with_categories.id,
+        ).name == "New Romance"
+
 
 @pytest.mark.django_db
 class TestDeleteGenre:
@@ -1,37 +1,186 @@
+from typing import Any
+from uuid import UUID
+
 from django.http import QueryDict
 from rest_framework import status, viewsets
+from rest_framework.decorators import action
 from rest_framework.request import Request
 from rest_framework.response import Response
 
+from src.core.category.application.list_categories_by_genre import (
+    ListCategoriesByGenre,
+)
+from src.core.genre.application.bulk_create_genres import BulkCreateGenres
+from src.core.genre.application.bulk_delete_genres import BulkDeleteGenres
 from src.core.genre.application.create_genre import CreateGenre
 from src.core.genre.application.delete_genre import DeleteGenre
 from src.core.genre.application.errors import (
     GenreNotFound,
+    GenreVersionConflict,
+    InvalidCategoriesLimitRequested,
     InvalidGenreData,
     RelatedCategoriesNotFound,
 )
+from src.core.genre.application.expand_categories import (
+    EXPANDABLE_GENRE_FIELDS,
+    get_category_summaries,
+)
+from src.core.genre.application.get_genre import GetGenre
 from src.core.genre.application.list_genres import ListGenres
 from src.core.genre.application.update_genre import UpdateGenre
+from src.core.genre.application.upsert_genre import UpsertGenre
+from src.core.shared.application.bulk import BulkCreateOutput, BulkDeleteOutput
+from src.core.shared.application.errors import (
+    InvalidExpandRequested,
+    InvalidFieldsRequested,
+)
+from src.core.shared.application.expand import get_validated_expand, parse_expand
+from src.core.shared.application.fields import parse_fields
 from src.django_project.category_app.repository import DjangoORMCategoryRepository
+from src.django_project.category_app.serializers import (
+    ListCategoryResponseSerializer,
+)
+from src.django_project.genre_app.models import Genre as GenreModel
+from src.django_project.genre_app.query_gateway import DjangoORMGenreQueryGateway
 from src.django_project.genre_app.repository import DjangoORMGenreRepository
 from src.django_project.genre_app.serializers import (
     CreateGenreRequestSerializer,
     CreateGenreResponseSerializer,
     DeleteGenreRequestSerializer,
     ListGenreResponseSerializers,
+    RetrieveGenreRequestSerializer,
+    RetrieveGenreResponseSerializer,
     UpdateGenreRequestSerializer,
     UpdateGenreResponseSerializer,
 )
+from src.django_project.shared.repository.unit_of_work import DjangoUnitOfWork
 from src.django_project.shared.views import mixins
 
 
-class GenreViewSet(viewsets.ViewSet, mixins.OrderedPaginatedListMixin):
-    repository_class = DjangoORMGenreRepository
+def get_genre_serializer_context(
+    fields: str | None,
+    expand: str | None,
+    genres: list[Any],
+) -> dict[str, Any]:
+    context: dict[str, Any] = {"fields": parse_fields(fields)}
+
+    if "categories" in parse_expand(expand):
+        context["category_summaries"] = get_category_summaries(
+            category_repository=DjangoORMCategoryRepository(),
+            genres=genres,
+        )
+
+    return context
+
+
+class GenreViewSet(
+    viewsets.ViewSet,
+    mixins.OrderedPaginatedListMixin,
+    mixins.BulkMixin,
+    mixins.IdempotentCreateMixin,
+    mixins.ConditionalUpdateMixin,
+):
+    repository_class = DjangoORMGenreQueryGateway
 
     list_use_case_class = ListGenres
     serializer_class = ListGenreResponseSerializers
 
-    def create(self, request: Request) -> Response:
+    list_cache_model = GenreModel
+
+    expandable_fields = EXPANDABLE_GENRE_FIELDS
+    list_input_errors = (*mixins.LIST_INPUT_ERRORS, InvalidCategoriesLimitRequested)
+
+    categories_limit_query_param = "categories_limit"
+
+    bulk_item_serializer_class = CreateGenreRequestSerializer
+
+    def execute_bulk_create(self, items: list[dict[str, Any]]) -> BulkCreateOutput:
+        input = BulkCreateGenres.Input(
+            items=[CreateGenre.Input(**item) for item in items],
+        )
+        use_case = BulkCreateGenres(
+            category_repository=DjangoORMCategoryRepository(),
+            unit_of_work=DjangoUnitOfWork(),
+        )
+        return use_case.execute(input=input)
+
+    def execute_bulk_delete(self, ids: list[UUID]) -> BulkDeleteOutput:
+        input = BulkDeleteGenres.Input(ids=ids)
+        use_case = BulkDeleteGenres(repository=DjangoORMGenreRepository())
+        return use_case.execute(input=input)
+
+    def get_categories_limit(self, request: Request) -> Any:
+        return request.query_params.get(self.categories_limit_query_param, None)
+
+    def get_input_params_dict(self, request: Request) -> dict[str, Any]:
+        input_params = super().get_input_params_dict(request=request)
+
+        categories_limit = self.get_categories_limit(request=request)
+        if categories_limit is not None:
+            input_params["categories_limit"] = categories_limit
+
+        return input_params
+
+    def get_list_serializer_context(
+        self,
+        input_params: dict[str, Any],
+        output: Any,
+    ) -> dict[str, Any]:
+        return get_genre_serializer_context(
+            fields=input_params.get("fields"),
+            expand=input_params.get("expand"),
+            genres=output.data,
+        )
+
+    def retrieve(self, request: Request, pk=None) -> Response:
+        serializer_input = RetrieveGenreRequestSerializer(data={"id": pk})
+        serializer_input.is_valid(raise_exception=True)
+
+        expand = self.get_expand(request=request)
+
+        try:
+            get_validated_expand(expand=expand, valid_expand=self.expandable_fields)
+        except InvalidExpandRequested as exc:
+            return Response(
+                status=status.HTTP_400_BAD_REQUEST,
+                data={"error": str(exc)},
+            )
+
+        fields = request.query_params.get(self.fields_query_param, None)
+
+        input = GetGenre.Input(
+            **serializer_input.validated_data,
+            categories_limit=self.get_categories_limit(request=request),
+            fields=fields,
+        )
+        use_case = GetGenre(repository=DjangoORMGenreRepository())
+
+        try:
+            output = use_case.execute(input=input)
+        except GenreNotFound:
+            return Response(status=status.HTTP_404_NOT_FOUND)
+        except (InvalidCategoriesLimitRequested, InvalidFieldsRequested) as exc:
+            return Response(
+                status=status.HTTP_400_BAD_REQUEST,
+                data={"error": str(exc)},
+            )
+
+        serialized_output = RetrieveGenreResponseSerializer(
+            instance=output,
+            context=get_genre_serializer_context(
+                fields=fields,
+                expand=expand,
+                genres=[output],
+            ),
+        )
+
+        return Response(
+            status=status.HTTP_200_OK,
+            data=serialized_output.data,
+            headers=self.get_etag_headers(getattr(output, "version", None)),
+        )
+
+    def execute_create(self, request: Request) -> Response:
         serializer_input = CreateGenreRequestSerializer(data=request.data)
         serializer_input.is_valid(raise_exception=True)
 
@@ -72,27 +221,36 @@ class GenreViewSet(viewsets.ViewSet, mixins.OrderedPaginatedListMixin):
         )
         serializer_input.is_valid(raise_exception=True)
 
-        input = UpdateGenre.Input(**serializer_input.validated_data)
-        use_case = UpdateGenre(
+        input = UpsertGenre.Input(
+            **serializer_input.validated_data,
+            version=self.get_if_match_version(request),
+        )
+        use_case = UpsertGenre(
             repository=DjangoORMGenreRepository(),
             category_repository=DjangoORMCategoryRepository(),
+            unit_of_work=DjangoUnitOfWork(),
         )
 
         try:
             output = use_case.execute(input=input)
-        except GenreNotFound:
-            return Response(status=status.HTTP_404_NOT_FOUND)
         except (InvalidGenreData, RelatedCategoriesNotFound) as exc:
             return Response(
                 status=status.HTTP_400_BAD_REQUEST,
                 data={"error": str(exc)},
             )
+        except GenreVersionConflict:
+            return Response(status=status.HTTP_409_CONFLICT)
 
         serialized_output = UpdateGenreResponseSerializer(instance=output)
 
         return Response(
-            status=status.HTTP_204_NO_CONTENT,
+            status=(
+                status.HTTP_201_CREATED
+                if output.created
+                else status.HTTP_204_NO_CONTENT
+            ),
             data=serialized_output.data,
+            headers=self.get_etag_headers(output.version),
         )
 
     def partial_update(self, request: Request, pk=None) -> Response:
@@ -112,7 +270,10 @@ class GenreViewSet(viewsets.ViewSet, mixins.OrderedPaginatedListMixin):
         )
         serializer_input.is_valid(raise_exception=True)
 
-        input = UpdateGenre.Input(**serializer_input.validated_data)
+        input = UpdateGenre.Input(
+            **serializer_input.validated_data,
+            version=self.get_if_match_version(request),
+        )
         use_case = UpdateGenre(
             repository=DjangoORMGenreRepository(),
             category_repository=DjangoORMCategoryRepository(),
@@ -127,12 +288,15 @@ class GenreViewSet(viewsets.ViewSet, mixins.OrderedPaginatedListMixin):
                 status=status.HTTP_400_BAD_REQUEST,
                 data={"error": str(exc)},
             )
+        except GenreVersionConflict:
+            return Response(status=status.HTTP_409_CONFLICT)
 
         serialized_output = UpdateGenreResponseSerializer(instance=output)
 
         return Response(
             status=status.HTTP_204_NO_CONTENT,
             data=serialized_output.data,
+            headers=self.get_etag_headers(output.version),
         )
 
     def destroy(self, request: Request, pk=None) -> Response:
@@ -148,3 +312,39 @@ class GenreViewSet(viewsets.ViewSet, mixins.OrderedPaginatedListMixin):
             return Response(status=status.HTTP_404_NOT_FOUND)
 
         return Response(status=status.HTTP_204_NO_CONTENT)
+
+    @action(detail=True, methods=["get"])
+    def categories(self, request: Request, pk=None) -> Response:
+        serializer_input = RetrieveGenreRequestSerializer(data={"id": pk})
+        serializer_input.is_valid(raise_exception=True)
+
+        input_params = self.get_input_params_dict(request=request)
+        input_params.pop("expand", None)
+        input_params.pop("categories_limit", None)
+
+        input = ListCategoriesByGenre.Input(**input_params)
+        use_case = ListCategoriesByGenre(
+            repository=DjangoORMCategoryRepository(),
+            genre_repository=DjangoORMGenreRepository(),
+            genre_id=serializer_input.validated_data["id"],
+        )
+
+        try:
+            output = use_case.execute(input=input)
+        except GenreNotFound:
+            return Response(status=status.HTTP_404_NOT_FOUND)
+        except mixins.LIST_INPUT_ERRORS as exc:
+            return Response(
+                status=status.HTTP_400_BAD_REQUEST,
+                data={"error": str(exc)},
+            )
+
+        serialized_output = ListCategoryResponseSerializer(
+            instance=output,
+            context={"fields": parse_fields(input_params.get("fields"))},
+        )
+
+        return Response(
+            status=status.HTTP_200_OK,
+            data=serialized_output.data,
+        )
@@ -0,0 +1,10 @@
+from django.contrib import admin
+
+from src.django_project.idempotency_app.models import IdempotencyKey
+
+
+class IdempotencyKeyAdmin(admin.ModelAdmin):
+    pass
+
+
+admin.site.register(IdempotencyKey, IdempotencyKeyAdmin)
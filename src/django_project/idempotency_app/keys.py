@@ -0,0 +1,81 @@
+import json
+from datetime import datetime, timedelta
+from hashlib import sha256
+from typing import Any
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+from django.utils import timezone
+
+from src.django_project.idempotency_app.models import IdempotencyKey
+
+PRUNE_BATCH_SIZE = 100
+
+
+def hash_request(data: Any) -> str:
+    encoded = json.dumps(data, sort_keys=True, cls=DjangoJSONEncoder)
+    return sha256(encoded.encode()).hexdigest()
+
+
+def claim_idempotency_key(
+    scope: str,
+    key: str,
+    request_hash: str,
+    ttl: int,
+    lock_timeout: int,
+) -> tuple[IdempotencyKey, bool]:
+    """Return the stored key and whether this call created it.
+
+    An in-progress claim older than ``lock_timeout`` seconds is treated as
+    abandoned and claimed again.
+    """
+    now = timezone.now()
+    prune_idempotency_keys(now=now)
+    IdempotencyKey.objects.filter(
+        Q(expires_at__lte=now)
+        | Q(
+            status_code__isnull=True,
+            claimed_at__lte=now - timedelta(seconds=lock_timeout),
+        ),
+        scope=scope,
+        key=key,
+    ).delete()
+
+    return IdempotencyKey.objects.get_or_create(
+        scope=scope,
+        key=key,
+        defaults={
+            "request_hash": request_hash,
+            "claimed_at": now,
+            "expires_at": now + timedelta(seconds=ttl),
+        },
+    )
+
+
+def complete_idempotency_key(
+    idempotency_key: IdempotencyKey,
+    status_code: int,
+    response: Any,
+) -> None:
+    # A no-op when the claim went stale and was reclaimed meanwhile.
+    IdempotencyKey.objects.filter(pk=idempotency_key.pk).update(
+        status_code=status_code,
+        response=response,
+    )
+
+
+def release_idempotency_key(idempotency_key: IdempotencyKey) -> None:
+    IdempotencyKey.objects.filter(pk=idempotency_key.pk).delete()
+
+
+def prune_idempotency_keys(now: datetime | None = None) -> int:
+    expired_ids = list(
+        IdempotencyKey.objects
+        .filter(expires_at__lte=now or timezone.now())
+        .values_list("pk", flat=True)[:PRUNE_BATCH_SIZE]
+    )
+    if not expired_ids:
+        return 0
+
+    deleted, _ = IdempotencyKey.objects.filter(pk__in=expired_ids).delete()
+    return deleted
@@ -0,0 +1,32 @@
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from django.utils import timezone
+
+IDEMPOTENCY_KEY_MAX_LENGTH = 255
+
+
+class IdempotencyKey(models.Model):
+    class Meta:
+        app_label = "idempotency_app"
+        db_table = "idempotency_key"
+        verbose_name_plural = "idempotency_keys"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["scope", "key"],
+                name="unique_idempotency_key_scope",
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["expires_at"], name="idempotency_key_expires_idx"),
+        ]
+
+    scope = models.CharField(max_length=255)
+    key = models.CharField(max_length=IDEMPOTENCY_KEY_MAX_LENGTH)
+    request_hash = models.CharField(max_length=64)
+    status_code = models.PositiveSmallIntegerField(null=True)
+    response = models.JSONField(encoder=DjangoJSONEncoder, null=True)
+    claimed_at = models.DateTimeField(default=timezone.now)
+    expires_at = models.DateTimeField()
+
+    def __str__(self) -> str:
+        return f"{self.scope}: {self.key}"
@@ -0,0 +1,128 @@
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+
+from src.django_project.idempotency_app.keys import (
+    claim_idempotency_key,
+    complete_idempotency_key,
+    hash_request,
+    prune_idempotency_keys,
+)
+from src.django_project.idempotency_app.models import IdempotencyKey
+
+
+@pytest.mark.django_db
+class TestClaimIdempotencyKey:
+    def test_second_claim_returns_stored_key(self):
+        request_hash = hash_request({"name": "Movie"})
+        first_key, first_created = claim_idempotency_key(
+            scope="POST /api/categories/",
+            key="abc",
+            request_hash=request_hash,
+            ttl=60,
+            lock_timeout=30,
+        )
+        complete_idempotency_key(first_key, status_code=201, response={"id": "1"})
+
+        second_key, second_created = claim_idempotency_key(
+            scope="POST /api/categories/",
+            key="abc",
+            request_hash=request_hash,
+            ttl=60,
+            lock_timeout=30,
+        )
+
+        assert (first_created, second_created) == (True, False)
+        assert second_key.response == {"id": "1"}
+
+    def test_keys_are_scoped(self):
+        for scope in ["POST /api/categories/", "POST /api/genres/"]:
+            _, created = claim_idempotency_key(
+                scope=scope,
+                key="abc",
+                request_hash=hash_request({}),
+                ttl=60,
+                lock_timeout=30,
+            )
+            assert created is True
+
+    def test_expired_key_is_claimed_again(self):
+        IdempotencyKey.objects.create(
+            scope="POST /api/categories/",
+            key="abc",
+            request_hash=hash_request({}),
+            status_code=201,
+            response={},
+            expires_at=timezone.now() - timedelta(seconds=1),
+        )
+
+        _, created = claim_idempotency_key(
+            scope="POST /api/categories/",
+            key="abc",
+            request_hash=hash_request({}),
+            ttl=60,
+            lock_timeout=30,
+        )
+
+        assert created is True
+
+    def test_recent_in_progress_claim_is_kept(self):
+        IdempotencyKey.objects.create(
+            scope="POST /api/categories/",
+            key="abc",
+            request_hash=hash_request({}),
+            claimed_at=timezone.now() - timedelta(seconds=10),
+            expires_at=timezone.now() + timedelta(seconds=60),
+        )
+
+        _, created = claim_idempotency_key(
+            scope="POST /api/categories/",
+            key="abc",
+            request_hash=hash_request({}),
+            ttl=60,
+            lock_timeout=30,
+        )
+
+        assert created is False
+
+    def test_stale_in_progress_claim_is_claimed_again(self):
+        stale_key = IdempotencyKey.objects.create(
+            scope="POST /api/categories/",
+            key="abc",
+            request_hash=hash_request({}),
+            claimed_at=timezone.now() - timedelta(seconds=31),
+            expires_at=timezone.now() + timedelta(seconds=60),
+        )
+
+        new_key, created = claim_idempotency_key(
+            scope="POST /api/categories/",
+            key="abc",
+            request_hash=hash_request({}),
+            ttl=60,
+            lock_timeout=30,
+        )
+        complete_idempotency_key(stale_key, status_code=201, response={})
+
+        new_key.refresh_from_db()
+        assert created is True
+        assert new_key.status_code is None
+
+
+@pytest.mark.django_db
+class TestPruneIdempotencyKeys:
+    def test_deletes_only_expired_keys(self):
+        now = timezone.now()
+        for key, expires_at in [
+            ("expired", now - timedelta(seconds=1)),
+            ("live", now + timedelta(seconds=60)),
+        ]:
+            IdempotencyKey.objects.create(
+                scope="POST /api/categories/",
+                key=key,
+                request_hash=hash_request({}),
+                expires_at=expires_at,
+            )
+
+        assert prune_idempotency_keys(now=now) == 1
+        assert list(IdempotencyKey.objects.values_list("key", flat=True)) == ["live"]
@@ -0,0 +1,18 @@
+from django.contrib import admin
+
+from src.django_project.page_boundary_app.models import (
+    PageBoundary,
+    PageBoundaryGeneration,
+)
+
+
+class PageBoundaryAdmin(admin.ModelAdmin):
+    pass
+
+
+class PageBoundaryGenerationAdmin(admin.ModelAdmin):
+    pass
+
+
+admin.site.register(PageBoundary, PageBoundaryAdmin)
+admin.site.register(PageBoundaryGeneration, PageBoundaryGenerationAdmin)
@@ -0,0 +1,210 @@
+from itertools import groupby
+from operator import itemgetter
+from uuid import UUID
+
+from django.db import transaction
+from django.db.models import F, Model
+from django.db.models.query import QuerySet
+
+from src.core.shared import settings as core_settings
+from src.core.shared.application.cursor import Cursor
+from src.core.shared.application.ordering import (
+    get_cursor_value,
+    get_ordering_field_names,
+)
+from src.django_project.page_boundary_app.models import (
+    PageBoundary,
+    PageBoundaryGeneration,
+)
+from src.django_project.shared.repository.pagination import (
+    filter_after_cursor,
+    get_keyset_page,
+)
+
+
+def get_page_boundary(
+    queryset: QuerySet,
+    order_by: str | None,
+    offset: int,
+) -> tuple[Cursor | None, int]:
+    interval = core_settings.REPOSITORY["page_boundary_interval"]
+    if order_by is None or interval is None:
+        return None, 0
+
+    position = offset // interval * interval
+    if position == 0:
+        return None, 0
+
+    table = queryset.model._meta.db_table
+    boundary = get_stored_page_boundary(table, order_by, position)
+
+    generation = None
+    if boundary is None or boundary.position < position:
+        # Walking: snapshot the generation first, then re-read the boundary
+        # the walk starts from so a write in between is detected on save.
+        generation = get_page_boundary_generation(table)
+        boundary = get_stored_page_boundary(table, order_by, position)
+
+    if boundary is None:
+        cursor, current_position = None, 0
+    else:
+        cursor = Cursor(order_by=order_by, value=boundary.value, id=boundary.row_id)
+        current_position = boundary.position
+
+    field_names = ["id", *get_ordering_field_names(order_by)]
+    new_boundaries = []
+
+    while current_position < position:
+        rows = list(
+            get_keyset_page(
+                queryset=queryset.values(*field_names),
+                cursor=cursor,
+                order_by=order_by,
+                limit=interval,
+            )[interval - 1:]
+        )
+
+        if not rows:
+            break
+
+        cursor = Cursor(
+            order_by=order_by,
+            value=get_cursor_value(rows[0], order_by),
+            id=rows[0]["id"],
+        )
+        current_position += interval
+        new_boundaries.append(
+            PageBoundary(
+                table=table,
+                order_by=order_by,
+                position=current_position,
+                value=cursor.value,
+                row_id=cursor.id,
+            )
+        )
+
+    if new_boundaries and generation is not None:
+        save_page_boundaries(table, generation, new_boundaries)
+
+    return cursor, current_position
+
+
+def get_stored_page_boundary(
+    table: str,
+    order_by: str,
+    position: int,
+) -> PageBoundary | None:
+    return (
+        PageBoundary.objects
+        .filter(table=table, order_by=order_by, position__lte=position)
+        .order_by("-position")
+        .first()
+    )
+
+
+def get_page_boundary_generation(table: str) -> int:
+    generation, _ = PageBoundaryGeneration.objects.get_or_create(table=table)
+    return generation.generation
+
+
+def save_page_boundaries(
+    table: str,
+    generation: int,
+    boundaries: list[PageBoundary],
+) -> bool:
+    """Store boundaries only if no write touched the table since the walk.
+
+    The no-op update locks the generation row, so writers that bump it wait
+    for this transaction and then truncate the new boundaries themselves.
+    """
+    with transaction.atomic():
+        claimed = (
+            PageBoundaryGeneration.objects
+            .filter(table=table, generation=generation)
+            .update(generation=F("generation"))
+        )
+        if claimed:
+            PageBoundary.objects.bulk_create(boundaries, ignore_conflicts=True)
+    return bool(claimed)
+
+
+def bump_page_boundary_generation(model: type[Model]) -> bool:
+    if core_settings.REPOSITORY["page_boundary_interval"] is None:
+        return False
+
+    table = model._meta.db_table
+    updated = (
+        PageBoundaryGeneration.objects
+        .filter(table=table)
+        .update(generation=F("generation") + 1)
+    )
+
+    if not updated:
+        PageBoundaryGeneration.objects.get_or_create(table=table)
+    return True
+
+
+def clear_page_boundaries(model: type[Model], field_name: str) -> None:
+    if not bump_page_boundary_generation(model):
+        return
+
+    boundaries = PageBoundary.objects.filter(table=model._meta.db_table)
+
+    order_bys = [
+        order_by
+        for order_by in boundaries.values_list("order_by", flat=True).distinct()
+        if field_name in get_ordering_field_names(order_by)
+    ]
+
+    if order_bys:
+        boundaries.filter(order_by__in=order_bys).delete()
+
+
+def truncate_page_boundaries(model: type[Model], id: UUID) -> None:
+    """Drop the boundaries at or after row ``id`` in every stored ordering.
+
+    Boundaries are sorted by key, so each ordering is binary searched by
+    checking the row against a boundary's stored key with a primary key
+    lookup, leaving the comparison to the database collation.
+    """
+    if not bump_page_boundary_generation(model):
+        return
+
+    boundaries = PageBoundary.objects.filter(table=model._meta.db_table)
+
+    stored_boundaries = list(
+        boundaries
+        .order_by("order_by", "position")
+        .values_list("order_by", "position", "value", "row_id")
+    )
+    if not stored_boundaries:
+        return
+
+    row = model._default_manager.filter(pk=id)
+    if not row.exists():
+        return
+
+    for order_by, group in groupby(stored_boundaries, key=itemgetter(0)):
+        order_by_boundaries = list(group)
+        low, high = 0, len(order_by_boundaries)
+        while low < high:
+            middle = (low + high) // 2
+            _, _, value, row_id = order_by_boundaries[middle]
+            if filter_after_cursor(
+                row,
+                Cursor(order_by=order_by, value=value, id=row_id),
+            ).exists():
+                low = middle + 1
+            else:
+                high = middle
+
+        if low < len(order_by_boundaries):
+            first_position = order_by_boundaries[low][1]
+            boundaries.filter(order_by=order_by, position__gte=first_position).delete()
+
+
+def reset_page_boundaries(model: type[Model]) -> None:
+    if not bump_page_boundary_generation(model):
+        return
+
+    PageBoundary.objects.filter(table=model._meta.db_table).delete()
@@ -0,0 +1,34 @@
+# Generated by Django 5.0.2 on 2026-10-18 12:09
+
+import django.core.serializers.json
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PageBoundary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('table', models.CharField(max_length=255)),
+                ('order_by', models.CharField(max_length=255)),
+                ('position', models.PositiveBigIntegerField()),
+                ('value', models.JSONField(encoder=django.core.serializers.json.DjangoJSONEncoder)),
+                ('row_id', models.UUIDField()),
+            ],
+            options={
+                'verbose_name_plural': 'page_boundaries',
+                'db_table': 'page_boundary',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='pageboundary',
+            constraint=models.UniqueConstraint(fields=('table', 'order_by', 'position'), name='unique_page_boundary_position'),
+        ),
+    ]
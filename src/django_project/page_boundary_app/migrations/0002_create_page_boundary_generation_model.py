@@ -0,0 +1,23 @@
+# Generated by Django 5.0.2 on 2026-10-18 13:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('page_boundary_app', '0001_create_page_boundary_model'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PageBoundaryGeneration',
+            fields=[
+                ('table', models.CharField(max_length=255, primary_key=True, serialize=False)),
+                ('generation', models.PositiveBigIntegerField(default=0)),
+            ],
+            options={
+                'db_table': 'page_boundary_generation',
+            },
+        ),
+    ]
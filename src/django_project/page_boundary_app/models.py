@@ -0,0 +1,36 @@
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+
+
+class PageBoundary(models.Model):
+    class Meta:
+        app_label = "page_boundary_app"
+        db_table = "page_boundary"
+        verbose_name_plural = "page_boundaries"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["table", "order_by", "position"],
+                name="unique_page_boundary_position",
+            ),
+        ]
+
+    table = models.CharField(max_length=255)
+    order_by = models.CharField(max_length=255)
+    position = models.PositiveBigIntegerField()
+    value = models.JSONField(encoder=DjangoJSONEncoder)
+    row_id = models.UUIDField()
+
+    def __str__(self) -> str:
+        return f"{self.table} ({self.order_by}): {self.position}"
+
+
+class PageBoundaryGeneration(models.Model):
+    class Meta:
+        app_label = "page_boundary_app"
+        db_table = "page_boundary_generation"
+
+    table = models.CharField(max_length=255, primary_key=True)
+    generation = models.PositiveBigIntegerField(default=0)
+
+    def __str__(self) -> str:
+        return f"{self.table}: {self.generation}"
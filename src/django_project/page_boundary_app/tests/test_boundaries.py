@@ -0,0 +1,264 @@
+from unittest.mock import patch
+
+import pytest
+
+from src.core.category.domain.category import Category
+from src.core.shared import settings as core_settings
+from src.django_project.category_app.models import Category as CategoryModel
+from src.django_project.category_app.repository import DjangoORMCategoryRepository
+from src.django_project.page_boundary_app.boundaries import (
+    get_page_boundary,
+    get_page_boundary_generation,
+    save_page_boundaries,
+    truncate_page_boundaries,
+)
+from src.django_project.page_boundary_app.models import PageBoundary
+
+
+@pytest.fixture(autouse=True)
+def page_boundary_interval():
+    with patch.dict(core_settings.REPOSITORY, {"page_boundary_interval": 2}):
+        yield
+
+
+@pytest.fixture
+def category_repository() -> DjangoORMCategoryRepository:
+    repository = DjangoORMCategoryRepository()
+    for index in range(7):
+        repository.save(
+            Category(name=f"Category {index}", description="Some description"),
+        )
+    return repository
+
+
+def get_names(categories: list[Category]) -> list[str]:
+    return [category.name for category in categories]
+
+
+@pytest.mark.django_db
+class TestGetPageBoundary:
+    def test_first_interval_does_not_need_boundary(self):
+        assert get_page_boundary(
+            queryset=CategoryModel.objects.all(),
+            order_by="name",
+            offset=1,
+        ) == (None, 0)
+        assert not PageBoundary.objects.exists()
+
+    def test_disabled_without_interval(
+        self,
+        category_repository: DjangoORMCategoryRepository,
+    ):
+        with patch.dict(core_settings.REPOSITORY, {"page_boundary_interval": None}):
+            category_repository.list(order_by="name", page=3, page_size=2)
+
+        assert not PageBoundary.objects.exists()
+
+    def test_builds_boundaries_up_to_requested_offset(
+        self,
+        category_repository: DjangoORMCategoryRepository,
+    ):
+        cursor, position = get_page_boundary(
+            queryset=CategoryModel.objects.all(),
+            order_by="-name",
+            offset=5,
+        )
+
+        assert position == 4
+        assert cursor is not None
+        assert cursor.value == "Category 3"
+        assert list(
+            PageBoundary.objects
+            .filter(table="category", order_by="-name")
+            .order_by("position")
+            .values_list("position", "value")
+        ) == [(2, "Category 5"), (4, "Category 3")]
+
+    @pytest.mark.parametrize("order_by", ["name", "-name", "description,-name"])
+    def test_list_pages_match_offset_pages(
+        self,
+        order_by: str,
+        category_repository: DjangoORMCategoryRepository,
+    ):
+        expected_names = sorted(
+            (f"Category {index}" for index in range(7)),
+            reverse="-name" in order_by,
+        )
+
+        for page in (4, 2, 3, 1):
+            categories = category_repository.list(
+                order_by=order_by,
+                page=page,
+                page_size=2,
+            )
+            assert get_names(categories) == expected_names[(page - 1) * 2:page * 2]
+
+    def test_deep_page_seeks_from_stored_boundary(
+        self,
+        category_repository: DjangoORMCategoryRepository,
+        django_assert_num_queries,
+    ):
+        category_repository.list(order_by="name", page=4, page_size=2)
+
+        with django_assert_num_queries(2) as context:
+            categories = category_repository.list(order_by="name", page=4, page_size=2)
+
+        assert get_names(categories) == ["Category 6"]
+        assert "OFFSET" not in context.captured_queries[-1]["sql"]
+
+    def test_write_during_walk_discards_new_boundaries(
+        self,
+        category_repository: DjangoORMCategoryRepository,
+    ):
+        generation = get_page_boundary_generation("category")
+        category_repository.save(
+            Category(name="Category 2a", description="Some description"),
+        )
+
+        saved = save_page_boundaries(
+            "category",
+            generation,
+            [
+                PageBoundary(
+                    table="category",
+                    order_by="name",
+                    position=2,
+                    value="Category 1",
+                    row_id=CategoryModel.objects.get(name="Category 1").id,
+                ),
+            ],
+        )
+
+        assert saved is False
+        assert not PageBoundary.objects.exists()
+
+
+@pytest.mark.django_db
+class TestTruncatePageBoundaries:
+    def test_insert_truncates_boundaries_after_new_row(
+        self,
+        category_repository: DjangoORMCategoryRepository,
+    ):
+        category_repository.list(order_by="name", page=4, page_size=2)
+
+        category_repository.save(
+            Category(name="Category 2a", description="Some description"),
+        )
+
+        assert list(
+            PageBoundary.objects.values_list("position", flat=True)
+        ) == [2]
+        assert get_names(
+            category_repository.list(order_by="name", page=3, page_size=2)
+        ) == ["Category 3", "Category 4"]
+
+    def test_update_truncates_from_old_and_new_positions(
+        self,
+        category_repository: DjangoORMCategoryRepository,
+    ):
+        category_repository.list(order_by="name", page=4, page_size=2)
+        category = CategoryModel.objects.get(name="Category 0")
+
+        category_repository.update(
+            Category(
+                id=category.id,
+                name="Category 9",
+                description=category.description,
+            ),
+        )
+
+        assert not PageBoundary.objects.exists()
+        assert get_names(
+            category_repository.list(order_by="name", page=4, page_size=2)
+        ) == ["Category 9"]
+
+    def test_delete_truncates_boundaries_from_deleted_row(
+        self,
+        category_repository: DjangoORMCategoryRepository,
+    ):
+        category_repository.list(order_by="name", page=4, page_size=2)
+        category = CategoryModel.objects.get(name="Category 5")
+
+        category_repository.delete(category.id)
+
+        assert list(
+            PageBoundary.objects.values_list("position", flat=True)
+        ) == [2, 4]
+        assert get_names(
+            category_repository.list(order_by="name", page=3, page_size=2)
+        ) == ["Category 4", "Category 6"]
+
+    def test_single_row_update_many_truncates_from_row(
+        self,
+        category_repository: DjangoORMCategoryRepository,
+    ):
+        category_repository.list(order_by="name", page=4, page_size=2)
+        category = category_repository.get_by_id(
+            CategoryModel.objects.get(name="Category 4").id,
+        )
+        assert category is not None
+        category.update_category(
+            name="Category 4a",
+            description=category.description,
+        )
+
+        assert category_repository.update_many([category]) == set()
+
+        assert list(
+            PageBoundary.objects.values_list("position", flat=True)
+        ) == [2, 4]
+
+    def test_single_row_delete_many_truncates_from_row(
+        self,
+        category_repository: DjangoORMCategoryRepository,
+    ):
+        category_repository.list(order_by="name", page=4, page_size=2)
+        category = CategoryModel.objects.get(name="Category 5")
+
+        assert category_repository.delete_many({category.id}) == set()
+
+        assert list(
+            PageBoundary.objects.values_list("position", flat=True)
+        ) == [2, 4]
+
+    def test_compares_row_against_stored_boundary_keys(
+        self,
+        category_repository: DjangoORMCategoryRepository,
+        django_assert_max_num_queries,
+    ):
+        category_repository.list(order_by="name", page=4, page_size=2)
+        category_repository.list(order_by="-name", page=4, page_size=2)
+        category = CategoryModel.objects.get(name="Category 4")
+
+        with django_assert_max_num_queries(10) as context:
+            truncate_page_boundaries(CategoryModel, category.id)
+
+        assert list(
+            PageBoundary.objects
+            .order_by("order_by", "position")
+            .values_list("order_by", "position")
+        ) == [("-name", 2), ("name", 2), ("name", 4)]
+        assert not any(
+            "IN (SELECT" in query["sql"] for query in context.captured_queries
+        )
+
+    def test_does_nothing_without_boundaries(
+        self,
+        category_repository: DjangoORMCategoryRepository,
+        django_assert_num_queries,
+    ):
+        category = CategoryModel.objects.first()
+
+        with django_assert_num_queries(2):
+            truncate_page_boundaries(CategoryModel, category.id)
+
+    def test_does_not_query_when_disabled(
+        self,
+        category_repository: DjangoORMCategoryRepository,
+        django_assert_num_queries,
+    ):
+        category = CategoryModel.objects.first()
+
+        with patch.dict(core_settings.REPOSITORY, {"page_boundary_interval": None}):
+            with django_assert_num_queries(0):
+                truncate_page_boundaries(CategoryModel, category.id)
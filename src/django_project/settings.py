@@ -44,6 +44,9 @@ INSTALLED_APPS = [
     'src.django_project.category_app',
     'src.django_project.genre_app',
     'src.django_project.cast_member_app',
+    'src.django_project.counter_app',
+    'src.django_project.page_boundary_app',
+    'src.django_project.idempotency_app',
 ]
 
 MIDDLEWARE = [
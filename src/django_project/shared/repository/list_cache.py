@@ -0,0 +1,71 @@
+from functools import partial
+from hashlib import md5
+from typing import Any
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Model
+
+LIST_CACHE_KEY_PREFIX = "list"
+
+
+def get_list_cache_version(model: type[Model]) -> int:
+    return cache.get(_get_version_key(model._meta.db_table), 0)
+
+
+def get_cached_list(
+    model: type[Model],
+    version: int,
+    params: dict[str, Any],
+) -> Any | None:
+    return cache.get(_get_list_key(model._meta.db_table, version, params))
+
+
+def set_cached_list(
+    model: type[Model],
+    version: int,
+    params: dict[str, Any],
+    data: Any,
+    timeout: int,
+) -> None:
+    cache.set(
+        _get_list_key(model._meta.db_table, version, params),
+        data,
+        timeout=timeout,
+    )
+
+
+def invalidate_list_cache(model: type[Model]) -> None:
+    tables = {
+        model._meta.db_table,
+        *(
+            related_object.related_model._meta.db_table
+            for related_object in model._meta.related_objects
+        ),
+    }
+
+    for table in tables:
+        version_key = _get_version_key(table)
+        try:
+            cache.incr(version_key)
+        except ValueError:
+            cache.set(version_key, 1, timeout=None)
+
+
+def invalidate_list_cache_on_commit(model: type[Model]) -> None:
+    transaction.on_commit(partial(invalidate_list_cache, model))
+
+
+def _get_version_key(table: str) -> str:
+    return f"{LIST_CACHE_KEY_PREFIX}:{table}:version"
+
+
+def _get_list_key(table: str, version: int, params: dict[str, Any]) -> str:
+    query = "&".join(
+        f"{name}={params[name]}"
+        for name in sorted(params)
+    )
+    return (
+        f"{LIST_CACHE_KEY_PREFIX}:{table}:{version}:"
+        f"{md5(query.encode()).hexdigest()}"
+    )
@@ -1,21 +1,53 @@
 from abc import ABC, abstractmethod
-from typing import Generic, Protocol, TypeVar
+from typing import Any, Generic, Protocol, TypeVar
 
 from django.db.models import Model
 
+from src.core.shared.application.count import TotalMode
+from src.core.shared.application.cursor import Cursor
+
 ENTITY = TypeVar("ENTITY")
 DJANGO_MODEL = TypeVar("DJANGO_MODEL", bound=Model)
 
 
 class ListableRepository(Protocol, Generic[ENTITY]):
+    def list_after(
+        self,
+        cursor: Cursor | None,
+        order_by: str,
+        limit: int,
+    ) -> list[ENTITY]:
+        ...
+
+    def list_values_after(
+        self,
+        fields: list[str],
+        cursor: Cursor | None,
+        order_by: str,
+        limit: int,
+    ) -> list[dict[str, Any]]:
+        ...
+
+    def list_values(
+        self,
+        fields: list[str],
+        order_by: str | None,
+        page: int,
+        page_size: int | None = None,
+        with_total: bool = False,
+    ) -> list[dict[str, Any]]:
+        ...
+
     def list(
         self,
         order_by: str | None,
         page: int,
+        page_size: int | None = None,
+        with_total: bool = False,
     ) -> list[ENTITY]:
         ...
 
-    def count(self) -> int:
+    def count(self, mode: TotalMode = TotalMode.EXACT) -> int:
         ...
 
 
@@ -0,0 +1,100 @@
+from functools import reduce
+from operator import or_
+from typing import Any
+
+from django.db.models import Func, IntegerField, Q, Subquery
+from django.db.models.query import QuerySet
+
+from src.core.shared.application.cursor import Cursor
+from src.core.shared.application.errors import InvalidPageRequested
+from src.core.shared.application.ordering import (
+    get_cursor_values,
+    get_field_name,
+    get_ordering,
+    is_descending,
+)
+
+
+def filter_after_cursor(
+    queryset: QuerySet,
+    cursor: Cursor,
+    inclusive: bool = False,
+) -> QuerySet:
+    field_names = [get_field_name(key) for key in get_ordering(cursor.order_by)]
+    descending = [is_descending(key) for key in get_ordering(cursor.order_by)]
+    values = get_cursor_values(cursor, cursor.order_by)
+
+    conditions = []
+    for index, field_name in enumerate(field_names):
+        lookup = "lt" if descending[index] else "gt"
+        conditions.append(
+            Q(
+                **dict(zip(field_names[:index], values[:index])),
+                **{f"{field_name}__{lookup}": values[index]},
+            )
+        )
+
+    if inclusive:
+        conditions.append(Q(**dict(zip(field_names, values))))
+
+    return queryset.filter(reduce(or_, conditions))
+
+
+def get_keyset_page(
+    queryset: QuerySet,
+    cursor: Cursor | None,
+    order_by: str,
+    limit: int,
+) -> QuerySet:
+    queryset = queryset.order_by(*get_ordering(order_by))
+
+    if cursor is not None:
+        queryset = filter_after_cursor(
+            queryset,
+            Cursor(order_by=order_by, value=cursor.value, id=cursor.id),
+        )
+
+    return queryset[:limit]
+
+
+def annotate_total_count(queryset: QuerySet) -> QuerySet:
+    total_count = (
+        queryset
+        .order_by()
+        .annotate(total_count=Func(template="COUNT(*)", output_field=IntegerField()))
+        .values("total_count")
+    )
+    return queryset.annotate(total_count=Subquery(total_count))
+
+
+def get_offset_page(
+    queryset: QuerySet,
+    page: int,
+    page_size: int,
+    with_total: bool = False,
+    start: Cursor | None = None,
+    start_position: int = 0,
+) -> tuple[list[Any], int | None]:
+    if with_total:
+        queryset = annotate_total_count(queryset)
+
+    if start is not None:
+        queryset = filter_after_cursor(queryset, start)
+
+    page_offset = (page - 1) * page_size - start_position
+    rows = list(queryset[page_offset:page_offset + page_size])
+
+    if page > 1 and not rows:
+        raise InvalidPageRequested(page=page)
+
+    if not with_total:
+        return rows, None
+
+    total = 0
+    for row in rows:
+        if isinstance(row, dict):
+            total = row.pop("total_count")
+        else:
+            total = row.total_count
+
+    return rows, total
@@ -0,0 +1,36 @@
+from collections.abc import Mapping
+from contextlib import AbstractContextManager
+from typing import Any
+
+from django.db import transaction
+
+from src.core.cast_member.domain.cast_member import CastMember
+from src.core.category.domain.category import Category
+from src.core.genre.domain.genre import Genre
+from src.core.shared.application.unit_of_work import (
+    AbstractUnitOfWork,
+    BatchRepository,
+)
+from src.core.shared.domain.entity import Entity
+from src.django_project.cast_member_app.repository import (
+    DjangoORMCastMemberRepository,
+)
+from src.django_project.category_app.repository import DjangoORMCategoryRepository
+from src.django_project.genre_app.repository import DjangoORMGenreRepository
+
+
+class DjangoUnitOfWork(AbstractUnitOfWork):
+    def __init__(
+        self,
+        repositories: Mapping[type[Entity], BatchRepository] | None = None,
+    ):
+        if repositories is None:
+            repositories = {
+                Category: DjangoORMCategoryRepository(),
+                Genre: DjangoORMGenreRepository(),
+                CastMember: DjangoORMCastMemberRepository(),
+            }
+        super().__init__(repositories=repositories)
+
+    def _atomic(self) -> AbstractContextManager[Any]:
+        return transaction.atomic()
@@ -0,0 +1,79 @@
+from collections.abc import Callable, Sequence
+from typing import Any
+from uuid import UUID
+
+from django.db import connection
+from django.db.models import Model
+
+from src.core.shared import settings as core_settings
+from src.core.shared.domain.entity import Entity
+
+
+def upsert_versioned_rows(
+    model: type[Model],
+    instances: list[Model],
+    update_fields: list[str],
+) -> dict[Any, int]:
+    """Insert or update rows by primary key and return their stored versions.
+
+    ``version`` is bumped by the statement itself, so concurrent upserts of
+    one row each see a distinct version and new rows come back with 1.
+    """
+    meta = model._meta
+    quote_name = connection.ops.quote_name
+    fields = meta.concrete_fields
+    table = quote_name(meta.db_table)
+    pk_column = quote_name(meta.pk.column)
+    version_column = quote_name(meta.get_field("version").column)
+    assignments = ", ".join(
+        [
+            f"{quote_name(column)} = EXCLUDED.{quote_name(column)}"
+            for column in (meta.get_field(field).column for field in update_fields)
+        ]
+        + [f"{version_column} = {table}.{version_column} + 1"]
+    )
+    columns = ", ".join(quote_name(field.column) for field in fields)
+    row_placeholder = f"({', '.join(['%s'] * len(fields))})"
+    batch_size = min(
+        core_settings.REPOSITORY["bulk_create_batch_size"],
+        connection.ops.bulk_batch_size(fields, instances) or len(instances),
+    )
+
+    versions: dict[Any, int] = {}
+    with connection.cursor() as cursor:
+        for start in range(0, len(instances), batch_size):
+            batch = instances[start:start + batch_size]
+            for instance in batch:
+                setattr(instance, "version", 1)
+            cursor.execute(
+                f"INSERT INTO {table} ({columns})"
+                f" VALUES {', '.join([row_placeholder] * len(batch))}"
+                f" ON CONFLICT ({pk_column}) DO UPDATE SET {assignments}"
+                f" RETURNING {pk_column}, {version_column}",
+                [
+                    field.get_db_prep_save(getattr(instance, field.attname), connection)
+                    for instance in batch
+                    for field in fields
+                ],
+            )
+            for pk, version in cursor.fetchall():
+                versions[meta.pk.to_python(pk)] = version
+
+    return versions
+
+
+def upsert_versioned_entities(
+    model: type[Model],
+    entities: Sequence[Entity],
+    to_model: Callable[[Any], Model],
+    update_fields: list[str],
+) -> set[UUID]:
+    """Upsert entities, store their new versions and return the created ids."""
+    versions = upsert_versioned_rows(
+        model,
+        [to_model(entity) for entity in entities],
+        update_fields=update_fields,
+    )
+    for entity in entities:
+        entity.version = versions[entity.id]
+    return {id for id, version in versions.items() if version == 1}
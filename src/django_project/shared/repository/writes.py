@@ -0,0 +1,110 @@
+from collections.abc import Callable, Sequence
+from uuid import UUID
+
+from django.db import transaction
+from django.db.models import F, Model
+
+from src.core.shared import settings as core_settings
+from src.core.shared.domain.entity import Entity
+from src.django_project.counter_app.counters import increment_row_count
+from src.django_project.page_boundary_app.boundaries import (
+    reset_page_boundaries,
+    truncate_page_boundaries,
+)
+from src.django_project.shared.repository.list_cache import (
+    invalidate_list_cache_on_commit,
+)
+
+
+def start_rows_write(model: type[Model], ids: Sequence[UUID]) -> None:
+    """Truncate page boundaries from a single row's position before it moves."""
+    if len(ids) == 1:
+        truncate_page_boundaries(model, ids[0])
+
+
+def finish_rows_write(
+    model: type[Model],
+    ids: Sequence[UUID],
+    row_delta: int = 0,
+) -> None:
+    """Bring the row counter, page boundaries and list cache up to date.
+
+    A single row truncates the boundaries from its new position, batches
+    reset them.
+    """
+    if row_delta:
+        increment_row_count(model, delta=row_delta)
+    if len(ids) == 1:
+        truncate_page_boundaries(model, ids[0])
+    else:
+        reset_page_boundaries(model)
+    invalidate_list_cache_on_commit(model)
+
+
+def update_versioned_rows(
+    model: type[Model],
+    entities: Sequence[Entity],
+    update_fields: list[str],
+) -> set[UUID]:
+    """Write entities whose stored version still matches, bumping it.
+
+    Returns the ids whose version moved on and were left untouched.
+    """
+    conflicted_ids: set[UUID] = set()
+    for entity in entities:
+        updated = model._default_manager.filter(
+            id=entity.id,
+            version=entity.version,
+        ).update(
+            **{field: getattr(entity, field) for field in update_fields},
+            version=F("version") + 1,
+        )
+        if updated:
+            entity.version += 1
+        else:
+            conflicted_ids.add(entity.id)
+    return conflicted_ids
+
+
+def delete_rows_in_chunks(
+    ids: set[UUID],
+    delete_chunk: Callable[[list[UUID]], set[UUID]],
+) -> set[UUID]:
+    """Delete ids in bounded chunks and return the ones that did not exist."""
+    chunk_size = core_settings.REPOSITORY["delete_chunk_size"]
+    pending_ids = list(ids)
+    missing_ids = set(ids)
+
+    for start in range(0, len(pending_ids), chunk_size):
+        missing_ids -= delete_chunk(pending_ids[start:start + chunk_size])
+    return missing_ids
+
+
+def delete_existing_rows(
+    model: type[Model],
+    ids: Sequence[UUID],
+    before_delete: Callable[[set[UUID]], None] | None = None,
+) -> set[UUID]:
+    """Delete the existing rows among ids in one transaction and return them."""
+    with transaction.atomic():
+        existing_ids = set(
+            model._default_manager.filter(id__in=ids).values_list("id", flat=True)
+        )
+        if not existing_ids:
+            return existing_ids
+
+        start_rows_write(model, list(existing_ids))
+        if before_delete is not None:
+            before_delete(existing_ids)
+
+        _, deleted_by_model = (
+            model._default_manager.filter(id__in=existing_ids).delete()
+        )
+        increment_row_count(
+            model,
+            delta=-deleted_by_model.get(model._meta.label, 0),
+        )
+        if len(existing_ids) > 1:
+            reset_page_boundaries(model)
+        invalidate_list_cache_on_commit(model)
+    return existing_ids
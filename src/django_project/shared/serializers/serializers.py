@@ -2,10 +2,45 @@ from rest_framework import serializers
 
 
 class ListOutputMetaSerializer(serializers.Serializer):
-    page = serializers.IntegerField()
+    page = serializers.IntegerField(allow_null=True)
     per_page = serializers.IntegerField()
-    total = serializers.IntegerField()
+    total = serializers.IntegerField(allow_null=True)
+    next_cursor = serializers.CharField(allow_null=True)
+    prev_cursor = serializers.CharField(allow_null=True)
 
 
 class PaginatedListResponseSerializer(serializers.Serializer):
     meta = ListOutputMetaSerializer(read_only=True)
+
+
+class SparseFieldsetSerializer(serializers.Serializer):
+    def get_fields(self):
+        fields = super().get_fields()
+
+        requested_fields = self.context.get("fields")
+        if requested_fields is None:
+            return fields
+
+        return {
+            name: field
+            for name, field in fields.items()
+            if name in requested_fields
+        }
+
+
+class BulkItemErrorSerializer(serializers.Serializer):
+    index = serializers.IntegerField()
+    error = serializers.JSONField()
+
+
+class BulkCreateResponseSerializer(serializers.Serializer):
+    ids = serializers.ListField(child=serializers.UUIDField())
+    errors = BulkItemErrorSerializer(many=True)
+
+
+class BulkDeleteRequestSerializer(serializers.Serializer):
+    ids = serializers.ListField(child=serializers.UUIDField(), allow_empty=False)
+
+
+class BulkDeleteResponseSerializer(serializers.Serializer):
+    missing_ids = serializers.ListField(child=serializers.UUIDField())
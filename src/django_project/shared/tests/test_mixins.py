@@ -0,0 +1,22 @@
+import pytest
+from rest_framework import viewsets
+
+from src.django_project.shared.views.mixins import BulkMixin, IdempotentCreateMixin
+
+
+class TestBulkMixin:
+    def test_viewset_without_bulk_hooks_cannot_be_instantiated(self):
+        class IncompleteViewSet(BulkMixin, viewsets.ViewSet):
+            pass
+
+        with pytest.raises(TypeError, match="execute_bulk_create"):
+            IncompleteViewSet()
+
+
+class TestIdempotentCreateMixin:
+    def test_viewset_without_execute_create_cannot_be_instantiated(self):
+        class IncompleteViewSet(IdempotentCreateMixin, viewsets.ViewSet):
+            pass
+
+        with pytest.raises(TypeError, match="execute_create"):
+            IncompleteViewSet()
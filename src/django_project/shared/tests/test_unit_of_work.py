@@ -0,0 +1,75 @@
+import pytest
+from django.db import IntegrityError, connection
+from django.test.utils import CaptureQueriesContext
+
+from src.core.cast_member.domain.cast_member import CastMember, CastMemberType
+from src.core.category.domain.category import Category
+from src.core.genre.domain.genre import Genre
+from src.django_project.cast_member_app.models import CastMember as CastMemberModel
+from src.django_project.category_app.models import Category as CategoryModel
+from src.django_project.category_app.repository import DjangoORMCategoryRepository
+from src.django_project.genre_app.models import GenreListItem
+from src.django_project.genre_app.repository import DjangoORMGenreRepository
+from src.django_project.shared.repository.unit_of_work import DjangoUnitOfWork
+
+
+@pytest.mark.django_db(transaction=True)
+class TestDjangoUnitOfWork:
+    def test_commit_flushes_one_insert_per_table(self):
+        categories = [Category(name=f"Category {index}") for index in range(3)]
+        genres = [
+            Genre(name=f"Genre {index}", categories=[category.id])
+            for index, category in enumerate(categories)
+        ]
+
+        with CaptureQueriesContext(connection) as context:
+            with DjangoUnitOfWork() as unit_of_work:
+                for genre in genres:
+                    unit_of_work.register_new(genre)
+                for category in categories:
+                    unit_of_work.register_new(category)
+
+        statements = [query["sql"] for query in context.captured_queries]
+        assert sum(
+            sql.startswith('INSERT INTO "category"') for sql in statements
+        ) == 1
+        assert sum(sql.startswith('INSERT INTO "genre"') for sql in statements) == 1
+        assert list(
+            CategoryModel.objects.order_by("name").values_list("genre_count", flat=True)
+        ) == [1, 1, 1]
+        assert GenreListItem.objects.count() == 3
+
+    def test_commit_updates_and_deletes_in_batches(self):
+        movie_category = Category(name="Movie")
+        documentary_category = Category(name="Documentary")
+        DjangoORMCategoryRepository().save_many([movie_category, documentary_category])
+        genre = Genre(name="Romance", categories=[movie_category.id])
+        DjangoORMGenreRepository().save(genre)
+
+        genre.update_name("Love")
+        genre.remove_category(movie_category.id)
+        genre.add_category(documentary_category.id)
+        movie_category.update_category(name="Film", description="")
+
+        with DjangoUnitOfWork() as unit_of_work:
+            unit_of_work.register_dirty(genre)
+            unit_of_work.register_dirty(movie_category)
+            unit_of_work.register_removed(documentary_category)
+
+        assert list(CategoryModel.objects.values_list("name", "genre_count")) == [
+            ("Film", 0),
+        ]
+        item = GenreListItem.objects.get(id=genre.id)
+        assert item.name == "Love"
+        assert item.categories == []
+
+    def test_failed_flush_rolls_back_every_write(self):
+        cast_member = CastMember(name="John", type=CastMemberType.ACTOR)
+        genre = Genre(name="Romance", categories=[Category(name="Unsaved").id])
+
+        with pytest.raises(IntegrityError):
+            with DjangoUnitOfWork() as unit_of_work:
+                unit_of_work.register_new(cast_member)
+                unit_of_work.register_new(genre)
+
+        assert not CastMemberModel.objects.exists()
@@ -1,14 +1,64 @@
+from abc import ABC, abstractmethod
 
 from typing import Any
-from rest_framework import status
+from uuid import UUID
+
+from django.db.models import Model
+from rest_framework import serializers, status
+from rest_framework.decorators import action
 from rest_framework.request import Request
 from rest_framework.response import Response
 
+from src.core.shared.application.bulk import (
+    BulkCreateOutput,
+    BulkDeleteOutput,
+    BulkItemError,
+    validate_bulk_size,
+)
+from src.core.shared.application.errors import (
+    InvalidBulkSizeRequested,
+    InvalidCursorRequested,
+    InvalidExpandRequested,
+    InvalidFieldsRequested,
+    InvalidOrderByRequested,
+    InvalidPageRequested,
+    InvalidPerPageRequested,
+)
+from src.core.shared.application.expand import get_validated_expand
+from src.core.shared.application.fields import parse_fields
 from src.core.shared.application.list import PaginatedListUseCase
+from src.django_project.idempotency_app.keys import (
+    claim_idempotency_key,
+    complete_idempotency_key,
+    hash_request,
+    release_idempotency_key,
+)
+from src.django_project.idempotency_app.models import (
+    IDEMPOTENCY_KEY_MAX_LENGTH,
+    IdempotencyKey,
+)
+from src.django_project.shared.repository.list_cache import (
+    get_cached_list,
+    get_list_cache_version,
+    set_cached_list,
+)
 from src.django_project.shared.repository.mapper import ListableRepository
 from src.django_project.shared.serializers.serializers import (
+    BulkCreateResponseSerializer,
+    BulkDeleteRequestSerializer,
+    BulkDeleteResponseSerializer,
     PaginatedListResponseSerializer,
 )
+from src.django_project.shared.views.prefetch import submit_prefetch
+
+LIST_INPUT_ERRORS = (
+    InvalidCursorRequested,
+    InvalidExpandRequested,
+    InvalidFieldsRequested,
+    InvalidOrderByRequested,
+    InvalidPageRequested,
+    InvalidPerPageRequested,
+)
 
 CLASS_ATTRIBUTE_NOT_FOUND_ERROR_MESSAGE_TEMPLATE = (
     "Cannot find '{attribute_name}'. "
@@ -20,27 +70,132 @@ CLASS_ATTRIBUTE_NOT_FOUND_ERROR_MESSAGE_TEMPLATE = (
 class OrderedPaginatedListMixin:
     order_by_query_pagam = "order_by"
     page_query_param = "page"
+    per_page_query_param = "per_page"
+    cursor_query_param = "cursor"
+    fields_query_param = "fields"
+    expand_query_param = "expand"
+
+    expandable_fields: list[str] = []
+    list_input_errors: tuple[type[Exception], ...] = LIST_INPUT_ERRORS
+
+    prefetch_next_page = False
+    prefetch_cache_timeout = 30
 
     def list(self, request: Request) -> Response:
         input_params = self.get_input_params_dict(request=request)
 
+        if self.prefetch_next_page:
+            cached_data = get_cached_list(
+                model=self.get_list_cache_model(),
+                version=get_list_cache_version(self.get_list_cache_model()),
+                params=input_params,
+            )
+            if cached_data is not None:
+                self.schedule_next_page_prefetch(
+                    input_params=input_params,
+                    page=cached_data["meta"]["page"],
+                    next_cursor=cached_data["meta"]["next_cursor"],
+                )
+                return Response(
+                    status=status.HTTP_200_OK,
+                    data=cached_data,
+                )
+
+        try:
+            output = self.get_list_output(input_params=input_params)
+        except self.list_input_errors as exc:
+            return Response(
+                status=status.HTTP_400_BAD_REQUEST,
+                data={"error": str(exc)},
+            )
+
+        if self.prefetch_next_page:
+            self.schedule_next_page_prefetch(
+                input_params=input_params,
+                page=output.meta.page,
+                next_cursor=output.meta.next_cursor,
+            )
+
+        return Response(
+            status=status.HTTP_200_OK,
+            data=self.get_list_data(input_params=input_params, output=output),
+        )
+
+    def get_list_output(self, input_params: dict[str, Any]) -> Any:
         use_case_cls = self.get_list_use_case_class()
 
-        output = (
+        get_validated_expand(
+            expand=input_params.get("expand"),
+            valid_expand=self.expandable_fields,
+        )
+        use_case_params = {
+            name: value
+            for name, value in input_params.items()
+            if name != "expand"
+        }
+
+        return (
             use_case_cls(
                 repository=self.get_repository_class()(),
             )
             .execute(
-                input=use_case_cls.Input(**input_params),
+                input=use_case_cls.Input(**use_case_params),
             )
         )
 
+    def get_list_data(self, input_params: dict[str, Any], output: Any) -> Any:
         serializer_cls = self.get_list_serializer_cls()
-        serialized_categories = serializer_cls(instance=output)
+        serialized_categories = serializer_cls(
+            instance=output,
+            context=self.get_list_serializer_context(
+                input_params=input_params,
+                output=output,
+            ),
+        )
+        return serialized_categories.data
 
-        return Response(
-            status=status.HTTP_200_OK,
-            data=serialized_categories.data,
+    def get_list_serializer_context(
+        self,
+        input_params: dict[str, Any],
+        output: Any,
+    ) -> dict[str, Any]:
+        return {"fields": parse_fields(input_params.get("fields"))}
+
+    def schedule_next_page_prefetch(
+        self,
+        input_params: dict[str, Any],
+        page: int | None,
+        next_cursor: str | None,
+    ) -> None:
+        if next_cursor is None:
+            return
+
+        next_input_params = dict(input_params)
+        if page is None:
+            next_input_params["cursor"] = next_cursor
+        else:
+            next_input_params["page"] = page + 1
+
+        submit_prefetch(self.prefetch_list_page, next_input_params)
+
+    def prefetch_list_page(self, input_params: dict[str, Any]) -> None:
+        model = self.get_list_cache_model()
+        version = get_list_cache_version(model)
+
+        if get_cached_list(model=model, version=version, params=input_params):
+            return
+
+        try:
+            output = self.get_list_output(input_params=input_params)
+        except self.list_input_errors:
+            return
+
+        set_cached_list(
+            model=model,
+            version=version,
+            params=input_params,
+            data=self.get_list_data(input_params=input_params, output=output),
+            timeout=self.prefetch_cache_timeout,
         )
 
     def get_order_by(self, request: Request) -> Any:
@@ -49,11 +204,27 @@ class OrderedPaginatedListMixin:
     def get_page_number(self, request: Request) -> Any:
         return request.query_params.get(self.page_query_param, None)
 
+    def get_per_page(self, request: Request) -> Any:
+        return request.query_params.get(self.per_page_query_param, None)
+
+    def get_cursor(self, request: Request) -> Any:
+        return request.query_params.get(self.cursor_query_param, None)
+
+    def get_fields(self, request: Request) -> Any:
+        return request.query_params.get(self.fields_query_param, None)
+
+    def get_expand(self, request: Request) -> Any:
+        return request.query_params.get(self.expand_query_param, None)
+
     def get_input_params_dict(self, request: Request) -> dict[str, Any]:
         input_params = {}
 
         order_by = self.get_order_by(request=request)
         page_number = self.get_page_number(request=request)
+        per_page = self.get_per_page(request=request)
+        cursor = self.get_cursor(request=request)
+        fields = self.get_fields(request=request)
+        expand = self.get_expand(request=request)
 
         if order_by is not None:
             input_params["order_by"] = order_by
@@ -61,6 +232,18 @@ class OrderedPaginatedListMixin:
         if page_number is not None:
             input_params["page"] = page_number
 
+        if per_page is not None:
+            input_params["per_page"] = per_page
+
+        if cursor is not None:
+            input_params["cursor"] = cursor
+
+        if fields is not None:
+            input_params["fields"] = fields
+
+        if expand is not None:
+            input_params["expand"] = expand
+
         return input_params
 
     def get_list_use_case_class(self) -> type[PaginatedListUseCase]:
@@ -94,3 +277,220 @@ class OrderedPaginatedListMixin:
             )
         )
         return serializer_class
+
+    def get_list_cache_model(self) -> type[Model]:
+        list_cache_model = getattr(self, "list_cache_model", None)
+        assert list_cache_model is not None, (
+            CLASS_ATTRIBUTE_NOT_FOUND_ERROR_MESSAGE_TEMPLATE.format(
+                attribute_name="list_cache_model",
+                class_name=self.__class__.__qualname__,
+            )
+        )
+        return list_cache_model
+
+
+class IdempotentCreateMixin(ABC):
+    idempotency_key_header = "Idempotency-Key"
+    idempotency_key_ttl = 24 * 60 * 60
+    # Seconds before an unfinished claim is treated as abandoned. A create
+    # running longer than this can be executed twice, so raise it on views
+    # whose creates are slow.
+    idempotency_key_lock_timeout = 60
+
+    def create(self, request: Request) -> Response:
+        key = request.headers.get(self.idempotency_key_header)
+        if key is None:
+            return self.execute_create(request)
+
+        if not key.strip() or len(key) > IDEMPOTENCY_KEY_MAX_LENGTH:
+            return Response(
+                status=status.HTTP_400_BAD_REQUEST,
+                data={
+                    "error": (
+                        f"{self.idempotency_key_header} must be between 1 and "
+                        f"{IDEMPOTENCY_KEY_MAX_LENGTH} characters"
+                    ),
+                },
+            )
+
+        idempotency_key, created = claim_idempotency_key(
+            scope=f"{request.method} {request.path}",
+            key=key,
+            request_hash=hash_request(request.data),
+            ttl=self.idempotency_key_ttl,
+            lock_timeout=self.idempotency_key_lock_timeout,
+        )
+
+        if not created:
+            return self.get_replayed_response(request, idempotency_key)
+
+        try:
+            response = self.execute_create(request)
+        except Exception:
+            release_idempotency_key(idempotency_key)
+            raise
+
+        if status.is_success(response.status_code):
+            complete_idempotency_key(
+                idempotency_key,
+                status_code=response.status_code,
+                response=response.data,
+            )
+        else:
+            release_idempotency_key(idempotency_key)
+
+        return response
+
+    def get_replayed_response(
+        self,
+        request: Request,
+        idempotency_key: IdempotencyKey,
+    ) -> Response:
+        if idempotency_key.request_hash != hash_request(request.data):
+            return Response(
+                status=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                data={
+                    "error": (
+                        f"{self.idempotency_key_header} was already used "
+                        "with a different request"
+                    ),
+                },
+            )
+
+        if idempotency_key.status_code is None:
+            return Response(
+                status=status.HTTP_409_CONFLICT,
+                data={
+                    "error": (
+                        f"A request with this {self.idempotency_key_header} "
+                        "is still in progress"
+                    ),
+                },
+            )
+
+        return Response(
+            status=idempotency_key.status_code,
+            data=idempotency_key.response,
+        )
+
+    @abstractmethod
+    def execute_create(self, request: Request) -> Response:
+        raise NotImplementedError
+
+
+class ConditionalUpdateMixin:
+    if_match_header = "If-Match"
+
+    def get_if_match_version(self, request: Request) -> int | None:
+        if_match = request.headers.get(self.if_match_header, "").strip()
+        if not if_match or if_match == "*":
+            return None
+
+        tag = if_match.removeprefix("W/").strip('"')
+        if not tag.isdigit():
+            raise serializers.ValidationError(
+                {self.if_match_header: f"{if_match!r} is not a valid version tag"},
+            )
+        return int(tag)
+
+    def get_etag_headers(self, version: int | None) -> dict[str, str]:
+        if version is None:
+            return {}
+
+        return {"ETag": f'"{version}"'}
+
+
+class BulkMixin(ABC):
+    ids_query_param = "ids"
+    bulk_item_serializer_class: type[serializers.Serializer] | None = None
+
+    @action(detail=False, methods=["post"])
+    def bulk(self, request: Request) -> Response:
+        if not isinstance(request.data, list):
+            return Response(
+                status=status.HTTP_400_BAD_REQUEST,
+                data={"error": "Expected a list of items"},
+            )
+
+        try:
+            validate_bulk_size(len(request.data))
+        except InvalidBulkSizeRequested as exc:
+            return Response(
+                status=status.HTTP_400_BAD_REQUEST,
+                data={"error": str(exc)},
+            )
+
+        serializer_cls = self.get_bulk_item_serializer_class()
+        items: list[dict[str, Any]] = []
+        indexes: list[int] = []
+        errors: list[BulkItemError] = []
+
+        for index, item_data in enumerate(request.data):
+            serializer_input = serializer_cls(data=item_data)
+            if serializer_input.is_valid():
+                items.append(dict(serializer_input.validated_data))
+                indexes.append(index)
+            else:
+                errors.append(BulkItemError(index=index, error=serializer_input.errors))
+
+        output = self.execute_bulk_create(items) if items else BulkCreateOutput()
+
+        errors.extend(
+            BulkItemError(index=indexes[error.index], error=error.error)
+            for error in output.errors
+        )
+        errors.sort(key=lambda error: error.index)
+
+        serialized_output = BulkCreateResponseSerializer(
+            instance=BulkCreateOutput(ids=output.ids, errors=errors),
+        )
+
+        return Response(
+            status=(
+                status.HTTP_201_CREATED
+                if output.ids
+                else status.HTTP_400_BAD_REQUEST
+            ),
+            data=serialized_output.data,
+        )
+
+    @bulk.mapping.delete
+    def bulk_destroy(self, request: Request) -> Response:
+        ids = request.query_params.get(self.ids_query_param)
+        serializer_input = BulkDeleteRequestSerializer(
+            data=request.data if ids is None else {"ids": ids.split(",")},
+        )
+        serializer_input.is_valid(raise_exception=True)
+
+        try:
+            output = self.execute_bulk_delete(serializer_input.validated_data["ids"])
+        except InvalidBulkSizeRequested as exc:
+            return Response(
+                status=status.HTTP_400_BAD_REQUEST,
+                data={"error": str(exc)},
+            )
+
+        serialized_output = BulkDeleteResponseSerializer(instance=output)
+
+        return Response(
+            status=status.HTTP_200_OK,
+            data=serialized_output.data,
+        )
+
+    @abstractmethod
+    def execute_bulk_create(self, items: list[dict[str, Any]]) -> BulkCreateOutput:
+        raise NotImplementedError
+
+    @abstractmethod
+    def execute_bulk_delete(self, ids: list[UUID]) -> BulkDeleteOutput:
+        raise NotImplementedError
+
+    def get_bulk_item_serializer_class(self) -> type[serializers.Serializer]:
+        serializer_class = getattr(self, "bulk_item_serializer_class", None)
+        assert serializer_class is not None, (
+            CLASS_ATTRIBUTE_NOT_FOUND_ERROR_MESSAGE_TEMPLATE.format(
+                attribute_name="bulk_item_serializer_class",
+                class_name=self.__class__.__qualname__,
+            )
+        )
+        return serializer_class
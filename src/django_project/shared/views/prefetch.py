@@ -0,0 +1,33 @@
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import Any, Callable
+
+from django.db import connections
+
+PREFETCH_MAX_WORKERS = 2
+
+_executor: Executor | None = None
+
+
+def get_prefetch_executor() -> Executor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=PREFETCH_MAX_WORKERS,
+            thread_name_prefix="list-prefetch",
+        )
+    return _executor
+
+
+def submit_prefetch(function: Callable[..., Any], *args: Any) -> Future:
+    return get_prefetch_executor().submit(
+        _run_and_close_connections,
+        function,
+        *args,
+    )
+
+
+def _run_and_close_connections(function: Callable[..., Any], *args: Any) -> None:
+    try:
+        function(*args)
+    finally:
+        connections.close_all()
@@ -22,6 +22,8 @@ class TestCreateAndEditDeleteCastMember:
                 "page": 1,
                 "total": 0,
                 "per_page": settings.REPOSITORY["page_size"],
+                "next_cursor": None,
+                "prev_cursor": None,
             },
         }
 
@@ -47,6 +49,8 @@ class TestCreateAndEditDeleteCastMember:
                 "page": 1,
                 "total": 1,
                 "per_page": settings.REPOSITORY["page_size"],
+                "next_cursor": None,
+                "prev_cursor": None,
             },
         }
 
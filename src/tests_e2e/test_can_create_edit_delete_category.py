@@ -20,6 +20,8 @@ class TestCreateAndEditDeleteCategory:
                 "page": 1,
                 "total": 0,
                 "per_page": settings.REPOSITORY["page_size"],
+                "next_cursor": None,
+                "prev_cursor": None,
             },
         }
 
@@ -40,12 +42,15 @@ class TestCreateAndEditDeleteCategory:
                     "name": "Movie",
                     "description": "Movie description",
                     "is_active": True,
+                    "genre_count": 0,
                 }
             ],
             "meta": {
                 "page": 1,
                 "total": 1,
                 "per_page": settings.REPOSITORY["page_size"],
+                "next_cursor": None,
+                "prev_cursor": None,
             },
         }
 
@@ -66,6 +71,7 @@ class TestCreateAndEditDeleteCategory:
                     "name": "Documentary",
                     "description": "Documentary description",
                     "is_active": True,
+                    "genre_count": 0,
                 }
             ]
         }
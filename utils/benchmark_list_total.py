@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+"""
+Compare the category list page + total paths on a throwaway SQLite database:
+
+- paginator: Paginator COUNT(*) followed by the page slice (two statements)
+- window: page slice annotated with COUNT(*) OVER () (one statement)
+- subquery: page slice annotated with (SELECT COUNT(*) ...) (one statement),
+  the path used by the Django repositories
+
+Usage: ./utils/benchmark_list_total.py --rows 10000 --rows 1000000
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from uuid import uuid4
+
+BASE_PROJECT_PATH = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BASE_PROJECT_PATH))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "src.django_project.settings")
+
+import django  # noqa: E402
+from django.conf import settings  # noqa: E402
+
+INSERT_BATCH_SIZE = 10_000
+
+
+def populate(category_model, rows: int) -> None:
+    for start in range(0, rows, INSERT_BATCH_SIZE):
+        category_model.objects.bulk_create(
+            [
+                category_model(
+                    id=uuid4(),
+                    name=f"Category {index:08d}",
+                    description="Benchmark category",
+                )
+                for index in range(start, min(start + INSERT_BATCH_SIZE, rows))
+            ]
+        )
+
+
+def run_paginator(page: int, page_size: int) -> int:
+    from django.core.paginator import Paginator
+
+    from src.django_project.category_app.models import Category as CategoryModel
+
+    paginator = Paginator(CategoryModel.objects.order_by("name"), page_size)
+    list(paginator.page(page).object_list)
+    return paginator.count
+
+
+def run_window(page: int, page_size: int) -> int:
+    from django.db.models import Count, Window
+
+    from src.django_project.category_app.models import Category as CategoryModel
+
+    page_offset = (page - 1) * page_size
+    categories = list(
+        CategoryModel.objects
+        .annotate(total_count=Window(Count("*")))
+        .order_by("name")[page_offset:page_offset + page_size]
+    )
+    return categories[0].total_count
+
+
+def run_subquery(page: int, page_size: int) -> int:
+    from src.core.shared import settings as core_settings
+    from src.django_project.category_app.repository import DjangoORMCategoryRepository
+
+    core_settings.REPOSITORY["page_size"] = page_size
+    repository = DjangoORMCategoryRepository()
+    repository.list(order_by="name", page=page, with_total=True)
+    return repository.count()
+
+
+def measure(function, page: int, page_size: int, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        function(page=page, page_size=page_size)
+        timings.append(time.perf_counter() - started_at)
+    return statistics.median(timings) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, action="append")
+    parser.add_argument("--page-size", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        settings.DATABASES["default"]["NAME"] = Path(directory) / "benchmark.sqlite3"
+        django.setup()
+
+        from django.core.management import call_command
+
+        from src.django_project.category_app.models import Category as CategoryModel
+
+        call_command("migrate", verbosity=0)
+
+        print(
+            f"{'rows':>10} {'page':>6} "
+            f"{'paginator (ms)':>15} {'window (ms)':>12} {'subquery (ms)':>14}"
+        )
+
+        populated_rows = 0
+        for rows in sorted(args.rows or [10_000]):
+            populate(CategoryModel, rows - populated_rows)
+            populated_rows = rows
+
+            for page in (1, rows // args.page_size // 2):
+                paginator_ms = measure(run_paginator, page, args.page_size, args.repeat)
+                window_ms = measure(run_window, page, args.page_size, args.repeat)
+                subquery_ms = measure(run_subquery, page, args.page_size, args.repeat)
+                print(
+                    f"{rows:>10} {page:>6} "
+                    f"{paginator_ms:>15.2f} {window_ms:>12.2f} {subquery_ms:>14.2f}"
+                )
+
+
+if __name__ == "__main__":
+    main()